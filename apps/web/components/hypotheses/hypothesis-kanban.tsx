@@ -210,7 +210,7 @@ export function HypothesisKanban({
 }: HypothesisLifecycleProps) {
   const t = useTranslations("hypotheses.kanban");
   const totalHypotheses = useMemo(
-    () => stages.reduce((acc, stage) => acc + stage.items.length, 0),
+    () => stages.reduce((acc, stage) => acc + Math.max(stage.total, stage.items.length), 0),
     [stages],
   );
 
@@ -251,6 +251,7 @@ function mapDashboard(payload: any): HypothesisDashboard {
       stageHealth: stage?.stageHealth ?? "on-track",
       conversionRate: Number(stage?.conversionRate ?? 0),
       averageDaysInStage: Number(stage?.averageDaysInStage ?? 0),
+      total: Number(stage?.total ?? stage?.items?.length ?? 0),
       items: Array.isArray(stage?.items) ? stage.items.map(mapHypothesisItem) : [],
     })),
     highlights: {
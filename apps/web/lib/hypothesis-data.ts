@@ -38,6 +38,7 @@ export interface HypothesisStageSummary {
   stageHealth: "on-track" | "warning" | "risk";
   conversionRate: number;
   averageDaysInStage: number;
+  total: number;
   items: HypothesisItem[];
 }
 
@@ -0,0 +1,35 @@
+"""materialized dashboard snapshot
+
+Revision ID: 8f2d61c4a9b3
+Revises: 3c524947e090
+Create Date: 2025-11-12 10:14:03.218554
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8f2d61c4a9b3'
+down_revision = '3c524947e090'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('hypothesis_dashboard_snapshots',
+    sa.Column('key', sa.String(length=32), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('entries', sa.JSON(), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('focus_hyp_id', sa.String(length=32), nullable=True),
+    sa.Column('focus_detail', sa.JSON(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('hypothesis_dashboard_snapshots')
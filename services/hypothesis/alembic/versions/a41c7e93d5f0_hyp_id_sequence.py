@@ -0,0 +1,41 @@
+"""hypothesis identifier allocator
+
+Revision ID: a41c7e93d5f0
+Revises: 8f2d61c4a9b3
+Create Date: 2025-11-12 15:42:19.604117
+
+"""
+from __future__ import annotations
+
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a41c7e93d5f0'
+down_revision = '8f2d61c4a9b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    sequences = op.create_table('hypothesis_id_sequences',
+    sa.Column('name', sa.String(length=32), nullable=False),
+    sa.Column('last_value', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+    pattern = re.compile(r"^HYP-(\d+)$")
+    connection = op.get_bind()
+    max_number = 0
+    for (hyp_id,) in connection.execute(sa.text("SELECT hyp_id FROM hypotheses")):
+        match = pattern.match(hyp_id)
+        if match:
+            max_number = max(max_number, int(match.group(1)))
+    op.bulk_insert(sequences, [{"name": "hyp_id", "last_value": max_number}])
+
+
+def downgrade() -> None:
+    op.drop_table('hypothesis_id_sequences')
@@ -0,0 +1,43 @@
+"""dashboard feed indexes; drop materialized dashboard entries
+
+Revision ID: a7d3e9f5c218
+Revises: f1c6b8d2a457
+Create Date: 2025-11-15 14:06:52.190734
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7d3e9f5c218'
+down_revision = 'f1c6b8d2a457'
+branch_labels = None
+depends_on = None
+
+OPEN = sa.text("status <> 'complete'")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_hypothesis_tasks_due', 'hypothesis_tasks', ['due'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_hypothesis_checklist_items_open_due', 'hypothesis_checklist_items', ['due_at'], unique=False, postgresql_where=OPEN, sqlite_where=OPEN, postgresql_concurrently=True)
+        op.create_index('ix_hypothesis_activity_events_occurred', 'hypothesis_activity_events', [sa.text('occurred_at DESC')], unique=False, postgresql_concurrently=True)
+
+    # Task and activity feeds are now queried directly; the snapshot keeps version and focus only.
+    with op.batch_alter_table('hypothesis_dashboard_snapshots') as batch_op:
+        batch_op.drop_column('payload')
+        batch_op.drop_column('entries')
+
+
+def downgrade() -> None:
+    # The next dashboard read after a downgrade rebuilds the snapshot contents.
+    op.execute('DELETE FROM hypothesis_dashboard_snapshots')
+    with op.batch_alter_table('hypothesis_dashboard_snapshots') as batch_op:
+        batch_op.add_column(sa.Column('entries', sa.JSON(), server_default='{}', nullable=False))
+        batch_op.add_column(sa.Column('payload', sa.JSON(), server_default='{}', nullable=False))
+    op.drop_index('ix_hypothesis_activity_events_occurred', table_name='hypothesis_activity_events')
+    op.drop_index('ix_hypothesis_checklist_items_open_due', table_name='hypothesis_checklist_items')
+    op.drop_index('ix_hypothesis_tasks_due', table_name='hypothesis_tasks')
@@ -0,0 +1,26 @@
+"""dead-letter status for outbox events
+
+Revision ID: b3f7d2e9c58a
+Revises: e8b3d6f1a274
+Create Date: 2025-11-18 10:12:44.218305
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3f7d2e9c58a'
+down_revision = 'e8b3d6f1a274'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('hypothesis_outbox', sa.Column('status', sa.String(length=16), server_default='pending', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('hypothesis_outbox', 'status')
@@ -0,0 +1,84 @@
+"""hypothesis full-text search
+
+Revision ID: b9d4f2a7c310
+Revises: e35a9c0f7b12
+Create Date: 2025-11-14 10:12:44.318270
+
+"""
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b9d4f2a7c310'
+down_revision = 'e35a9c0f7b12'
+branch_labels = None
+depends_on = None
+
+SQLITE_SEARCH_DDL = (
+    "CREATE VIRTUAL TABLE hypothesis_search USING fts5("
+    "search_document, content='hypotheses', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER hypotheses_search_insert AFTER INSERT ON hypotheses BEGIN "
+    "INSERT INTO hypothesis_search(rowid, search_document) VALUES (new.id, new.search_document); END",
+    "CREATE TRIGGER hypotheses_search_delete AFTER DELETE ON hypotheses BEGIN "
+    "INSERT INTO hypothesis_search(hypothesis_search, rowid, search_document) "
+    "VALUES ('delete', old.id, old.search_document); END",
+    "CREATE TRIGGER hypotheses_search_update AFTER UPDATE OF search_document ON hypotheses BEGIN "
+    "INSERT INTO hypothesis_search(hypothesis_search, rowid, search_document) "
+    "VALUES ('delete', old.id, old.search_document); "
+    "INSERT INTO hypothesis_search(rowid, search_document) VALUES (new.id, new.search_document); END",
+)
+
+
+def _backfill(connection) -> None:
+    # Comment bodies come from the table: rows on an old read-model version have an
+    # empty ``comments`` section until their next write.
+    comments = defaultdict(list)
+    for hypothesis_id, body in connection.execute(
+        sa.text("SELECT hypothesis_id, body FROM hypothesis_comments ORDER BY created_at")
+    ):
+        comments[hypothesis_id].append(body)
+
+    rows = connection.execute(sa.text("SELECT id, title, statement, description, tags FROM hypotheses")).all()
+    for row in rows:
+        tags = json.loads(row.tags) if isinstance(row.tags, str) else row.tags
+        parts = [row.title, row.statement, row.description, " ".join(tags or []), *comments[row.id]]
+        connection.execute(
+            sa.text("UPDATE hypotheses SET search_document = :document WHERE id = :id"),
+            {"document": "\n".join(part for part in parts if part), "id": row.id},
+        )
+
+
+def upgrade() -> None:
+    op.add_column('hypotheses', sa.Column('search_document', sa.Text(), server_default='', nullable=False))
+    connection = op.get_bind()
+    dialect = connection.dialect.name
+
+    if dialect == 'sqlite':
+        for statement in SQLITE_SEARCH_DDL:
+            op.execute(statement)
+    if not context.is_offline_mode():
+        _backfill(connection)
+
+    if dialect == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index('ix_hypotheses_search_document', 'hypotheses', [sa.text("to_tsvector('simple'::regconfig, search_document)")], unique=False, postgresql_using='gin')
+        op.create_index('ix_hypotheses_title_trgm', 'hypotheses', ['title'], unique=False, postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.drop_index('ix_hypotheses_title_trgm', table_name='hypotheses')
+        op.drop_index('ix_hypotheses_search_document', table_name='hypotheses')
+    if dialect == 'sqlite':
+        for trigger in ('hypotheses_search_update', 'hypotheses_search_delete', 'hypotheses_search_insert'):
+            op.execute(f"DROP TRIGGER {trigger}")
+        op.execute("DROP TABLE hypothesis_search")
+    op.drop_column('hypotheses', 'search_document')
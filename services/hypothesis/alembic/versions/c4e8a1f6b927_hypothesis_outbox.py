@@ -0,0 +1,36 @@
+"""transactional outbox for hypothesis domain events
+
+Revision ID: c4e8a1f6b927
+Revises: a7d3e9f5c218
+Create Date: 2025-11-16 09:41:27.503816
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e8a1f6b927'
+down_revision = 'a7d3e9f5c218'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('hypothesis_outbox',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('event_type', sa.String(length=64), nullable=False),
+    sa.Column('hyp_id', sa.String(length=32), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('occurred_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sqlite_autoincrement=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('hypothesis_outbox')
@@ -0,0 +1,34 @@
+"""versioned hypothesis read model
+
+Revision ID: c7e2b5d81f46
+Revises: a41c7e93d5f0
+Create Date: 2025-11-13 09:27:51.840362
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7e2b5d81f46'
+down_revision = 'a41c7e93d5f0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing rows start at read_model_version 0: they are served from the child tables
+    # until their next write renders every section.
+    op.add_column('hypotheses', sa.Column('approvals', sa.JSON(), server_default=sa.text("'[]'"), nullable=False))
+    op.add_column('hypotheses', sa.Column('comments', sa.JSON(), server_default=sa.text("'[]'"), nullable=False))
+    op.add_column('hypotheses', sa.Column('tasks', sa.JSON(), server_default=sa.text("'[]'"), nullable=False))
+    op.add_column('hypotheses', sa.Column('read_model_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('hypotheses', 'read_model_version')
+    op.drop_column('hypotheses', 'tasks')
+    op.drop_column('hypotheses', 'comments')
+    op.drop_column('hypotheses', 'approvals')
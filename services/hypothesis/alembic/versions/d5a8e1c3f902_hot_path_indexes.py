@@ -0,0 +1,75 @@
+"""indexes for hot hypothesis query paths
+
+Revision ID: d5a8e1c3f902
+Revises: b9d4f2a7c310
+Create Date: 2025-11-14 16:38:05.271944
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5a8e1c3f902'
+down_revision = 'b9d4f2a7c310'
+branch_labels = None
+depends_on = None
+
+ACTIVE = sa.text('archived_at IS NULL')
+
+# Child collections load per hypothesis in relationship order: (table, sort column, index name).
+CHILD_ORDER_INDEXES = (
+    ('hypothesis_stage_history', 'changed_at', 'ix_hypothesis_stage_history_hypothesis_changed'),
+    ('hypothesis_checklist_items', 'created_at', 'ix_hypothesis_checklist_items_hypothesis_created'),
+    ('hypothesis_tasks', 'due', 'ix_hypothesis_tasks_hypothesis_due'),
+    ('hypothesis_attachments', 'uploaded_at', 'ix_hypothesis_attachments_hypothesis_uploaded'),
+    ('hypothesis_approvals', 'created_at', 'ix_hypothesis_approvals_hypothesis_created'),
+)
+
+# Partial indexes over active rows, matching the keyset order of the list endpoint.
+ACTIVE_INDEXES = (
+    ('ix_hypotheses_active_created', [sa.text('created_at DESC'), 'id']),
+    ('ix_hypotheses_active_updated', [sa.text('updated_at DESC'), 'id']),
+    ('ix_hypotheses_active_stage_created', ['stage', sa.text('created_at DESC'), 'id']),
+    ('ix_hypotheses_active_lab_created', ['lab_id', sa.text('created_at DESC'), 'id']),
+)
+
+JSONB_INDEXES = (
+    ('ix_hypotheses_tags_gin', 'tags'),
+    ('ix_hypotheses_owners_gin', 'owners'),
+)
+
+
+def upgrade() -> None:
+    postgres = op.get_bind().dialect.name == 'postgresql'
+    # Build on Postgres without blocking writers; CONCURRENTLY cannot run in a transaction.
+    with op.get_context().autocommit_block():
+        for name, columns in ACTIVE_INDEXES:
+            op.create_index(name, 'hypotheses', columns, unique=False, postgresql_where=ACTIVE, sqlite_where=ACTIVE, postgresql_concurrently=True)
+        if postgres:
+            for name, column in JSONB_INDEXES:
+                op.create_index(name, 'hypotheses', [sa.text(f'CAST({column} AS JSONB) jsonb_path_ops')], unique=False, postgresql_using='gin', postgresql_concurrently=True)
+        for table, column, name in CHILD_ORDER_INDEXES:
+            op.create_index(name, table, ['hypothesis_id', column], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_hypothesis_comments_parent_id'), 'hypothesis_comments', ['parent_id'], unique=False, postgresql_concurrently=True)
+
+    # The composite indexes cover lookups by hypothesis_id alone, so the old ones go.
+    for table, _, _ in CHILD_ORDER_INDEXES:
+        op.drop_index(op.f(f'ix_{table}_hypothesis_id'), table_name=table)
+    # Duplicate of the primary key, only present on databases built with create_all().
+    op.execute('DROP INDEX IF EXISTS ix_hypotheses_id')
+
+
+def downgrade() -> None:
+    postgres = op.get_bind().dialect.name == 'postgresql'
+    for table, _, name in CHILD_ORDER_INDEXES:
+        op.create_index(op.f(f'ix_{table}_hypothesis_id'), table, ['hypothesis_id'], unique=False)
+        op.drop_index(name, table_name=table)
+    op.drop_index(op.f('ix_hypothesis_comments_parent_id'), table_name='hypothesis_comments')
+    if postgres:
+        for name, _ in JSONB_INDEXES:
+            op.drop_index(name, table_name='hypotheses')
+    for name, _ in ACTIVE_INDEXES:
+        op.drop_index(name, table_name='hypotheses')
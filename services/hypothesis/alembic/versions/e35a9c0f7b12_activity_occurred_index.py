@@ -0,0 +1,29 @@
+"""activity history index
+
+Revision ID: e35a9c0f7b12
+Revises: c7e2b5d81f46
+Create Date: 2025-11-13 14:06:38.512907
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e35a9c0f7b12'
+down_revision = 'c7e2b5d81f46'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The composite index covers lookups by hypothesis_id alone, so the old one goes.
+    op.create_index('ix_hypothesis_activity_events_hypothesis_occurred', 'hypothesis_activity_events', ['hypothesis_id', sa.text('occurred_at DESC')], unique=False)
+    op.drop_index(op.f('ix_hypothesis_activity_events_hypothesis_id'), table_name='hypothesis_activity_events')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_hypothesis_activity_events_hypothesis_id'), 'hypothesis_activity_events', ['hypothesis_id'], unique=False)
+    op.drop_index('ix_hypothesis_activity_events_hypothesis_occurred', table_name='hypothesis_activity_events')
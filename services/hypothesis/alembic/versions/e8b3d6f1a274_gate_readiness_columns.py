@@ -0,0 +1,57 @@
+"""gate readiness columns on hypotheses
+
+Revision ID: e8b3d6f1a274
+Revises: c4e8a1f6b927
+Create Date: 2025-11-16 15:22:08.417365
+
+"""
+from __future__ import annotations
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8b3d6f1a274'
+down_revision = 'c4e8a1f6b927'
+branch_labels = None
+depends_on = None
+
+NEXT_STAGE_GATE = {
+    'IDEATION': 'SCOPING_KICKOFF',
+    'SCOPING': 'PRIORITIZATION_REVIEW',
+    'PRIORITIZATION': 'EXPERIMENT_KICKOFF',
+    'EXPERIMENTATION': 'EVALUATION_GATE',
+    'EVALUATION': 'SCALING_KICKOFF',
+    'SCALING': 'PRODUCTION_ROLLOUT',
+}
+READY = sa.text(
+    "archived_at IS NULL AND next_gate IS NOT NULL "
+    "AND incomplete_checklist_count = 0 AND pending_approval_count = 0"
+)
+
+
+def upgrade() -> None:
+    op.add_column('hypotheses', sa.Column('next_gate', sa.String(length=32), nullable=True))
+    op.add_column('hypotheses', sa.Column('incomplete_checklist_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('hypotheses', sa.Column('pending_approval_count', sa.Integer(), server_default='0', nullable=False))
+    if not context.is_offline_mode():
+        next_gate = ' '.join(f"WHEN '{stage}' THEN '{gate}'" for stage, gate in NEXT_STAGE_GATE.items())
+        op.execute(
+            "UPDATE hypotheses SET "
+            f"next_gate = CASE stage {next_gate} ELSE NULL END, "
+            "incomplete_checklist_count = (SELECT count(*) FROM hypothesis_checklist_items AS item "
+            "WHERE item.hypothesis_id = hypotheses.id AND item.status NOT IN ('complete', 'done')), "
+            "pending_approval_count = (SELECT count(*) FROM hypothesis_approvals AS approval "
+            "WHERE approval.hypothesis_id = hypotheses.id AND approval.required AND approval.status <> 'approved')"
+        )
+
+    with op.get_context().autocommit_block():
+        op.create_index('ix_hypotheses_active_ready_created', 'hypotheses', [sa.text('created_at DESC'), 'id'], unique=False, postgresql_where=READY, sqlite_where=READY, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_hypotheses_active_ready_created', table_name='hypotheses')
+    op.drop_column('hypotheses', 'pending_approval_count')
+    op.drop_column('hypotheses', 'incomplete_checklist_count')
+    op.drop_column('hypotheses', 'next_gate')
@@ -0,0 +1,58 @@
+"""promoted columns for dashboard aggregates
+
+Revision ID: f1c6b8d2a457
+Revises: d5a8e1c3f902
+Create Date: 2025-11-15 09:51:27.604413
+
+"""
+from __future__ import annotations
+
+import json
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1c6b8d2a457'
+down_revision = 'd5a8e1c3f902'
+branch_labels = None
+depends_on = None
+
+
+def _load(value):
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def upgrade() -> None:
+    op.add_column('hypotheses', sa.Column('portfolio_value', sa.Float(), server_default='0', nullable=False))
+    op.add_column('hypotheses', sa.Column('experiment_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('hypotheses', sa.Column('production_weeks', sa.Integer(), nullable=True))
+    if context.is_offline_mode():
+        return
+
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.text("SELECT id, roi_estimate, time_estimate, linked_experiments FROM hypotheses")
+    ).all()
+    for row in rows:
+        roi = _load(row.roi_estimate) or {}
+        weeks = (_load(row.time_estimate) or {}).get('production_weeks')
+        connection.execute(
+            sa.text(
+                "UPDATE hypotheses SET portfolio_value = :value, experiment_count = :experiments, "
+                "production_weeks = :weeks WHERE id = :id"
+            ),
+            {
+                "value": float(roi.get('one_time_cost') or 0),
+                "experiments": len(_load(row.linked_experiments) or []),
+                "weeks": int(weeks) if weeks is not None else None,
+                "id": row.id,
+            },
+        )
+
+
+def downgrade() -> None:
+    op.drop_column('hypotheses', 'production_weeks')
+    op.drop_column('hypotheses', 'experiment_count')
+    op.drop_column('hypotheses', 'portfolio_value')
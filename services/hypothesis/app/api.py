@@ -1,8 +1,19 @@
-from typing import List
-
-from fastapi import APIRouter, Depends, status
-
-from .dependencies import get_hypothesis_service
+import io
+import tempfile
+from typing import AsyncIterator, BinaryIO, Dict, List, Optional, Union
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+from .cache import get_detail_cache
+from .config import get_settings
+from .database import current_pool
+from .dependencies import ServiceRunner, get_service_runner
+from .feed import ChangeFeedLagged, change_feed
+from .importer import read_rows
+from .outbox import current_outbox_relay
 from . import schemas
 from .schemas import (
     Hypothesis,
@@ -12,62 +23,395 @@ from .schemas import (
     HypothesisDashboard,
     HypothesisDetail,
     HypothesisUpdatePayload,
+    HypothesisVersion,
 )
-from .services import HypothesisService
+from .services import HypothesisService, dashboard_etag, record_etag, resolve_export_columns
+from .telemetry import pool_telemetry, query_telemetry
 
 router = APIRouter(prefix="/hypotheses", tags=["hypotheses"])
+metrics_router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+WriteResult = Union[HypothesisDetail, HypothesisVersion]
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# Reconnection delay suggested to ``EventSource`` clients of the change feed.
+CHANGE_FEED_RETRY_MS = 3000
+
+
+def prefers_minimal(prefer: Optional[str] = Header(default=None)) -> bool:
+    """Honour RFC 7240 ``Prefer: return=minimal`` on write endpoints."""
+    if not prefer:
+        return False
+    preferences = {token.strip().lower() for token in prefer.split(",")}
+    return "return=minimal" in preferences
+
+
+def _json_response(
+    model: BaseModel, *, status_code: int = status.HTTP_200_OK, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """Serialize an already validated model straight to JSON.
+
+    Returning a ``Response`` bypasses the ``response_model`` pass, which would dump the
+    model back to a dict and validate it a second time before encoding it. The declared
+    ``response_model`` still documents the payload in the OpenAPI schema.
+    """
+    return Response(
+        content=model.model_dump_json(by_alias=True),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+def _write_response(result: WriteResult, status_code: int = status.HTTP_200_OK) -> Response:
+    headers = {"ETag": record_etag(result.version)}
+    if isinstance(result, HypothesisVersion):
+        headers["Preference-Applied"] = "return=minimal"
+    return _json_response(result, status_code=status_code, headers=headers)
+
+
+def _batch_response(
+    result: schemas.HypothesisBatchResult, response: Response, status_code: int
+) -> schemas.HypothesisBatchResult:
+    """Use ``207 Multi-Status`` when any item failed so clients inspect per-item results."""
+    response.status_code = status.HTTP_207_MULTI_STATUS if result.failed else status_code
+    return result
+
+
+def list_filters(
+    stage: Optional[schemas.StageLiteral] = None,
+    lab_id: Optional[str] = Query(default=None, alias="labId"),
+    priority: Optional[schemas.PriorityLiteral] = None,
+    risk_class: Optional[schemas.RiskClassLiteral] = Query(default=None, alias="riskClass"),
+    tag: Optional[str] = None,
+    owner: Optional[str] = None,
+    ready_for_next_gate: Optional[bool] = Query(default=None, alias="readyForNextGate"),
+) -> schemas.HypothesisListFilters:
+    """Query-string filters shared by the list and export endpoints."""
+    return schemas.HypothesisListFilters(
+        stage=stage,
+        lab_id=lab_id,
+        priority=priority,
+        risk_class=risk_class,
+        tag=tag,
+        owner=owner,
+        ready_for_next_gate=ready_for_next_gate,
+    )
 
 
 @router.get("/", response_model=List[Hypothesis])
-def list_hypotheses(service: HypothesisService = Depends(get_hypothesis_service)) -> List[Hypothesis]:
-    """Return the active hypothesis catalogue."""
-    return service.list_hypotheses()
+async def list_hypotheses(
+    request: Request,
+    response: Response,
+    filters: schemas.HypothesisListFilters = Depends(list_filters),
+    sort: schemas.HypothesisSortLiteral = "createdAt",
+    order: schemas.SortOrderLiteral = "desc",
+    cursor: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    service: ServiceRunner = Depends(get_service_runner),
+) -> List[Hypothesis]:
+    """Return one page of the active hypothesis catalogue.
+
+    The cursor for the following page is returned in the ``X-Next-Cursor`` header
+    (and as a ``Link: rel="next"`` URL) when more results are available.
+    """
+    page = await service.run(
+        HypothesisService.list_hypotheses, filters, sort=sort, order=order, cursor=cursor, limit=limit
+    )
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+        next_url = request.url.include_query_params(cursor=page.next_cursor)
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return page.items
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_hypotheses(
+    filters: schemas.HypothesisListFilters = Depends(list_filters),
+    export_format: schemas.ExportFormatLiteral = Query(default="ndjson", alias="format"),
+    columns: Optional[str] = None,
+    service: ServiceRunner = Depends(get_service_runner),
+) -> StreamingResponse:
+    """Stream every active hypothesis matching the list filters as NDJSON or CSV.
+
+    ``columns`` is a comma-separated list of detail fields (``hypId,title,stage``).
+    Rows are read and written in batches, so memory stays flat for any export size.
+    """
+    selected = resolve_export_columns(export_format, columns)
+    return StreamingResponse(
+        service.stream(HypothesisService.export, filters, export_format=export_format, columns=selected),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="hypotheses.{export_format}"'},
+    )
+
+
+@router.get("/search", response_model=List[schemas.HypothesisSearchHit])
+async def search_hypotheses(
+    q: str = Query(..., min_length=1, max_length=256),
+    limit: int = Query(default=20, ge=1, le=100),
+    service: ServiceRunner = Depends(get_service_runner),
+) -> List[schemas.HypothesisSearchHit]:
+    """Search title, statement, description, tags and comments, best matches first.
+
+    Words match as prefixes. ``type:hyp``, ``id:HYP-01``, ``stage:``, ``lab:``,
+    ``priority:``, ``risk:``, ``tag:`` and ``owner:`` narrow the results.
+    """
+    return await service.run(HypothesisService.search, q, limit=limit)
 
 
 @router.get("/dashboard", response_model=HypothesisDashboard)
-def hypothesis_dashboard(
-    service: HypothesisService = Depends(get_hypothesis_service),
-) -> HypothesisDashboard:
-    """Return aggregated portfolio analytics for the workspace."""
-    return service.build_dashboard()
+async def hypothesis_dashboard(
+    if_none_match: Optional[str] = Header(default=None),
+    service: ServiceRunner = Depends(get_service_runner),
+) -> Response:
+    """Return aggregated portfolio analytics for the workspace.
+
+    Honours ``If-None-Match`` against the portfolio-wide ``ETag`` with ``304 Not Modified``.
+    """
+    result = await service.run(HypothesisService.build_dashboard, if_none_match=if_none_match)
+    return _json_response(result, headers={"ETag": dashboard_etag(result.version, result.tasks)})
+
+
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_changes(
+    last_event_id: Optional[str] = Header(default=None),
+    resume_from: Optional[str] = Query(default=None, alias="lastEventId"),
+    service: ServiceRunner = Depends(get_service_runner),
+) -> StreamingResponse:
+    """Push portfolio changes (creates, updates, stage changes, comments, ...) as Server-Sent Events.
+
+    Each event is one activity item with its ``hypId``; the SSE ``id`` is the activity
+    id. Reconnecting with ``Last-Event-ID`` (or ``?lastEventId=``) resumes after it.
+    """
+    return await _change_stream(service, None, last_event_id or resume_from)
 
 
 @router.post("/", response_model=HypothesisDetail, status_code=status.HTTP_201_CREATED)
-def create_hypothesis(
+async def create_hypothesis(
     payload: HypothesisCreatePayload,
-    service: HypothesisService = Depends(get_hypothesis_service),
-) -> HypothesisDetail:
+    minimal: bool = Depends(prefers_minimal),
+    service: ServiceRunner = Depends(get_service_runner),
+) -> Response:
     """Create a new hypothesis record."""
-    return service.create(payload)
+    result = await service.run(HypothesisService.create, payload, minimal=minimal)
+    return _write_response(result, status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/batch", response_model=schemas.HypothesisBatchResult, status_code=status.HTTP_201_CREATED)
+async def create_hypotheses(
+    payload: schemas.HypothesisBatchPayload,
+    response: Response,
+    service: ServiceRunner = Depends(get_service_runner),
+) -> schemas.HypothesisBatchResult:
+    """Create many hypotheses in one transaction with per-item results."""
+    result = await service.run(HypothesisService.create_many, payload.items)
+    return _batch_response(result, response, status.HTTP_201_CREATED)
+
+
+@router.post("/import", response_class=StreamingResponse)
+async def import_hypotheses(
+    request: Request,
+    import_format: Optional[schemas.ExportFormatLiteral] = Query(default=None, alias="format"),
+    service: ServiceRunner = Depends(get_service_runner),
+) -> StreamingResponse:
+    """Bulk-create hypotheses from an NDJSON or CSV request body.
+
+    The format comes from ``format`` or else the ``Content-Type`` (``text/csv``, otherwise
+    NDJSON). The body is spooled to a temporary file, then parsed and inserted in
+    chunks; the response streams one NDJSON progress object per chunk, listing that
+    chunk's rejected rows, and ends with ``"done": true``.
+    """
+    if import_format is None:
+        content_type = request.headers.get("content-type", "")
+        import_format = "csv" if content_type.startswith("text/csv") else "ndjson"
+    upload = tempfile.TemporaryFile()
+    async for chunk in request.stream():
+        await run_in_threadpool(upload.write, chunk)
+    upload.seek(0)
+    return StreamingResponse(_import_progress(service, upload, import_format), media_type=EXPORT_MEDIA_TYPES["ndjson"])
+
+
+async def _import_progress(
+    service: ServiceRunner, upload: BinaryIO, import_format: schemas.ExportFormatLiteral
+) -> AsyncIterator[str]:
+    try:
+        rows = read_rows(io.TextIOWrapper(upload, encoding="utf-8", errors="replace", newline=""), import_format)
+        async for progress in service.stream(HypothesisService.import_rows, rows):
+            yield progress.model_dump_json(by_alias=True) + "\n"
+    finally:
+        upload.close()
+
+
+@router.patch("/batch", response_model=schemas.HypothesisBatchResult)
+async def update_hypotheses(
+    payload: schemas.HypothesisBatchPayload,
+    response: Response,
+    service: ServiceRunner = Depends(get_service_runner),
+) -> schemas.HypothesisBatchResult:
+    """Apply partial updates to many hypotheses; each item carries its ``hypId``."""
+    result = await service.run(HypothesisService.update_many, payload.items)
+    return _batch_response(result, response, status.HTTP_200_OK)
+
+
+@router.post("/transition/batch", response_model=schemas.HypothesisTransitionBatchResult)
+async def transition_hypotheses(
+    payload: schemas.HypothesisBatchPayload,
+    response: Response,
+    service: ServiceRunner = Depends(get_service_runner),
+) -> schemas.HypothesisTransitionBatchResult:
+    """Move many hypotheses to new stages; each item carries its ``hypId`` and target ``stage``.
+
+    Stage gates are checked for the whole batch at once. Items that are blocked or not
+    found are reported per item while the others are committed together.
+    """
+    result = await service.run(HypothesisService.transition_many, payload.items)
+    return _batch_response(result, response, status.HTTP_200_OK)
+
+
+@router.post("/{hyp_id}/transition", response_model=schemas.HypothesisTransitionResult)
+async def transition_hypothesis(
+    hyp_id: str,
+    payload: schemas.HypothesisTransitionPayload,
+    service: ServiceRunner = Depends(get_service_runner),
+) -> Response:
+    """Move a hypothesis to another stage without rendering its detail view.
+
+    Moving forward requires a complete checklist and every required approval; a
+    blocked gate answers ``400``. The response carries the new version as ``ETag``.
+    """
+    result = await service.run(HypothesisService.transition, hyp_id, payload)
+    return _json_response(result, headers={"ETag": record_etag(result.version)})
 
 
 @router.patch("/{hyp_id}", response_model=HypothesisDetail)
-def update_hypothesis(
+async def update_hypothesis(
     hyp_id: str,
     payload: HypothesisUpdatePayload,
-    service: HypothesisService = Depends(get_hypothesis_service),
-) -> HypothesisDetail:
-    """Apply partial updates to an existing hypothesis."""
-    return service.update(hyp_id, payload)
+    if_match: Optional[str] = Header(default=None),
+    minimal: bool = Depends(prefers_minimal),
+    service: ServiceRunner = Depends(get_service_runner),
+) -> Response:
+    """Apply partial updates to an existing hypothesis.
+
+    With ``If-Match`` the update only applies to the named version; otherwise the
+    request fails with ``412 Precondition Failed`` and the current ``ETag``.
+    """
+    result = await service.run(HypothesisService.update, hyp_id, payload, minimal=minimal, if_match=if_match)
+    return _write_response(result)
 
 
 @router.delete("/{hyp_id}", status_code=status.HTTP_204_NO_CONTENT)
-def archive_hypothesis(
+async def archive_hypothesis(
     hyp_id: str,
-    service: HypothesisService = Depends(get_hypothesis_service),
+    service: ServiceRunner = Depends(get_service_runner),
 ) -> None:
     """Soft-delete (archive) the hypothesis."""
-    service.archive(hyp_id)
+    await service.run(HypothesisService.archive, hyp_id)
     return None
 
 
 @router.get("/{hyp_id}", response_model=HypothesisDetail)
-def get_hypothesis(
+async def get_hypothesis(
+    hyp_id: str,
+    if_none_match: Optional[str] = Header(default=None),
+    service: ServiceRunner = Depends(get_service_runner),
+) -> Response:
+    """Fetch the detailed view for a single hypothesis.
+
+    Honours ``If-None-Match`` against the version ``ETag`` with ``304 Not Modified``.
+    The body comes from the detail cache when it holds the current version.
+    """
+    rendered = await service.run(HypothesisService.get_rendered, hyp_id, if_none_match=if_none_match)
+    return Response(
+        content=rendered.body, media_type="application/json", headers={"ETag": record_etag(rendered.version)}
+    )
+
+
+@router.get("/{hyp_id}/activity", response_model=List[schemas.HypothesisActivity])
+async def list_activity(
+    hyp_id: str,
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    service: ServiceRunner = Depends(get_service_runner),
+) -> List[schemas.HypothesisActivity]:
+    """Return one page of the hypothesis' activity history, newest first.
+
+    The detail view only carries the most recent events; older history is paged here
+    with the same ``X-Next-Cursor``/``Link`` headers as the catalogue listing.
+    """
+    page = await service.run(HypothesisService.list_activity, hyp_id, cursor=cursor, limit=limit)
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+        next_url = request.url.include_query_params(cursor=page.next_cursor)
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return page.items
+
+
+@router.get("/{hyp_id}/stream", response_class=StreamingResponse)
+async def stream_hypothesis_changes(
     hyp_id: str,
-    service: HypothesisService = Depends(get_hypothesis_service),
-) -> HypothesisDetail:
-    """Fetch the detailed view for a single hypothesis."""
-    return service.get(hyp_id)
+    last_event_id: Optional[str] = Header(default=None),
+    resume_from: Optional[str] = Query(default=None, alias="lastEventId"),
+    service: ServiceRunner = Depends(get_service_runner),
+) -> StreamingResponse:
+    """Push the changes of one hypothesis as Server-Sent Events, like ``/hypotheses/stream``."""
+    return await _change_stream(service, hyp_id, last_event_id or resume_from)
+
+
+async def _change_stream(
+    service: ServiceRunner, hyp_id: Optional[str], last_event_id: Optional[str]
+) -> StreamingResponse:
+    # Capture the live position before replaying, so nothing committed meanwhile is missed.
+    position = change_feed.position()
+    buffered = change_feed.locate(last_event_id) if last_event_id else None
+    backlog = service.stream(
+        HypothesisService.replay_changes, hyp_id, after_event_id=None if buffered is not None else last_event_id
+    )
+    first = await backlog.__anext__()  # a missing hypothesis is reported before the stream starts
+    return StreamingResponse(
+        _change_events(hyp_id, first, backlog, position if buffered is None else buffered),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _change_events(
+    hyp_id: Optional[str],
+    first: List[schemas.HypothesisChange],
+    backlog: AsyncIterator[List[schemas.HypothesisChange]],
+    position: int,
+) -> AsyncIterator[str]:
+    replayed = set()
+    try:
+        yield f"retry: {CHANGE_FEED_RETRY_MS}\n\n"
+        for change in first:
+            replayed.add(change.id)
+            yield _sse_event(change)
+        async for batch in backlog:
+            for change in batch:
+                replayed.add(change.id)
+                yield _sse_event(change)
+    finally:
+        await backlog.aclose()
+
+    keepalive = get_settings().change_feed_keepalive_seconds
+    try:
+        async for batch in change_feed.subscribe(hyp_id, after=position, keepalive=keepalive):
+            if not batch:
+                yield ": keepalive\n\n"
+            for change in batch:
+                if change.id not in replayed:
+                    yield _sse_event(change)
+    except ChangeFeedLagged:
+        # End the stream; the client reconnects with ``Last-Event-ID`` and resumes from the table.
+        return
+
+
+def _sse_event(change: schemas.HypothesisChange) -> str:
+    return f"id: {change.id}\ndata: {change.model_dump_json(by_alias=True)}\n\n"
 
 
 @router.post(
@@ -75,37 +419,37 @@ def get_hypothesis(
     response_model=HypothesisComment,
     status_code=status.HTTP_201_CREATED,
 )
-def add_comment(
+async def add_comment(
     hyp_id: str,
     payload: schemas.CommentCreatePayload,
-    service: HypothesisService = Depends(get_hypothesis_service),
+    service: ServiceRunner = Depends(get_service_runner),
 ) -> HypothesisComment:
-    return service.add_comment(hyp_id, payload)
+    return await service.run(HypothesisService.add_comment, hyp_id, payload)
 
 
 @router.patch(
     "/{hyp_id}/comments/{comment_id}",
     response_model=HypothesisComment,
 )
-def update_comment(
+async def update_comment(
     hyp_id: str,
     comment_id: str,
     payload: schemas.CommentUpdatePayload,
-    service: HypothesisService = Depends(get_hypothesis_service),
+    service: ServiceRunner = Depends(get_service_runner),
 ) -> HypothesisComment:
-    return service.update_comment(hyp_id, comment_id, payload)
+    return await service.run(HypothesisService.update_comment, hyp_id, comment_id, payload)
 
 
 @router.delete(
     "/{hyp_id}/comments/{comment_id}",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def delete_comment(
+async def delete_comment(
     hyp_id: str,
     comment_id: str,
-    service: HypothesisService = Depends(get_hypothesis_service),
+    service: ServiceRunner = Depends(get_service_runner),
 ) -> None:
-    service.delete_comment(hyp_id, comment_id)
+    await service.run(HypothesisService.delete_comment, hyp_id, comment_id)
     return None
 
 
@@ -114,12 +458,12 @@ def delete_comment(
     response_model=HypothesisAttachment,
     status_code=status.HTTP_201_CREATED,
 )
-def add_attachment(
+async def add_attachment(
     hyp_id: str,
     payload: schemas.AttachmentCreatePayload,
-    service: HypothesisService = Depends(get_hypothesis_service),
+    service: ServiceRunner = Depends(get_service_runner),
 ) -> HypothesisAttachment:
-    return service.add_attachment(hyp_id, payload)
+    return await service.run(HypothesisService.add_attachment, hyp_id, payload)
 
 
 @router.post(
@@ -127,60 +471,115 @@ def add_attachment(
     response_model=HypothesisDetail,
     status_code=status.HTTP_201_CREATED,
 )
-def add_checklist_item(
+async def add_checklist_item(
     hyp_id: str,
     payload: schemas.ChecklistItemCreatePayload,
-    service: HypothesisService = Depends(get_hypothesis_service),
-) -> HypothesisDetail:
-    return service.add_checklist_item(hyp_id, payload)
+    minimal: bool = Depends(prefers_minimal),
+    service: ServiceRunner = Depends(get_service_runner),
+) -> Response:
+    result = await service.run(
+        HypothesisService.add_checklist_item, hyp_id, payload, minimal=minimal
+    )
+    return _write_response(result, status_code=status.HTTP_201_CREATED)
 
 
 @router.patch(
     "/{hyp_id}/checklist/{item_id}",
     response_model=HypothesisDetail,
 )
-def update_checklist_item(
+async def update_checklist_item(
     hyp_id: str,
     item_id: str,
     payload: schemas.ChecklistItemUpdatePayload,
-    service: HypothesisService = Depends(get_hypothesis_service),
-) -> HypothesisDetail:
-    return service.update_checklist_item(hyp_id, item_id, payload)
+    minimal: bool = Depends(prefers_minimal),
+    service: ServiceRunner = Depends(get_service_runner),
+) -> Response:
+    result = await service.run(
+        HypothesisService.update_checklist_item, hyp_id, item_id, payload, minimal=minimal
+    )
+    return _write_response(result)
 
 
 @router.delete(
     "/{hyp_id}/checklist/{item_id}",
     response_model=HypothesisDetail,
 )
-def remove_checklist_item(
+async def remove_checklist_item(
     hyp_id: str,
     item_id: str,
-    service: HypothesisService = Depends(get_hypothesis_service),
-) -> HypothesisDetail:
-    return service.remove_checklist_item(hyp_id, item_id)
+    minimal: bool = Depends(prefers_minimal),
+    service: ServiceRunner = Depends(get_service_runner),
+) -> Response:
+    result = await service.run(
+        HypothesisService.remove_checklist_item, hyp_id, item_id, minimal=minimal
+    )
+    return _write_response(result)
 
 
 @router.patch(
     "/{hyp_id}/tasks/{task_id}",
     response_model=HypothesisDetail,
 )
-def update_task(
+async def update_task(
     hyp_id: str,
     task_id: str,
     payload: schemas.TaskUpdatePayload,
-    service: HypothesisService = Depends(get_hypothesis_service),
-) -> HypothesisDetail:
-    return service.update_task(hyp_id, task_id, payload)
+    minimal: bool = Depends(prefers_minimal),
+    service: ServiceRunner = Depends(get_service_runner),
+) -> Response:
+    result = await service.run(
+        HypothesisService.update_task, hyp_id, task_id, payload, minimal=minimal
+    )
+    return _write_response(result)
 
 
 @router.patch(
     "/{hyp_id}/approvals/{approval_id}",
     response_model=HypothesisDetail,
 )
-def update_approval(
+async def update_approval(
     hyp_id: str,
     approval_id: str,
     payload: schemas.ApprovalUpdatePayload,
-    service: HypothesisService = Depends(get_hypothesis_service),
-) -> HypothesisDetail:
-    return service.update_approval(hyp_id, approval_id, payload)
+    minimal: bool = Depends(prefers_minimal),
+    service: ServiceRunner = Depends(get_service_runner),
+) -> Response:
+    result = await service.run(
+        HypothesisService.update_approval, hyp_id, approval_id, payload, minimal=minimal
+    )
+    return _write_response(result)
+
+
+@metrics_router.get("", response_class=PlainTextResponse)
+async def prometheus_metrics() -> PlainTextResponse:
+    """Expose request, per-request SQL, pool, detail cache and outbox metrics in the Prometheus text format."""
+    relay = current_outbox_relay()
+    return PlainTextResponse(
+        query_telemetry.render_prometheus(
+            pool_telemetry.snapshot(current_pool()),
+            get_detail_cache().stats(),
+            relay.stats() if relay is not None else None,
+        ),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+@metrics_router.get("/pool", response_model=schemas.PoolStats)
+async def pool_metrics() -> schemas.PoolStats:
+    """Report connection pool occupancy, checkout wait time and connection churn."""
+    return pool_telemetry.snapshot(current_pool())
+
+
+@metrics_router.get("/cache", response_model=schemas.DetailCacheStats)
+async def detail_cache_metrics() -> schemas.DetailCacheStats:
+    """Report detail cache occupancy and hit, miss, eviction and invalidation counts."""
+    return get_detail_cache().stats()
+
+
+@metrics_router.get("/outbox", response_model=schemas.OutboxStats)
+async def outbox_metrics() -> schemas.OutboxStats:
+    """Report the outbox backlog, its oldest event's age and the relay's publish counters."""
+    relay = current_outbox_relay()
+    if relay is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="The outbox relay is not running here.")
+    return relay.stats()
@@ -0,0 +1,222 @@
+"""Read-through cache for rendered hypothesis detail views.
+
+Entries are keyed by ``hyp_id`` and hold the JSON body of one ``version``. A lookup
+only hits when the caller passes the version it just read from the database, so a
+body cached by a reader that raced a commit is never served once the row moves on,
+and instances that each keep an in-process cache stay correct without talking to
+each other. Writers invalidate the ``hyp_id`` after commit to free the slot early.
+
+The in-process backend is an LRU bounded by entry count and body bytes with a TTL.
+The Redis backend speaks the plain ``GET``/``SET EX``/``DEL`` commands, so any
+Redis-protocol server (or a local stand-in with the same client methods) can serve it.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+from . import schemas
+from .config import HypothesisSettings, get_settings
+
+logger = logging.getLogger("hypothesis.cache")
+
+COUNTERS = ("hits", "misses", "evictions", "expirations", "invalidations", "errors")
+
+
+class RenderedDetail(NamedTuple):
+    """A serialized detail view and the version it was rendered from."""
+
+    version: int
+    body: bytes
+
+
+class DetailCache:
+    """Cache interface and disabled backend: every lookup misses and nothing is kept."""
+
+    backend = "none"
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+
+    def get(self, hyp_id: str, version: int) -> Optional[bytes]:
+        """Return the cached body of ``hyp_id`` at ``version``, or ``None``."""
+        body = self._get(hyp_id, version)
+        self._count("hits" if body is not None else "misses")
+        return body
+
+    def set(self, hyp_id: str, version: int, body: bytes) -> None:
+        self._set(hyp_id, version, body)
+
+    def invalidate(self, hyp_ids: Iterable[str]) -> None:
+        """Drop whatever is cached for ``hyp_ids``; called after their writes commit."""
+        keys = set(hyp_ids)
+        if keys:
+            self._delete(keys)
+            self._count("invalidations", len(keys))
+
+    def stats(self) -> schemas.DetailCacheStats:
+        entries, size_bytes = self._usage()
+        with self._lock:
+            return schemas.DetailCacheStats(
+                backend=self.backend, entries=entries, size_bytes=size_bytes, **self._counters
+            )
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[counter] += amount
+
+    def _get(self, hyp_id: str, version: int) -> Optional[bytes]:
+        return None
+
+    def _set(self, hyp_id: str, version: int, body: bytes) -> None:
+        return None
+
+    def _delete(self, hyp_ids: Iterable[str]) -> None:
+        return None
+
+    def _usage(self) -> Tuple[int, int]:
+        return 0, 0
+
+
+class LRUDetailCache(DetailCache):
+    """Process-local LRU bounded by ``max_entries`` and ``max_bytes`` of body, with a TTL."""
+
+    backend = "memory"
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        max_bytes: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        # hyp_id -> (version, body, expires_at), least recently used first.
+        self._entries: OrderedDict[str, Tuple[int, bytes, float]] = OrderedDict()
+        self._size_bytes = 0
+
+    def _get(self, hyp_id: str, version: int) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(hyp_id)
+            if entry is None or entry[0] != version:
+                return None
+            if entry[2] <= self._clock():
+                self._pop(hyp_id)
+                self._counters["expirations"] += 1
+                return None
+            self._entries.move_to_end(hyp_id)
+            return entry[1]
+
+    def _set(self, hyp_id: str, version: int, body: bytes) -> None:
+        if len(body) > self.max_bytes or self.max_entries == 0:
+            return
+        with self._lock:
+            if hyp_id in self._entries:
+                self._pop(hyp_id)
+            self._entries[hyp_id] = (version, body, self._clock() + self.ttl_seconds)
+            self._size_bytes += len(body)
+            while len(self._entries) > self.max_entries or self._size_bytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+                self._counters["evictions"] += 1
+
+    def _delete(self, hyp_ids: Iterable[str]) -> None:
+        with self._lock:
+            for hyp_id in hyp_ids:
+                if hyp_id in self._entries:
+                    self._pop(hyp_id)
+
+    def _pop(self, hyp_id: str) -> None:
+        self._size_bytes -= len(self._entries.pop(hyp_id)[1])
+
+    def _usage(self) -> Tuple[int, int]:
+        with self._lock:
+            return len(self._entries), self._size_bytes
+
+
+class RedisDetailCache(DetailCache):
+    """Shared cache on a Redis-protocol server; expiry and eviction are left to the server.
+
+    Values are ``b"<version>:" + body`` under ``<prefix><hyp_id>`` with ``SET EX``.
+    ``client`` needs ``get``, ``set(key, value, ex=...)`` and ``delete(*keys)``. Server
+    errors are counted and treated as misses, so an outage only costs the cache.
+    """
+
+    backend = "redis"
+
+    def __init__(self, client: Any, *, ttl_seconds: float, prefix: str = "hypothesis:detail:") -> None:
+        super().__init__()
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, *, ttl_seconds: float) -> "RedisDetailCache":
+        try:
+            import redis
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError("The redis detail cache backend requires the 'redis' package.") from exc
+        return cls(redis.Redis.from_url(url), ttl_seconds=ttl_seconds)
+
+    def _get(self, hyp_id: str, version: int) -> Optional[bytes]:
+        try:
+            value = self.client.get(self.prefix + hyp_id)
+        except Exception:
+            self._failed("GET")
+            return None
+        if value is None:
+            return None
+        cached_version, _, body = value.partition(b":")
+        return body if cached_version == str(version).encode() else None
+
+    def _set(self, hyp_id: str, version: int, body: bytes) -> None:
+        try:
+            self.client.set(self.prefix + hyp_id, b"%d:%s" % (version, body), ex=max(int(self.ttl_seconds), 1))
+        except Exception:
+            self._failed("SET")
+
+    def _delete(self, hyp_ids: Iterable[str]) -> None:
+        try:
+            self.client.delete(*(self.prefix + hyp_id for hyp_id in hyp_ids))
+        except Exception:
+            self._failed("DEL")
+
+    def _failed(self, command: str) -> None:
+        self._count("errors")
+        logger.warning("Detail cache %s failed", command, exc_info=True)
+
+
+def build_detail_cache(settings: HypothesisSettings) -> DetailCache:
+    if settings.detail_cache_backend == "redis":
+        return RedisDetailCache.from_url(settings.detail_cache_redis_url, ttl_seconds=settings.detail_cache_ttl_seconds)
+    if settings.detail_cache_backend == "memory":
+        return LRUDetailCache(
+            max_entries=settings.detail_cache_max_entries,
+            max_bytes=settings.detail_cache_max_bytes,
+            ttl_seconds=settings.detail_cache_ttl_seconds,
+        )
+    return DetailCache()
+
+
+detail_cache: Optional[DetailCache] = None
+
+
+def get_detail_cache() -> DetailCache:
+    global detail_cache
+    if detail_cache is None:
+        detail_cache = build_detail_cache(get_settings())
+    return detail_cache
+
+
+def reset_detail_cache() -> None:
+    """Drop the cache so the next use rebuilds it from the current settings."""
+    global detail_cache
+    detail_cache = None
@@ -1,31 +1,88 @@
-from collections.abc import Generator
 from typing import Optional
 
 from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from .config import get_settings
+from .cache import reset_detail_cache
+from .config import HypothesisSettings, get_settings
 from .models import Base
+from .telemetry import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool, pool_telemetry, query_telemetry
 
 engine: Optional[Engine] = None
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, future=True)
+async_engine: Optional[AsyncEngine] = None
+# Objects stay loaded after commit so write paths can render responses from the
+# in-session object graph instead of reloading every relationship.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, future=True)
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
 
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+psycopg",
+}
 
-def _create_engine() -> Engine:
-    settings = get_settings()
-    engine_kwargs = {"echo": settings.database_echo, "future": True}
 
-    if settings.database_url.startswith("sqlite"):
-        connect_args = {"check_same_thread": False}
-        if ":memory:" in settings.database_url or "mode=memory" in settings.database_url:
+def _engine_kwargs(database_url: str, settings: HypothesisSettings, *, use_asyncio: bool = False) -> dict:
+    engine_kwargs = {"echo": settings.database_echo, "pool_pre_ping": settings.database_pool_pre_ping}
+    connect_args: dict = {}
+
+    if database_url.startswith("sqlite"):
+        connect_args["check_same_thread"] = False
+        if ":memory:" in database_url or "mode=memory" in database_url:
             engine_kwargs["poolclass"] = StaticPool
-            if "mode=memory" in settings.database_url:
+            if "mode=memory" in database_url:
                 connect_args["uri"] = True
+    elif settings.database_statement_timeout_ms:
+        timeout_ms = settings.database_statement_timeout_ms
+        if "asyncpg" in database_url:
+            connect_args["server_settings"] = {"statement_timeout": str(timeout_ms)}
+        else:
+            connect_args["options"] = f"-c statement_timeout={timeout_ms}"
+
+    if "poolclass" not in engine_kwargs:
+        engine_kwargs.update(
+            poolclass=InstrumentedAsyncAdaptedQueuePool if use_asyncio else InstrumentedQueuePool,
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_timeout=settings.database_pool_timeout,
+            pool_recycle=settings.database_pool_recycle,
+        )
+    if connect_args:
         engine_kwargs["connect_args"] = connect_args
+    return engine_kwargs
+
+
+def _create_engine() -> Engine:
+    settings = get_settings()
+    engine_kwargs = _engine_kwargs(settings.database_url, settings)
+    created = create_engine(settings.database_url, future=True, **engine_kwargs)
+    pool_telemetry.instrument(created)
+    query_telemetry.instrument(created)
+    return created
+
+
+def resolve_async_database_url(settings: HypothesisSettings) -> str:
+    """Return the asyncio driver URL, deriving it from ``database_url`` when not configured."""
+    if settings.async_database_url:
+        return settings.async_database_url
+    url = make_url(settings.database_url)
+    drivername = ASYNC_DRIVERS.get(url.get_backend_name())
+    if drivername is None:
+        raise ValueError(f"No asyncio driver known for '{url.drivername}'; set HYPOTHESIS_ASYNC_DATABASE_URL.")
+    return url.set(drivername=drivername).render_as_string(hide_password=False)
+
 
-    return create_engine(settings.database_url, **engine_kwargs)
+def _create_async_engine() -> AsyncEngine:
+    settings = get_settings()
+    database_url = resolve_async_database_url(settings)
+    created = create_async_engine(
+        database_url, **_engine_kwargs(database_url, settings, use_asyncio=True)
+    )
+    pool_telemetry.instrument(created.sync_engine)
+    query_telemetry.instrument(created.sync_engine)
+    return created
 
 
 def get_engine() -> Engine:
@@ -36,13 +93,36 @@ def get_engine() -> Engine:
     return engine
 
 
+def get_async_engine() -> AsyncEngine:
+    global async_engine
+    if async_engine is None:
+        async_engine = _create_async_engine()
+        AsyncSessionLocal.configure(bind=async_engine)
+    return async_engine
+
+
 def reset_engine() -> None:
     """Dispose of the current engine so a new configuration can be applied."""
-    global engine
+    global engine, async_engine
     if engine is not None:
         engine.dispose()
     engine = None
     SessionLocal.configure(bind=None)
+    # Async connections belong to the event loop that opened them; they are closed by
+    # ``dispose_async_engine`` on shutdown, so only the reference is dropped here.
+    async_engine = None
+    AsyncSessionLocal.configure(bind=None)
+    pool_telemetry.reset()
+    # Cached bodies belong to the old database.
+    reset_detail_cache()
+
+
+async def dispose_async_engine() -> None:
+    global async_engine
+    if async_engine is not None:
+        await async_engine.dispose()
+    async_engine = None
+    AsyncSessionLocal.configure(bind=None)
 
 
 def init_db() -> None:
@@ -51,11 +131,20 @@ def init_db() -> None:
     Base.metadata.create_all(bind=current_engine)
 
 
-def get_session() -> Generator[Session, None, None]:
-    """FastAPI dependency that yields a session per request."""
-    get_engine()
-    session = SessionLocal()
-    try:
-        yield session
-    finally:
-        session.close()
+async def init_db_async() -> None:
+    """Create database tables through the asyncio engine."""
+    async with get_async_engine().begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+
+def current_engine():
+    """Return the synchronous engine behind whichever mode serves requests."""
+    if get_settings().database_async:
+        return async_engine.sync_engine if async_engine is not None else None
+    return engine
+
+
+def current_pool():
+    """Return the pool of whichever engine serves requests in the configured mode."""
+    active = current_engine()
+    return active.pool if active is not None else None
@@ -1,18 +1,97 @@
 from __future__ import annotations
 
-from fastapi import Depends
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, Callable, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
 
-from .database import get_session
+from .config import get_settings
+from .database import AsyncSessionLocal, SessionLocal, get_async_engine, get_engine
 from .repositories import HypothesisRepository
 from .services import HypothesisService
 
+T = TypeVar("T")
+
+
+class ServiceRunner(ABC):
+    """Executes ``HypothesisService`` methods without blocking the event loop.
+
+    The sync runner hands the call to Starlette's thread pool; the asyncio runner
+    executes the same service code inside ``AsyncSession.run_sync`` so database I/O
+    goes through the async driver and no worker thread is held per request.
+    """
+
+    @abstractmethod
+    async def run(self, method: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call ``method`` with a service bound to this runner's session."""
+
+    @abstractmethod
+    def stream(self, method: Callable[..., Iterator[T]], *args: Any, **kwargs: Any) -> AsyncIterator[T]:
+        """Iterate a generator method of the service for a streaming response body.
+
+        The stream owns a session of its own, opened on first iteration and closed
+        when the body is exhausted or the client disconnects, so it does not depend
+        on when the request-scoped session is released.
+        """
+
+
+class ThreadedServiceRunner(ServiceRunner):
+    def __init__(self, session: Session):
+        self.service = HypothesisService(HypothesisRepository(session))
+
+    async def run(self, method: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await run_in_threadpool(method, self.service, *args, **kwargs)
+
+    async def stream(self, method: Callable[..., Iterator[T]], *args: Any, **kwargs: Any) -> AsyncIterator[T]:
+        session = SessionLocal()
+        try:
+            chunks = method(HypothesisService(HypothesisRepository(session)), *args, **kwargs)
+            async for chunk in iterate_in_threadpool(chunks):
+                yield chunk
+        finally:
+            await run_in_threadpool(session.close)
+
+
+class AsyncServiceRunner(ServiceRunner):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def run(self, method: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        def call(sync_session: Session) -> T:
+            return method(HypothesisService(HypothesisRepository(sync_session)), *args, **kwargs)
+
+        return await self.session.run_sync(call)
+
+    async def stream(self, method: Callable[..., Iterator[T]], *args: Any, **kwargs: Any) -> AsyncIterator[T]:
+        chunks: list[Iterator[T]] = []
+        done = object()
+
+        # Each chunk is produced inside ``run_sync`` so the generator's queries run
+        # through the async driver, one round trip into the greenlet per chunk.
+        def advance(sync_session: Session) -> Any:
+            if not chunks:
+                chunks.append(method(HypothesisService(HypothesisRepository(sync_session)), *args, **kwargs))
+            return next(chunks[0], done)
+
+        async with AsyncSessionLocal() as session:
+            while (chunk := await session.run_sync(advance)) is not done:
+                yield chunk
 
-def get_repository(session: Session = Depends(get_session)) -> HypothesisRepository:
-    return HypothesisRepository(session)
 
+async def get_service_runner() -> AsyncIterator[ServiceRunner]:
+    """FastAPI dependency selecting the sync or asyncio database mode from settings."""
+    if get_settings().database_async:
+        get_async_engine()
+        async with AsyncSessionLocal() as session:
+            yield AsyncServiceRunner(session)
+        return
 
-def get_hypothesis_service(
-    repository: HypothesisRepository = Depends(get_repository),
-) -> HypothesisService:
-    return HypothesisService(repository)
+    get_engine()
+    session = SessionLocal()
+    try:
+        yield ThreadedServiceRunner(session)
+    finally:
+        await run_in_threadpool(session.close)
@@ -0,0 +1,136 @@
+"""In-process fan-out of hypothesis changes to Server-Sent Events subscribers.
+
+Writers publish the activity events they committed. :data:`change_feed` keeps the
+most recent ones in a ring buffer and wakes only the subscribers of the affected
+topics: the whole portfolio and the one hypothesis. An idle subscriber is a single
+coroutine parked on an :class:`asyncio.Event` shared by its topic, so thousands per
+process cost little. Clients reconnecting with ``Last-Event-ID`` resume from the
+buffer, or from the activity table once the event has left it.
+"""
+from __future__ import annotations
+
+import asyncio
+import weakref
+from collections import deque
+from typing import AsyncIterator, Deque, List, Optional, Sequence, Tuple
+
+from . import schemas
+
+
+class ChangeFeedLagged(Exception):
+    """The subscriber fell further behind than the buffer reaches."""
+
+
+class ChangeFeedBroker:
+    """Ring buffer of recent changes plus per-topic wake-ups.
+
+    Buffer positions are process-local sequence numbers; clients only ever see
+    activity event ids. All state is touched on the event loop thread: ``publish``
+    may be called from worker threads and hands the changes over with
+    ``call_soon_threadsafe``.
+    """
+
+    def __init__(self, buffer_size: int = 1024) -> None:
+        self._buffer: Deque[Tuple[int, schemas.HypothesisChange]] = deque(maxlen=buffer_size)
+        self._sequence = 0
+        # ``None`` is the portfolio topic. Entries vanish once no subscriber waits on them.
+        self._topics: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.subscribers = 0
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    def start(self, buffer_size: Optional[int] = None) -> None:
+        """Bind to the running event loop with an empty buffer; until then ``publish`` is a no-op."""
+        self._buffer = deque(maxlen=buffer_size or self._buffer.maxlen)
+        self._loop = asyncio.get_running_loop()
+
+    def stop(self) -> None:
+        """Unbind and release every subscriber so open streams end."""
+        self._loop = None
+        for waiter in list(self._topics.values()):
+            waiter.set()
+        self._topics.clear()
+
+    def publish(self, changes: Sequence[schemas.HypothesisChange]) -> None:
+        """Queue committed changes, oldest first, for delivery; safe from any thread."""
+        loop = self._loop
+        if loop is None or not changes:
+            return
+        try:
+            loop.call_soon_threadsafe(self._append, list(changes))
+        except RuntimeError:
+            pass  # the loop closed during shutdown
+
+    def position(self) -> int:
+        """Buffer position of the newest change; subscribe from here to receive only new ones."""
+        return self._sequence
+
+    def locate(self, event_id: str) -> Optional[int]:
+        """Return the buffer position of ``event_id``, or ``None`` when it is not buffered."""
+        for sequence, change in reversed(self._buffer):
+            if change.id == event_id:
+                return sequence
+        return None
+
+    async def subscribe(
+        self, hyp_id: Optional[str], *, after: int, keepalive: float
+    ) -> AsyncIterator[List[schemas.HypothesisChange]]:
+        """Yield batches of changes after buffer position ``after``.
+
+        ``hyp_id`` narrows the stream to one hypothesis. An empty batch is yielded when
+        ``keepalive`` seconds pass without changes. Raises :class:`ChangeFeedLagged`
+        when changes were dropped from the buffer before this subscriber saw them.
+        """
+        self.subscribers += 1
+        try:
+            position = after
+            while self.running:
+                position, changes = self._changes_after(position, hyp_id)
+                if changes:
+                    yield changes
+                elif not await self._wait(hyp_id, keepalive):
+                    yield []
+        finally:
+            self.subscribers -= 1
+
+    def _append(self, changes: List[schemas.HypothesisChange]) -> None:
+        for change in changes:
+            self._sequence += 1
+            self._buffer.append((self._sequence, change))
+            self._wake(change.hyp_id)
+        self._wake(None)
+
+    def _wake(self, topic: Optional[str]) -> None:
+        waiter = self._topics.pop(topic, None)
+        if waiter is not None:
+            waiter.set()
+
+    def _changes_after(
+        self, position: int, hyp_id: Optional[str]
+    ) -> Tuple[int, List[schemas.HypothesisChange]]:
+        if self._buffer and self._buffer[0][0] > position + 1:
+            raise ChangeFeedLagged()
+        changes = []
+        for sequence, change in reversed(self._buffer):
+            if sequence <= position:
+                break
+            if hyp_id is None or change.hyp_id == hyp_id:
+                changes.append(change)
+        changes.reverse()
+        return self._sequence, changes
+
+    async def _wait(self, topic: Optional[str], timeout: float) -> bool:
+        waiter = self._topics.get(topic)
+        if waiter is None:
+            waiter = self._topics[topic] = asyncio.Event()
+        try:
+            await asyncio.wait_for(waiter.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+
+change_feed = ChangeFeedBroker()
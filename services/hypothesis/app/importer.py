@@ -0,0 +1,112 @@
+"""Stream-parse hypothesis import files and load them in bulk.
+
+NDJSON files hold one create payload per line; CSV files use the camelCase payload
+fields as headers, with list and object fields as JSON cells (the layout written by
+``GET /hypotheses/export?format=csv``). Rows are parsed one at a time and handed to
+:meth:`HypothesisService.import_rows`, which validates and inserts them in chunks.
+
+    python -m hypothesis.app.importer portfolio.ndjson
+    python -m hypothesis.app.importer portfolio.csv --database-url postgresql+psycopg://localhost/hypothesis
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional, TextIO, get_args
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from . import schemas
+from .config import get_settings
+from .repositories import HypothesisRepository
+from .services import IMPORT_CHUNK_SIZE, HypothesisService
+
+
+class ImportRow(NamedTuple):
+    """One parsed row; ``row`` is its line number in the file."""
+
+    row: int
+    values: Optional[dict] = None
+    error: Optional[str] = None
+
+
+def read_rows(stream: TextIO, import_format: schemas.ExportFormatLiteral) -> Iterator[ImportRow]:
+    """Parse ``stream`` lazily; malformed rows are yielded with an error instead of raising."""
+    return _read_csv(stream) if import_format == "csv" else _read_ndjson(stream)
+
+
+def _read_ndjson(stream: TextIO) -> Iterator[ImportRow]:
+    for number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            values = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield ImportRow(number, error=f"Invalid JSON: {exc.msg}.")
+            continue
+        if not isinstance(values, dict):
+            yield ImportRow(number, error="Expected a JSON object.")
+            continue
+        yield ImportRow(number, values)
+
+
+def _read_csv(stream: TextIO) -> Iterator[ImportRow]:
+    reader = csv.DictReader(stream)
+    for cells in reader:
+        values = {}
+        try:
+            for column, cell in cells.items():
+                # Empty cells fall back to the payload defaults; extra cells have no header.
+                if column and cell:
+                    values[column] = _csv_value(column, cell)
+        except ValueError as exc:
+            yield ImportRow(reader.line_num, error=str(exc))
+            continue
+        yield ImportRow(reader.line_num, values)
+
+
+def _csv_value(column: str, cell: str):
+    if not cell.startswith(("[", "{")):
+        return cell
+    try:
+        return json.loads(cell)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"{column}: invalid JSON ({exc.msg}).") from None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="NDJSON or CSV file, or '-' for standard input")
+    parser.add_argument("--format", choices=get_args(schemas.ExportFormatLiteral), help="defaults to the file suffix")
+    parser.add_argument("--database-url", help="defaults to HYPOTHESIS_DATABASE_URL")
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    import_format = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+    engine = create_engine(args.database_url or get_settings().database_url)
+    stream = sys.stdin if args.path == "-" else Path(args.path).open(encoding="utf-8", newline="")
+    started = time.perf_counter()
+    imported = failed = 0
+    try:
+        with Session(engine, expire_on_commit=False) as session:
+            service = HypothesisService(HypothesisRepository(session))
+            for progress in service.import_rows(read_rows(stream, import_format), chunk_size=args.chunk_size):
+                for error in progress.errors:
+                    print(f"\nrow {error.row}: {error.error}", file=sys.stderr)
+                print(f"\r{progress.imported} imported, {progress.failed} failed", end="", flush=True)
+                imported, failed = progress.imported, progress.failed
+    finally:
+        stream.close()
+        engine.dispose()
+    elapsed = time.perf_counter() - started
+    print(f"\nimported in {elapsed:.1f}s ({imported / elapsed:.0f} rows/s)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
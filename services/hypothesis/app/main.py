@@ -1,25 +1,55 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 
-from .api import router
+from .api import metrics_router, router
 from .config import get_settings
-from .database import SessionLocal, init_db
+from .database import AsyncSessionLocal, SessionLocal, dispose_async_engine, init_db, init_db_async
+from .feed import change_feed
+from .outbox import configure_outbox_relay, reset_outbox_relay
 from .seed import seed_demo_data
+from .telemetry import QueryTelemetryMiddleware
 
 
 def create_app() -> FastAPI:
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         settings = get_settings()
-        init_db()
-        if settings.seed_demo_data:
-            with SessionLocal() as session:
-                seed_demo_data(session)
+        if settings.database_async:
+            await init_db_async()
+            if settings.seed_demo_data:
+                async with AsyncSessionLocal() as session:
+                    await session.run_sync(seed_demo_data)
+        else:
+            init_db()
+            if settings.seed_demo_data:
+                with SessionLocal() as session:
+                    seed_demo_data(session)
+        change_feed.start(settings.change_feed_buffer_size)
+        relay_task = None
+        if settings.outbox_relay_enabled:
+            relay = configure_outbox_relay(settings)
+            relay_task = asyncio.create_task(relay.run(poll_seconds=settings.outbox_poll_seconds))
         yield
+        if relay_task is not None:
+            relay_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await relay_task
+            reset_outbox_relay()
+        change_feed.stop()
+        if settings.database_async:
+            await dispose_async_engine()
 
     app = FastAPI(title="Hypothesis Service", version="0.1.0", lifespan=lifespan)
+    settings = get_settings()
+    app.add_middleware(
+        QueryTelemetryMiddleware,
+        expose_headers=settings.query_stats_headers,
+        slow_request_ms=settings.slow_request_ms,
+    )
     app.include_router(router)
+    app.include_router(metrics_router)
 
     return app
 
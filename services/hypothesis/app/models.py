@@ -1,10 +1,26 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import uuid4
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    cast,
+    event,
+    func,
+    literal_column,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.types import JSON
 from sqlalchemy.ext.mutable import MutableDict, MutableList
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -18,10 +34,14 @@ def generate_uuid() -> str:
     return str(uuid4())
 
 
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class HypothesisRecord(Base):
     __tablename__ = "hypotheses"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     hyp_id: Mapped[str] = mapped_column(String(32), unique=True, nullable=False)
     lab_id: Mapped[str] = mapped_column(String(64), nullable=False)
     version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
@@ -82,62 +102,94 @@ class HypothesisRecord(Base):
     activity_digest: Mapped[List[dict]] = mapped_column(
         MutableList.as_mutable(JSON), default=list, nullable=False
     )
+    approvals: Mapped[List[dict]] = mapped_column(
+        MutableList.as_mutable(JSON), default=list, nullable=False
+    )
+    comments: Mapped[List[dict]] = mapped_column(
+        MutableList.as_mutable(JSON), default=list, nullable=False
+    )
+    tasks: Mapped[List[dict]] = mapped_column(
+        MutableList.as_mutable(JSON), default=list, nullable=False
+    )
+    # Layout version of the JSON read-model sections (stage_history, gating_checklist,
+    # attachments, approvals, comments, tasks, activity_digest). Rows written under an
+    # older layout are rendered from the child tables until their next write.
+    read_model_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    # Title, statement, description, tags and comment bodies as one text document,
+    # rewritten with the read model and indexed for search (see below).
+    search_document: Mapped[str] = mapped_column(Text, default="", server_default="", nullable=False)
+    # Promoted from ``roi_estimate.one_time_cost``, ``linked_experiments`` and
+    # ``time_estimate.production_weeks`` so dashboard highlights aggregate in SQL.
+    portfolio_value: Mapped[float] = mapped_column(Float, default=0.0, server_default="0", nullable=False)
+    experiment_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    production_weeks: Mapped[Optional[int]] = mapped_column(Integer)
+    # Gate readiness: the next gate of ``stage`` and what still blocks it, rewritten with
+    # the checklist and approvals sections so gates are checked and filtered in SQL.
+    next_gate: Mapped[Optional[str]] = mapped_column(String(32))
+    incomplete_checklist_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    pending_approval_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), onupdate=utcnow, nullable=False
     )
     archived_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
+    # ``version`` doubles as the optimistic-concurrency token: every UPDATE bumps it and
+    # fails with ``StaleDataError`` when another writer got there first.
+    __mapper_args__ = {"version_id_col": version}
+
+    # Collections load lazily; repository queries choose what to eager-load through
+    # the named profiles in ``repositories.LOAD_PROFILES``.
     stage_history_entries: Mapped[List["HypothesisStageHistoryEntry"]] = relationship(
         "HypothesisStageHistoryEntry",
         back_populates="hypothesis",
         cascade="all, delete-orphan",
         order_by="HypothesisStageHistoryEntry.changed_at",
-        lazy="selectin",
+        lazy="select",
     )
     checklist_items: Mapped[List["HypothesisChecklistItem"]] = relationship(
         "HypothesisChecklistItem",
         back_populates="hypothesis",
         cascade="all, delete-orphan",
         order_by="HypothesisChecklistItem.created_at",
-        lazy="selectin",
+        lazy="select",
     )
     task_records: Mapped[List["HypothesisTask"]] = relationship(
         "HypothesisTask",
         back_populates="hypothesis",
         cascade="all, delete-orphan",
         order_by="HypothesisTask.due",
-        lazy="selectin",
+        lazy="select",
     )
     comment_threads: Mapped[List["HypothesisComment"]] = relationship(
         "HypothesisComment",
         back_populates="hypothesis",
         cascade="all, delete-orphan",
         primaryjoin="HypothesisRecord.id==HypothesisComment.hypothesis_id",
-        lazy="selectin",
+        lazy="select",
     )
     attachment_records: Mapped[List["HypothesisAttachment"]] = relationship(
         "HypothesisAttachment",
         back_populates="hypothesis",
         cascade="all, delete-orphan",
         order_by="HypothesisAttachment.uploaded_at",
-        lazy="selectin",
+        lazy="select",
     )
     approval_records: Mapped[List["HypothesisApproval"]] = relationship(
         "HypothesisApproval",
         back_populates="hypothesis",
         cascade="all, delete-orphan",
         order_by="HypothesisApproval.created_at",
-        lazy="selectin",
+        lazy="select",
     )
     activity_events: Mapped[List["HypothesisActivityEvent"]] = relationship(
         "HypothesisActivityEvent",
         back_populates="hypothesis",
         cascade="all, delete-orphan",
         order_by="HypothesisActivityEvent.occurred_at.desc()",
-        lazy="selectin",
+        lazy="select",
     )
 
     def as_dict(self) -> dict:
@@ -178,6 +230,9 @@ class HypothesisRecord(Base):
             "sponsors": self.sponsors,
             "observers": self.observers,
             "activity_digest": self.activity_digest,
+            "approvals": self.approvals,
+            "comments": self.comments,
+            "tasks": self.tasks,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
             "archived_at": self.archived_at,
@@ -189,13 +244,14 @@ class HypothesisStageHistoryEntry(Base):
     __tablename__ = "hypothesis_stage_history"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # Indexed together with ``changed_at`` below.
     hypothesis_id: Mapped[int] = mapped_column(
-        ForeignKey("hypotheses.id", ondelete="CASCADE"), nullable=False, index=True
+        ForeignKey("hypotheses.id", ondelete="CASCADE"), nullable=False
     )
     from_stage: Mapped[Optional[str]] = mapped_column(String(32))
     to_stage: Mapped[str] = mapped_column(String(32), nullable=False)
     changed_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False
     )
     changed_by: Mapped[str] = mapped_column(String(160), nullable=False)
     notes: Mapped[Optional[str]] = mapped_column(Text)
@@ -209,8 +265,9 @@ class HypothesisChecklistItem(Base):
     __tablename__ = "hypothesis_checklist_items"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
+    # Indexed together with ``created_at`` below.
     hypothesis_id: Mapped[int] = mapped_column(
-        ForeignKey("hypotheses.id", ondelete="CASCADE"), nullable=False, index=True
+        ForeignKey("hypotheses.id", ondelete="CASCADE"), nullable=False
     )
     label: Mapped[str] = mapped_column(String(255), nullable=False)
     owner_name: Mapped[Optional[str]] = mapped_column(String(160))
@@ -218,10 +275,10 @@ class HypothesisChecklistItem(Base):
     status: Mapped[str] = mapped_column(String(16), nullable=False, default="pending")
     due_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), onupdate=utcnow, nullable=False
     )
 
     hypothesis: Mapped[HypothesisRecord] = relationship(
@@ -233,8 +290,9 @@ class HypothesisTask(Base):
     __tablename__ = "hypothesis_tasks"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
+    # Indexed together with ``due`` below.
     hypothesis_id: Mapped[int] = mapped_column(
-        ForeignKey("hypotheses.id", ondelete="CASCADE"), nullable=False, index=True
+        ForeignKey("hypotheses.id", ondelete="CASCADE"), nullable=False
     )
     label: Mapped[str] = mapped_column(String(255), nullable=False)
     owner_name: Mapped[Optional[str]] = mapped_column(String(160))
@@ -246,10 +304,10 @@ class HypothesisTask(Base):
     related_stage: Mapped[Optional[str]] = mapped_column(String(32))
     notes: Mapped[Optional[str]] = mapped_column(Text)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), onupdate=utcnow, nullable=False
     )
 
     hypothesis: Mapped[HypothesisRecord] = relationship(
@@ -265,17 +323,17 @@ class HypothesisComment(Base):
         ForeignKey("hypotheses.id", ondelete="CASCADE"), nullable=False, index=True
     )
     parent_id: Mapped[Optional[str]] = mapped_column(
-        String(36), ForeignKey("hypothesis_comments.id", ondelete="CASCADE"), nullable=True
+        String(36), ForeignKey("hypothesis_comments.id", ondelete="CASCADE"), nullable=True, index=True
     )
     author_name: Mapped[str] = mapped_column(String(160), nullable=False)
     author_email: Mapped[Optional[str]] = mapped_column(String(160))
     body: Mapped[str] = mapped_column(Text, nullable=False)
     is_resolved: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), onupdate=utcnow, nullable=False
     )
 
     hypothesis: Mapped[HypothesisRecord] = relationship(
@@ -296,8 +354,9 @@ class HypothesisAttachment(Base):
     __tablename__ = "hypothesis_attachments"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
+    # Indexed together with ``uploaded_at`` below.
     hypothesis_id: Mapped[int] = mapped_column(
-        ForeignKey("hypotheses.id", ondelete="CASCADE"), nullable=False, index=True
+        ForeignKey("hypotheses.id", ondelete="CASCADE"), nullable=False
     )
     file_name: Mapped[str] = mapped_column(String(255), nullable=False)
     file_type: Mapped[Optional[str]] = mapped_column(String(64))
@@ -308,7 +367,7 @@ class HypothesisAttachment(Base):
     uploaded_by_email: Mapped[Optional[str]] = mapped_column(String(160))
     extra_metadata: Mapped[dict] = mapped_column(MutableDict.as_mutable(JSON), default=dict, nullable=False)
     uploaded_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False
     )
 
     hypothesis: Mapped[HypothesisRecord] = relationship(
@@ -320,8 +379,9 @@ class HypothesisApproval(Base):
     __tablename__ = "hypothesis_approvals"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
+    # Indexed together with ``created_at`` below.
     hypothesis_id: Mapped[int] = mapped_column(
-        ForeignKey("hypotheses.id", ondelete="CASCADE"), nullable=False, index=True
+        ForeignKey("hypotheses.id", ondelete="CASCADE"), nullable=False
     )
     approver_name: Mapped[str] = mapped_column(String(160), nullable=False)
     approver_email: Mapped[Optional[str]] = mapped_column(String(160))
@@ -331,10 +391,10 @@ class HypothesisApproval(Base):
     decided_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     notes: Mapped[Optional[str]] = mapped_column(Text)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), onupdate=utcnow, nullable=False
     )
 
     hypothesis: Mapped[HypothesisRecord] = relationship(
@@ -346,8 +406,9 @@ class HypothesisActivityEvent(Base):
     __tablename__ = "hypothesis_activity_events"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
+    # Indexed together with ``occurred_at`` below.
     hypothesis_id: Mapped[int] = mapped_column(
-        ForeignKey("hypotheses.id", ondelete="CASCADE"), nullable=False, index=True
+        ForeignKey("hypotheses.id", ondelete="CASCADE"), nullable=False
     )
     event_type: Mapped[str] = mapped_column(String(32), nullable=False)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -358,12 +419,211 @@ class HypothesisActivityEvent(Base):
     impact: Mapped[Optional[str]] = mapped_column(String(16))
     extra_metadata: Mapped[dict] = mapped_column(MutableDict.as_mutable(JSON), default=dict, nullable=False)
     occurred_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False
     )
 
     hypothesis: Mapped[HypothesisRecord] = relationship(
         HypothesisRecord, back_populates="activity_events"
     )
+
+
+# Serves both the newest-first activity digest and the paginated history endpoint.
+Index(
+    "ix_hypothesis_activity_events_hypothesis_occurred",
+    HypothesisActivityEvent.hypothesis_id,
+    HypothesisActivityEvent.occurred_at.desc(),
+)
+# Portfolio-wide feeds walk these in order and stop after the dashboard's top N.
+Index("ix_hypothesis_activity_events_occurred", HypothesisActivityEvent.occurred_at.desc())
+Index("ix_hypothesis_tasks_due", HypothesisTask.due)
+Index(
+    "ix_hypothesis_checklist_items_open_due",
+    HypothesisChecklistItem.due_at,
+    postgresql_where=HypothesisChecklistItem.status != "complete",
+    sqlite_where=HypothesisChecklistItem.status != "complete",
+)
+
+# Child collections are loaded per hypothesis in their relationship order, so the
+# foreign key leads and the sort column follows.
+Index(
+    "ix_hypothesis_stage_history_hypothesis_changed",
+    HypothesisStageHistoryEntry.hypothesis_id,
+    HypothesisStageHistoryEntry.changed_at,
+)
+Index(
+    "ix_hypothesis_checklist_items_hypothesis_created",
+    HypothesisChecklistItem.hypothesis_id,
+    HypothesisChecklistItem.created_at,
+)
+Index("ix_hypothesis_tasks_hypothesis_due", HypothesisTask.hypothesis_id, HypothesisTask.due)
+Index(
+    "ix_hypothesis_attachments_hypothesis_uploaded",
+    HypothesisAttachment.hypothesis_id,
+    HypothesisAttachment.uploaded_at,
+)
+Index(
+    "ix_hypothesis_approvals_hypothesis_created",
+    HypothesisApproval.hypothesis_id,
+    HypothesisApproval.created_at,
+)
+
+# Every catalogue read filters on ``archived_at IS NULL``; partial indexes keep archived
+# rows out and match the keyset order (sort column, then ``id`` as the tie-breaker).
+_ACTIVE = HypothesisRecord.archived_at.is_(None)
+Index(
+    "ix_hypotheses_active_created",
+    HypothesisRecord.created_at.desc(),
+    HypothesisRecord.id,
+    postgresql_where=_ACTIVE,
+    sqlite_where=_ACTIVE,
+)
+Index(
+    "ix_hypotheses_active_updated",
+    HypothesisRecord.updated_at.desc(),
+    HypothesisRecord.id,
+    postgresql_where=_ACTIVE,
+    sqlite_where=_ACTIVE,
+)
+# Equality filters lead so ``stage=`` / ``labId=`` pages read in order without a sort;
+# the stage index also serves the dashboard's per-stage grouping.
+Index(
+    "ix_hypotheses_active_stage_created",
+    HypothesisRecord.stage,
+    HypothesisRecord.created_at.desc(),
+    HypothesisRecord.id,
+    postgresql_where=_ACTIVE,
+    sqlite_where=_ACTIVE,
+)
+Index(
+    "ix_hypotheses_active_lab_created",
+    HypothesisRecord.lab_id,
+    HypothesisRecord.created_at.desc(),
+    HypothesisRecord.id,
+    postgresql_where=_ACTIVE,
+    sqlite_where=_ACTIVE,
+)
+# ``readyForNextGate=true`` pages read the hypotheses with nothing left blocking their gate.
+# The zeros are inlined: SQLite only matches a partial index against literal constants.
+READY_FOR_NEXT_GATE = (
+    HypothesisRecord.next_gate.is_not(None)
+    & (HypothesisRecord.incomplete_checklist_count == literal_column("0"))
+    & (HypothesisRecord.pending_approval_count == literal_column("0"))
+)
+Index(
+    "ix_hypotheses_active_ready_created",
+    HypothesisRecord.created_at.desc(),
+    HypothesisRecord.id,
+    postgresql_where=_ACTIVE & READY_FOR_NEXT_GATE,
+    sqlite_where=_ACTIVE & READY_FOR_NEXT_GATE,
+)
+# ``tag=`` and ``owner=`` filters test JSONB containment (``CAST(col AS JSONB) @> ...``).
+Index(
+    "ix_hypotheses_tags_gin",
+    cast(HypothesisRecord.tags, JSONB).label("tags_jsonb"),
+    postgresql_using="gin",
+    postgresql_ops={"tags_jsonb": "jsonb_path_ops"},
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_hypotheses_owners_gin",
+    cast(HypothesisRecord.owners, JSONB).label("owners_jsonb"),
+    postgresql_using="gin",
+    postgresql_ops={"owners_jsonb": "jsonb_path_ops"},
+).ddl_if(dialect="postgresql")
+
+
+# Full-text search. Postgres indexes ``search_document`` as a tsvector expression and
+# ``title`` with trigrams for fuzzy matches; both follow row writes on their own.
+SEARCH_TS_CONFIG = text("'simple'::regconfig")
+Index(
+    "ix_hypotheses_search_document",
+    func.to_tsvector(SEARCH_TS_CONFIG, HypothesisRecord.search_document),
+    postgresql_using="gin",
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_hypotheses_title_trgm",
+    HypothesisRecord.title,
+    postgresql_using="gin",
+    postgresql_ops={"title": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+# SQLite keeps an external-content FTS5 table in step through triggers, so every
+# write path, including bulk UPDATEs, re-indexes just the rows it touches.
+SQLITE_SEARCH_TABLE = "hypothesis_search"
+SQLITE_SEARCH_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_SEARCH_TABLE} USING fts5("
+    "search_document, content='hypotheses', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    f"CREATE TRIGGER IF NOT EXISTS hypotheses_search_insert AFTER INSERT ON hypotheses BEGIN "
+    f"INSERT INTO {SQLITE_SEARCH_TABLE}(rowid, search_document) VALUES (new.id, new.search_document); END",
+    f"CREATE TRIGGER IF NOT EXISTS hypotheses_search_delete AFTER DELETE ON hypotheses BEGIN "
+    f"INSERT INTO {SQLITE_SEARCH_TABLE}({SQLITE_SEARCH_TABLE}, rowid, search_document) "
+    "VALUES ('delete', old.id, old.search_document); END",
+    f"CREATE TRIGGER IF NOT EXISTS hypotheses_search_update AFTER UPDATE OF search_document ON hypotheses BEGIN "
+    f"INSERT INTO {SQLITE_SEARCH_TABLE}({SQLITE_SEARCH_TABLE}, rowid, search_document) "
+    "VALUES ('delete', old.id, old.search_document); "
+    f"INSERT INTO {SQLITE_SEARCH_TABLE}(rowid, search_document) VALUES (new.id, new.search_document); END",
+)
+for _statement in SQLITE_SEARCH_DDL:
+    event.listen(HypothesisRecord.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    HypothesisRecord.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {SQLITE_SEARCH_TABLE}").execute_if(dialect="sqlite"),
+)
+
+
+class HypothesisIdSequence(Base):
+    """Allocation counter for human-readable ``HYP-NNN`` identifiers."""
+
+    __tablename__ = "hypothesis_id_sequences"
+
+    name: Mapped[str] = mapped_column(String(32), primary_key=True)
+    last_value: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class HypothesisDashboardSnapshot(Base):
+    """Portfolio version and focus hypothesis, updated in place by every mutation."""
+
+    __tablename__ = "hypothesis_dashboard_snapshots"
+
+    key: Mapped[str] = mapped_column(String(32), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+    focus_hyp_id: Mapped[Optional[str]] = mapped_column(String(32))
+    focus_detail: Mapped[Optional[dict]] = mapped_column(JSON)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), onupdate=utcnow, nullable=False
+    )
+
+
+class HypothesisOutboxEvent(Base):
+    """Domain event written in the transaction of the change it describes.
+
+    The relay publishes rows in ``id`` order and deletes them once the broker has
+    accepted them. ``id`` never repeats (``AUTOINCREMENT`` on SQLite) so consumers
+    can use it to drop redeliveries. ``attempts`` counts publishes the broker rejected
+    while it accepted other events; an event that reaches the relay's limit is marked
+    ``dead`` and kept for inspection, and later events of the same hypothesis are held
+    until an operator sets ``status`` back to ``pending`` or deletes the row.
+    """
+
+    __tablename__ = "hypothesis_outbox"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    event_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    hyp_id: Mapped[str] = mapped_column(String(32), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    status: Mapped[str] = mapped_column(String(16), default="pending", server_default="pending", nullable=False)
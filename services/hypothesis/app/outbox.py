@@ -0,0 +1,342 @@
+"""Relay hypothesis domain events from the transactional outbox to a message broker.
+
+Every mutation stages its events in ``hypothesis_outbox`` inside its own transaction
+(see :meth:`HypothesisService._emit`), so an event exists exactly when its change
+committed. The relay reads the oldest events in ``id`` order, hands the batch to an
+:class:`OutboxPublisher` and deletes the rows only once the publisher accepted them:
+delivery is at-least-once, and consumers drop redeliveries by ``id``.
+
+A failed publish is first taken for a broker outage: nothing is counted against the
+events and the relay backs off exponentially, up to
+``HYPOTHESIS_OUTBOX_MAX_BACKOFF_SECONDS``. The head of a failed batch is then retried
+alone. If it still fails while the broker accepts other hypotheses' events (or the
+publisher's :meth:`~OutboxPublisher.probe` succeeds), the broker is rejecting that
+event: its ``attempts`` go up, and at ``HYPOTHESIS_OUTBOX_MAX_ATTEMPTS`` it is marked
+``dead``. A dead event holds every later event of its hypothesis until an operator
+sets it back to ``pending`` or deletes it, so no hypothesis' events are delivered out
+of order or past a gap.
+
+The relay runs inside the API process with ``HYPOTHESIS_OUTBOX_RELAY_ENABLED=1`` or on
+its own:
+
+    python -m hypothesis.app.outbox --publisher stdout
+    python -m hypothesis.app.outbox --publisher mybroker.adapters:KafkaPublisher
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import logging
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import List, Optional, Sequence, TextIO
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from . import schemas
+from .config import HypothesisSettings, get_settings
+from .database import AsyncSessionLocal, SessionLocal, get_async_engine, get_engine
+from .models import HypothesisOutboxEvent
+from .repositories import HypothesisRepository
+
+logger = logging.getLogger("hypothesis.outbox")
+
+
+class OutboxPublisher(ABC):
+    """Broker adapter. ``publish`` returns once every event is accepted and raises otherwise.
+
+    Events arrive in ``id`` order; brokers with partitions should key them by ``hypId``
+    to keep each hypothesis' events in order.
+    """
+
+    name = "none"
+
+    @abstractmethod
+    def publish(self, events: Sequence[schemas.HypothesisDomainEvent]) -> None:
+        """Hand ``events`` to the broker."""
+
+    def probe(self) -> bool:
+        """Return whether the broker accepts publishes right now.
+
+        Lets the relay tell a rejected event from an outage when no other events are
+        waiting. The default cannot tell, so such an event is retried, never dead-lettered.
+        """
+        return False
+
+
+class InMemoryPublisher(OutboxPublisher):
+    """Local stand-in broker that keeps every delivery, in order."""
+
+    name = "memory"
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.delivered: List[schemas.HypothesisDomainEvent] = []
+
+    def publish(self, events: Sequence[schemas.HypothesisDomainEvent]) -> None:
+        with self._lock:
+            self.delivered.extend(events)
+
+    def probe(self) -> bool:
+        return True
+
+
+class StreamPublisher(OutboxPublisher):
+    """Writes events as NDJSON lines, e.g. to pipe the standalone relay into a consumer."""
+
+    name = "stdout"
+
+    def __init__(self, stream: TextIO = sys.stdout) -> None:
+        self.stream = stream
+
+    def publish(self, events: Sequence[schemas.HypothesisDomainEvent]) -> None:
+        self.stream.write("".join(event.model_dump_json(by_alias=True) + "\n" for event in events))
+        self.stream.flush()
+
+    def probe(self) -> bool:
+        return not self.stream.closed
+
+
+def load_publisher(spec: str) -> OutboxPublisher:
+    """Return the built-in publisher named ``spec`` or instantiate ``module:factory``."""
+    builtin = {"memory": InMemoryPublisher, "stdout": StreamPublisher}
+    if spec in builtin:
+        return builtin[spec]()
+    module_name, _, attribute = spec.partition(":")
+    if not attribute:
+        raise ValueError(f"Unknown outbox publisher '{spec}'; use memory, stdout or module:factory.")
+    return getattr(importlib.import_module(module_name), attribute)()
+
+
+class OutboxRelay:
+    """Publishes outbox batches and keeps throughput, failure and lag counters."""
+
+    def __init__(
+        self,
+        publisher: OutboxPublisher,
+        *,
+        batch_size: int = 100,
+        max_attempts: int = 10,
+        max_backoff_seconds: float = 60.0,
+    ) -> None:
+        self.publisher = publisher
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.max_backoff_seconds = max_backoff_seconds
+        self._lock = threading.Lock()
+        self._suspect_id: Optional[int] = None
+        self.failed_rounds = 0
+        self.published_total = 0
+        self.batches_total = 0
+        self.failures_total = 0
+        self.last_publish_lag_seconds = 0.0
+        self.pending = 0
+        self.dead = 0
+        self.oldest_pending_at: Optional[datetime] = None
+
+    def relay_once(self, session: Session) -> int:
+        """Publish the oldest batch, if this relay holds the outbox lock; returns the count."""
+        repository = HypothesisRepository(session)
+        if not repository.lock_outbox():
+            session.rollback()
+            return 0
+        rows = repository.pending_outbox_events(self.batch_size)
+        published: List[HypothesisOutboxEvent] = []
+        failed = False
+        if rows and rows[0].id == self._suspect_id:
+            # The head was in a batch that failed: publish it alone, so a bad event is
+            # told apart from the good ones queued behind it.
+            head = rows[0]
+            if self._publish(rows[:1]):
+                published, self._suspect_id = rows[:1], None
+            else:
+                failed = True
+                # Only a broker that accepts other events is rejecting this one. The
+                # head's own hypothesis stays behind it to keep its events in order.
+                others = [row for row in rows[1:] if row.hyp_id != head.hyp_id]
+                if others:
+                    accepting = self._publish(others)
+                    published = others if accepting else []
+                else:
+                    accepting = self._probe()
+                if accepting:
+                    dead = head.attempts + 1 >= self.max_attempts
+                    repository.record_outbox_attempt(head.id, dead=dead)
+                    if dead:
+                        self._suspect_id = None
+                        logger.error(
+                            "Outbox event %d dead-lettered after %d attempts; later %s events are held",
+                            head.id,
+                            self.max_attempts,
+                            head.hyp_id,
+                        )
+        elif rows:
+            if self._publish(rows):
+                published = rows
+            else:
+                failed, self._suspect_id = True, rows[0].id
+        if published:
+            repository.delete_outbox_events([row.id for row in published])
+        published_at = datetime.now(timezone.utc)
+        pending, oldest, dead_events = repository.outbox_backlog()
+        session.commit()
+
+        with self._lock:
+            self.failed_rounds = self.failed_rounds + 1 if failed else 0
+            if published:
+                self.published_total += len(published)
+                self.batches_total += 1
+                self.last_publish_lag_seconds = (published_at - _aware(published[0].created_at)).total_seconds()
+            self.pending = pending
+            self.dead = dead_events
+            self.oldest_pending_at = _aware(oldest) if oldest is not None else None
+        return len(published)
+
+    def retry_delay(self, poll_seconds: float) -> float:
+        """Seconds to wait before the next round: the poll interval, doubled per failed round."""
+        if not self.failed_rounds:
+            return poll_seconds
+        return min(poll_seconds * 2 ** min(self.failed_rounds, 32), max(self.max_backoff_seconds, poll_seconds))
+
+    def _publish(self, rows: Sequence[HypothesisOutboxEvent]) -> bool:
+        events = [
+            schemas.HypothesisDomainEvent(
+                id=row.id, type=row.event_type, hyp_id=row.hyp_id, occurred_at=_aware(row.occurred_at), data=row.payload
+            )
+            for row in rows
+        ]
+        try:
+            self.publisher.publish(events)
+        except Exception:
+            with self._lock:
+                self.failures_total += 1
+            logger.exception("Publishing %d outbox events to %s failed", len(events), self.publisher.name)
+            return False
+        return True
+
+    def _probe(self) -> bool:
+        try:
+            return self.publisher.probe()
+        except Exception:
+            logger.exception("Probing %s failed", self.publisher.name)
+            return False
+
+    async def run(self, *, poll_seconds: float) -> None:
+        """Relay until cancelled, draining full batches back to back and backing off after failures."""
+        while True:
+            try:
+                published = await self._relay_once_async()
+            except Exception:
+                logger.exception("Outbox relay round failed")
+                published = 0
+            if published < self.batch_size:
+                await asyncio.sleep(self.retry_delay(poll_seconds))
+
+    async def _relay_once_async(self) -> int:
+        if get_settings().database_async:
+            get_async_engine()
+            async with AsyncSessionLocal() as session:
+                return await session.run_sync(self.relay_once)
+
+        def relay() -> int:
+            with SessionLocal() as session:
+                return self.relay_once(session)
+
+        get_engine()
+        return await run_in_threadpool(relay)
+
+    def stats(self) -> schemas.OutboxStats:
+        with self._lock:
+            oldest = (
+                (datetime.now(timezone.utc) - self.oldest_pending_at).total_seconds()
+                if self.oldest_pending_at is not None
+                else 0.0
+            )
+            return schemas.OutboxStats(
+                publisher=self.publisher.name,
+                pending=self.pending,
+                dead=self.dead,
+                oldest_pending_seconds=round(max(oldest, 0.0), 6),
+                published_total=self.published_total,
+                batches_total=self.batches_total,
+                failures_total=self.failures_total,
+                last_publish_lag_seconds=round(self.last_publish_lag_seconds, 6),
+            )
+
+
+def _aware(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+outbox_relay: Optional[OutboxRelay] = None
+
+
+def configure_outbox_relay(settings: HypothesisSettings) -> OutboxRelay:
+    """Create the in-process relay whose counters ``/metrics`` reports."""
+    global outbox_relay
+    outbox_relay = OutboxRelay(
+        load_publisher(settings.outbox_publisher),
+        batch_size=settings.outbox_batch_size,
+        max_attempts=settings.outbox_max_attempts,
+        max_backoff_seconds=settings.outbox_max_backoff_seconds,
+    )
+    return outbox_relay
+
+
+def current_outbox_relay() -> Optional[OutboxRelay]:
+    """Return the in-process relay, or ``None`` when this process does not run one."""
+    return outbox_relay
+
+
+def reset_outbox_relay() -> None:
+    global outbox_relay
+    outbox_relay = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="defaults to HYPOTHESIS_DATABASE_URL")
+    parser.add_argument("--publisher", help="memory, stdout or module:factory; defaults to HYPOTHESIS_OUTBOX_PUBLISHER")
+    parser.add_argument("--batch-size", type=int, help="defaults to HYPOTHESIS_OUTBOX_BATCH_SIZE")
+    parser.add_argument("--poll-seconds", type=float, help="defaults to HYPOTHESIS_OUTBOX_POLL_SECONDS")
+    parser.add_argument("--max-attempts", type=int, help="defaults to HYPOTHESIS_OUTBOX_MAX_ATTEMPTS")
+    parser.add_argument("--max-backoff-seconds", type=float, help="defaults to HYPOTHESIS_OUTBOX_MAX_BACKOFF_SECONDS")
+    parser.add_argument("--once", action="store_true", help="drain the outbox and exit")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    relay = OutboxRelay(
+        load_publisher(args.publisher or settings.outbox_publisher),
+        batch_size=args.batch_size or settings.outbox_batch_size,
+        max_attempts=args.max_attempts or settings.outbox_max_attempts,
+        max_backoff_seconds=args.max_backoff_seconds or settings.outbox_max_backoff_seconds,
+    )
+    engine = create_engine(args.database_url or settings.database_url)
+    try:
+        while True:
+            with Session(engine) as session:
+                published = relay.relay_once(session)
+            if published:
+                stats = relay.stats()
+                logger.info(
+                    "published %d, pending %d, lag %.3fs", published, stats.pending, stats.last_publish_lag_seconds
+                )
+            if published < relay.batch_size:
+                if args.once:
+                    break
+                time.sleep(relay.retry_delay(args.poll_seconds or settings.outbox_poll_seconds))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
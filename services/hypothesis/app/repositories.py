@@ -1,24 +1,247 @@
 from __future__ import annotations
 
+import base64
+import json
 import re
-from datetime import datetime, timezone
-from typing import Iterable, List, Optional
+from datetime import datetime, timedelta, timezone
+from itertools import chain
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, get_args
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import (
+    and_,
+    bindparam,
+    case,
+    cast,
+    column,
+    delete,
+    exists,
+    func,
+    insert,
+    inspect,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    union_all,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, raiseload, selectinload
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from . import schemas
 from .models import (
     HypothesisActivityEvent,
+    HypothesisApproval,
     HypothesisAttachment,
     HypothesisChecklistItem,
     HypothesisComment,
+    HypothesisDashboardSnapshot,
+    HypothesisIdSequence,
+    HypothesisOutboxEvent,
     HypothesisRecord,
     HypothesisStageHistoryEntry,
     HypothesisTask,
+    READY_FOR_NEXT_GATE,
+    SEARCH_TS_CONFIG,
+    SQLITE_SEARCH_TABLE,
 )
 
 HYP_ID_PATTERN = re.compile(r"^HYP-(\d+)$")
+HYP_ID_SEQUENCE = "hyp_id"
+DASHBOARD_SNAPSHOT_KEY = "portfolio"
+# Postgres advisory lock key held by the outbox relay that is publishing.
+OUTBOX_LOCK_KEY = 0x48595042
+
+LIST_SORT_COLUMNS = {
+    "createdAt": HypothesisRecord.created_at,
+    "updatedAt": HypothesisRecord.updated_at,
+    "title": HypothesisRecord.title,
+    "hypId": HypothesisRecord.hyp_id,
+    "impactScore": HypothesisRecord.impact_score,
+    "feasibilityScore": HypothesisRecord.feasibility_score,
+    "confidenceScore": HypothesisRecord.confidence_score,
+}
+_DATETIME_SORT_KEYS = {"createdAt", "updatedAt", "occurredAt"}
+
+# Named eager-loading profiles: each read path loads exactly the relationships its
+# serializer touches. Anything else raises instead of issuing a surprise query.
+LOAD_PROFILES: dict[str, tuple[LoaderOption, ...]] = {
+    "light": (raiseload("*"),),
+    # Scalar columns only, which includes the JSON read model; collections load on
+    # first access for the mutation that needs them.
+    "record": (),
+    "detail": (
+        selectinload(HypothesisRecord.stage_history_entries),
+        selectinload(HypothesisRecord.checklist_items),
+        selectinload(HypothesisRecord.task_records),
+        selectinload(HypothesisRecord.attachment_records),
+        selectinload(HypothesisRecord.approval_records),
+        selectinload(HypothesisRecord.activity_events),
+        selectinload(HypothesisRecord.comment_threads).selectinload(HypothesisComment.replies),
+    ),
+}
+
+# Bump whenever the shape of a read-model section changes; stale rows fall back to the
+# child tables on read and are fully re-rendered on their next write.
+READ_MODEL_VERSION = 2
+# Newest activity events kept in the digest; older history is paged from the table.
+ACTIVITY_DIGEST_LIMIT = 25
+
+# Read-model JSON column -> (relationship it is rendered from, child model).
+READ_MODEL_SECTIONS: dict[str, tuple[str, type]] = {
+    "stage_history": ("stage_history_entries", HypothesisStageHistoryEntry),
+    "gating_checklist": ("checklist_items", HypothesisChecklistItem),
+    "attachments": ("attachment_records", HypothesisAttachment),
+    "approvals": ("approval_records", HypothesisApproval),
+    "comments": ("comment_threads", HypothesisComment),
+    "tasks": ("task_records", HypothesisTask),
+    "activity_digest": ("activity_events", HypothesisActivityEvent),
+}
+# Sections whose rows are only ever appended, so pending rows can be merged into the
+# stored JSON without loading the whole collection.
+_APPEND_ONLY_SECTIONS = {"stage_history", "activity_digest"}
+_SECTION_BY_MODEL = {model: section for section, (_, model) in READ_MODEL_SECTIONS.items()}
+# Scalar columns ``upsert_many`` overwrites on existing rows. Read-model sections and
+# the gate readiness derived from them stay as rendered from the child tables, which
+# the bulk path does not touch.
+_GATE_COLUMNS = ("next_gate", "incomplete_checklist_count", "pending_approval_count")
+_UPSERT_COLUMNS = tuple(
+    attribute.key
+    for attribute in HypothesisRecord.__mapper__.column_attrs
+    if attribute.key
+    not in {
+        "id",
+        "hyp_id",
+        "version",
+        "created_at",
+        "read_model_version",
+        "search_document",
+        *READ_MODEL_SECTIONS,
+        *_GATE_COLUMNS,
+    }
+)
+# Core inserts take column keys, which differ from attribute names (``task_type``).
+_CHILD_COLUMN_KEYS = {
+    model: {attribute.key: attribute.columns[0].key for attribute in model.__mapper__.column_attrs}
+    for _, model in READ_MODEL_SECTIONS.values()
+}
+# Per model: (attribute, column default) for every column a bulk row may omit.
+# Columns without a default are nullable ones and are filled with ``None``.
+_BULK_DEFAULTS = {
+    model: [
+        (attribute.key, attribute.columns[0].default)
+        for attribute in model.__mapper__.column_attrs
+        if attribute.columns[0].default is not None
+        or (attribute.columns[0].nullable and not attribute.columns[0].primary_key)
+    ]
+    for model in (HypothesisRecord, *(model for _, model in READ_MODEL_SECTIONS.values()))
+}
+
+# Checklist items surface as dashboard tasks: due within this window means "due-soon".
+TASK_DUE_SOON = timedelta(days=3)
+# Checklist statuses that satisfy a stage gate.
+COMPLETE_CHECKLIST_STATUSES = ("complete", "done")
+# Gate a hypothesis passes to leave each stage.
+NEXT_STAGE_GATE = {
+    "IDEATION": "SCOPING_KICKOFF",
+    "SCOPING": "PRIORITIZATION_REVIEW",
+    "PRIORITIZATION": "EXPERIMENT_KICKOFF",
+    "EXPERIMENTATION": "EVALUATION_GATE",
+    "EVALUATION": "SCALING_KICKOFF",
+    "SCALING": "PRODUCTION_ROLLOUT",
+    "PRODUCTION": None,
+}
+
+_ACTIVITY_TYPES = {
+    "CREATED",
+    "UPDATED",
+    "STAGE_CHANGED",
+    "COMMENTED",
+    "APPROVED",
+    "REJECTED",
+    "ATTACHMENT_ADDED",
+}
+
+
+def _timestamp_key(value: Any) -> datetime:
+    """Sort key for timestamps stored either as datetimes or ISO strings."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value is None:
+        return datetime.min.replace(tzinfo=timezone.utc)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def render_search_document(record: HypothesisRecord, comments: Optional[List[dict]] = None) -> str:
+    """Concatenate the searchable text of a hypothesis: title, statement, description,
+    tags and every comment body, taken from the rendered ``comments`` section."""
+    parts = [record.title, record.statement, record.description, " ".join(record.tags or [])]
+    pending = list(record.comments if comments is None else comments)
+    while pending:
+        comment = pending.pop(0)
+        parts.append(comment.get("body"))
+        pending.extend(comment.get("replies") or [])
+    return "\n".join(part for part in parts if part)
+
+
+def promoted_columns(record: HypothesisRecord) -> dict:
+    """Numeric columns derived from the record's JSON estimates for SQL aggregation."""
+    production_weeks = (record.time_estimate or {}).get("production_weeks")
+    return {
+        "portfolio_value": float((record.roi_estimate or {}).get("one_time_cost") or 0),
+        "experiment_count": len(record.linked_experiments or []),
+        "production_weeks": int(production_weeks) if production_weeks is not None else None,
+    }
+
+
+def gate_columns(record: HypothesisRecord) -> dict:
+    """Gate readiness counted from the rendered checklist and approvals sections."""
+    return {
+        "next_gate": NEXT_STAGE_GATE.get(record.stage),
+        "incomplete_checklist_count": sum(
+            1 for item in record.gating_checklist or [] if item.get("status") not in COMPLETE_CHECKLIST_STATUSES
+        ),
+        "pending_approval_count": sum(
+            1
+            for approval in record.approvals or []
+            if approval.get("required") and approval.get("status") != "approved"
+        ),
+    }
+
+
+def encode_list_cursor(sort: str, value: Any, row_id: int | str) -> str:
+    """Encode a keyset position as an opaque URL-safe token."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([sort, value, row_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_list_cursor(token: str, sort: str) -> tuple[Any, int | str]:
+    """Decode a keyset token produced by :func:`encode_list_cursor`.
+
+    Raises ``ValueError`` when the token is malformed or was issued for another sort key.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        cursor_sort, value, row_id = json.loads(raw)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Malformed cursor.") from exc
+    if cursor_sort != sort or not isinstance(row_id, (int, str)):
+        raise ValueError("Cursor does not match the requested sort order.")
+    if sort in _DATETIME_SORT_KEYS:
+        value = HypothesisRepository._ensure_aware(value)
+        if value is None:
+            raise ValueError("Malformed cursor.")
+    return value, row_id
 
 
 class HypothesisRepository:
@@ -48,63 +271,528 @@ class HypothesisRepository:
             return candidate.replace(tzinfo=timezone.utc)
         return candidate.astimezone(timezone.utc)
 
-    def list(self) -> List[HypothesisRecord]:
+    def list(self, profile: str = "record") -> List[HypothesisRecord]:
         """Return active (non-archived) hypotheses ordered by creation date."""
         stmt = (
             select(HypothesisRecord)
             .where(HypothesisRecord.archived_at.is_(None))
-            .options(
-                selectinload(HypothesisRecord.stage_history_entries),
-                selectinload(HypothesisRecord.checklist_items),
-                selectinload(HypothesisRecord.task_records),
-                selectinload(HypothesisRecord.attachment_records),
-                selectinload(HypothesisRecord.approval_records),
-                selectinload(HypothesisRecord.activity_events),
-            )
+            .options(*LOAD_PROFILES[profile])
             .order_by(HypothesisRecord.created_at.desc())
         )
         return list(self.session.scalars(stmt))
 
-    def list_all(self) -> List[HypothesisRecord]:
-        """Return all hypotheses including archived ones."""
+    def has_any(self) -> bool:
+        return self.session.scalar(select(exists().where(HypothesisRecord.id.is_not(None)))) or False
+
+    def list_page(
+        self,
+        filters: schemas.HypothesisListFilters,
+        *,
+        sort: str,
+        descending: bool,
+        after: tuple[Any, int] | None,
+        limit: int,
+    ) -> Sequence[Row]:
+        """Return one keyset page of active hypotheses as column-projected rows.
+
+        No ORM entities or relationships are loaded, so the cost of a page depends on
+        ``limit`` rather than on the size of the portfolio.
+        """
+        sort_column = LIST_SORT_COLUMNS[sort]
+        stmt = select(
+            HypothesisRecord.id,
+            HypothesisRecord.hyp_id,
+            HypothesisRecord.title,
+            HypothesisRecord.stage,
+            HypothesisRecord.owners,
+            HypothesisRecord.next_gate,
+            READY_FOR_NEXT_GATE.label("ready_for_next_gate"),
+            sort_column.label("sort_value"),
+        ).where(HypothesisRecord.archived_at.is_(None))
+        stmt = self._apply_list_filters(stmt, filters)
+
+        # Ties are always broken by insertion order so pages stay stable in both directions.
+        if after is not None:
+            value, row_id = after
+            beyond = sort_column < value if descending else sort_column > value
+            stmt = stmt.where(
+                or_(beyond, and_(sort_column == value, HypothesisRecord.id > row_id))
+            )
+
+        stmt = stmt.order_by(
+            sort_column.desc() if descending else sort_column.asc(), HypothesisRecord.id.asc()
+        )
+        return self.session.execute(stmt.limit(limit)).all()
+
+    def search(
+        self,
+        terms: Sequence[str],
+        filters: schemas.HypothesisListFilters,
+        *,
+        hyp_id_prefix: Optional[str] = None,
+        limit: int,
+    ) -> Sequence[Row]:
+        """Return active hypotheses matching every term as a word prefix, best first.
+
+        Postgres matches the tsvector expression index and, for typos, trigram
+        similarity on the title, ranking by ``ts_rank_cd`` plus that similarity.
+        SQLite matches the FTS5 table and ranks by ``bm25``. Without terms the rows
+        come back newest first.
+        """
+        stmt = select(
+            HypothesisRecord.id,
+            HypothesisRecord.hyp_id,
+            HypothesisRecord.title,
+            HypothesisRecord.stage,
+            HypothesisRecord.owners,
+            HypothesisRecord.next_gate,
+            READY_FOR_NEXT_GATE.label("ready_for_next_gate"),
+            HypothesisRecord.lab_id,
+        ).where(HypothesisRecord.archived_at.is_(None))
+        stmt = self._apply_list_filters(stmt, filters)
+        if hyp_id_prefix:
+            stmt = stmt.where(HypothesisRecord.hyp_id.startswith(hyp_id_prefix, autoescape=True))
+
+        if not terms:
+            score = literal(0.0)
+        elif self._is_postgres():
+            vector = func.to_tsvector(SEARCH_TS_CONFIG, HypothesisRecord.search_document)
+            query = func.to_tsquery(SEARCH_TS_CONFIG, " & ".join(f"{term}:*" for term in terms))
+            phrase = " ".join(terms)
+            stmt = stmt.where(or_(vector.op("@@")(query), HypothesisRecord.title.op("%")(phrase)))
+            score = func.ts_rank_cd(vector, query) + func.similarity(HypothesisRecord.title, phrase)
+        else:
+            index = table(SQLITE_SEARCH_TABLE, column("rowid"))
+            match = " ".join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+            stmt = stmt.join(index, index.c.rowid == HypothesisRecord.id).where(
+                literal_column(SQLITE_SEARCH_TABLE).op("MATCH")(match)
+            )
+            # bm25() is lower-is-better.
+            score = -func.bm25(literal_column(SQLITE_SEARCH_TABLE))
+
+        stmt = stmt.add_columns(score.label("score")).order_by(
+            literal_column("score").desc(), HypothesisRecord.created_at.desc(), HypothesisRecord.id.asc()
+        )
+        return self.session.execute(stmt.limit(limit)).all()
+
+    def dashboard_summary_rows(self, stages: Sequence[str], limit: int) -> Sequence[Row]:
+        """Project the summary-card columns of the ``limit`` newest active hypotheses per stage.
+
+        Each stage is its own limited branch of a ``UNION ALL``, read in order from the
+        ``(stage, created_at)`` partial index, so the rows fetched are bounded by
+        ``len(stages) * limit`` however large the portfolio grows.
+        """
+        branches = [
+            select(
+                HypothesisRecord.id,
+                HypothesisRecord.hyp_id,
+                HypothesisRecord.title,
+                HypothesisRecord.stage,
+                HypothesisRecord.owners,
+                HypothesisRecord.impact_score,
+                HypothesisRecord.feasibility_score,
+                HypothesisRecord.confidence_score,
+                HypothesisRecord.tags,
+                HypothesisRecord.priority,
+                HypothesisRecord.next_gate,
+                READY_FOR_NEXT_GATE.label("ready_for_next_gate"),
+                HypothesisRecord.created_at,
+                HypothesisRecord.updated_at,
+            )
+            .where(HypothesisRecord.archived_at.is_(None), HypothesisRecord.stage == stage)
+            .order_by(HypothesisRecord.created_at.desc(), HypothesisRecord.id.asc())
+            .limit(limit)
+            .subquery()
+            for stage in stages
+        ]
+        cards = union_all(*(select(branch) for branch in branches)).subquery()
+        stmt = select(cards).order_by(cards.c.created_at.desc(), cards.c.id.asc())
+        return self.session.execute(stmt).all()
+
+    def dashboard_stage_counts(self) -> Dict[str, int]:
+        """Count active hypotheses per stage."""
+        stmt = (
+            select(HypothesisRecord.stage, func.count())
+            .where(HypothesisRecord.archived_at.is_(None))
+            .group_by(HypothesisRecord.stage)
+        )
+        return {stage: count for stage, count in self.session.execute(stmt)}
+
+    def dashboard_highlight_totals(self) -> Row:
+        """Aggregate the dashboard highlight figures over active hypotheses in one query."""
+        stmt = select(
+            func.count().label("hypotheses"),
+            func.coalesce(func.sum(HypothesisRecord.portfolio_value), 0).label("portfolio_value"),
+            func.coalesce(func.sum(HypothesisRecord.experiment_count), 0).label("experiments"),
+            func.count().filter(HypothesisRecord.governance_state == "PENDING").label("governance_pending"),
+            func.sum(HypothesisRecord.production_weeks).label("production_weeks"),
+            func.count(HypothesisRecord.production_weeks).label("estimated"),
+        ).where(HypothesisRecord.archived_at.is_(None))
+        return self.session.execute(stmt).one()
+
+    def dashboard_task_rows(self, now: datetime, limit: int) -> Sequence[Row]:
+        """Return the ``limit`` dashboard tasks due soonest across active hypotheses.
+
+        Tasks come from task rows and from incomplete checklist items, whose status,
+        severity and type are derived from the due date and label in SQL. Rows without
+        a due date fall back to their hypothesis' ``updated_at``. Each source is read by
+        its own ordered, limited branch that stops after ``limit`` index entries, and
+        the union of those few rows is ordered once more.
+        """
+        hypothesis, task, item = HypothesisRecord, HypothesisTask, HypothesisChecklistItem
+        active = hypothesis.archived_at.is_(None)
+        branches = []
+        for dated in (True, False):
+            due = task.due if dated else hypothesis.updated_at
+            branches.append(
+                select(
+                    task.id.label("id"),
+                    task.label.label("label"),
+                    func.coalesce(
+                        func.nullif(task.owner_name, ""), func.nullif(task.owner_email, ""), "Unassigned"
+                    ).label("owner"),
+                    due.label("due"),
+                    case(
+                        (task.task_type.in_(get_args(schemas.TaskTypeLiteral)), task.task_type), else_="governance"
+                    ).label("type"),
+                    case(
+                        (task.status.in_(get_args(schemas.TaskStatusLiteral)), task.status), else_="due-soon"
+                    ).label("status"),
+                    case(
+                        (task.severity.in_(get_args(schemas.TaskSeverityLiteral)), task.severity), else_="medium"
+                    ).label("severity"),
+                    func.coalesce(task.related_stage, hypothesis.stage).label("related_stage"),
+                )
+                .join(hypothesis, task.hypothesis_id == hypothesis.id)
+                .where(active, task.due.is_not(None) if dated else task.due.is_(None))
+                .order_by(due, task.id)
+                .limit(limit)
+            )
+
+            due = item.due_at if dated else hypothesis.updated_at
+            label = func.lower(item.label)
+            overdue, soon = due < now, due < now + TASK_DUE_SOON
+            blocked = label.contains("approval")
+            branches.append(
+                select(
+                    (hypothesis.hyp_id + "-" + item.id).label("id"),
+                    func.coalesce(func.nullif(item.label, ""), "Checklist item").label("label"),
+                    func.coalesce(
+                        func.nullif(item.owner_name, ""),
+                        func.nullif(item.owner_email, ""),
+                        hypothesis.owners[(0, "name")].as_string(),
+                        "Unassigned",
+                    ).label("owner"),
+                    due.label("due"),
+                    case(
+                        (label.contains("data"), "data"),
+                        (or_(label.contains("approval"), label.contains("approve")), "approval"),
+                        else_="governance",
+                    ).label("type"),
+                    case((overdue, "at-risk"), (soon, "due-soon"), (blocked, "blocked"), else_="due-soon").label(
+                        "status"
+                    ),
+                    case((overdue, "critical"), (soon, "medium"), (blocked, "high"), else_="medium").label(
+                        "severity"
+                    ),
+                    hypothesis.stage.label("related_stage"),
+                )
+                .join(hypothesis, item.hypothesis_id == hypothesis.id)
+                .where(
+                    active,
+                    item.status != "complete",
+                    item.due_at.is_not(None) if dated else item.due_at.is_(None),
+                )
+                .order_by(due, item.id)
+                .limit(limit)
+            )
+
+        merged = union_all(*(select(branch.subquery()) for branch in branches)).subquery()
+        stmt = select(merged).order_by(merged.c.due, merged.c.id).limit(limit)
+        return self.session.execute(stmt).all()
+
+    def dashboard_activity_rows(self, limit: int) -> Sequence[Row]:
+        """Return the newest ``limit`` activity events of active hypotheses.
+
+        Walks the ``occurred_at`` index newest first and stops after ``limit`` matches.
+        """
+        event = HypothesisActivityEvent
+        stmt = (
+            select(
+                event.id,
+                event.event_type,
+                event.title,
+                event.actor_name,
+                event.detail,
+                event.occurred_at,
+                func.coalesce(event.stage, HypothesisRecord.stage).label("stage"),
+                event.impact,
+            )
+            .join(HypothesisRecord, event.hypothesis_id == HypothesisRecord.id)
+            .where(HypothesisRecord.archived_at.is_(None))
+            .order_by(event.occurred_at.desc(), event.id.asc())
+            .limit(limit)
+        )
+        return self.session.execute(stmt).all()
+
+    def activity_position(self, event_id: str) -> Optional[Row]:
+        """Return the ``(occurred_at, id)`` keyset position of an activity event."""
+        event = HypothesisActivityEvent
+        return self.session.execute(select(event.occurred_at, event.id).where(event.id == event_id)).first()
+
+    def change_rows_after(
+        self, after: tuple[datetime, str], *, hyp_id: Optional[str] = None, limit: int
+    ) -> Sequence[Row]:
+        """Return activity events after a keyset position, oldest first, for feed replay.
+
+        Archived hypotheses are included: their archival is a change like any other.
+        """
+        event = HypothesisActivityEvent
+        occurred_at, event_id = after
+        stmt = (
+            select(
+                event.id,
+                event.event_type,
+                event.title,
+                event.actor_name,
+                event.detail,
+                event.occurred_at,
+                func.coalesce(event.stage, HypothesisRecord.stage).label("stage"),
+                event.impact,
+                HypothesisRecord.hyp_id,
+            )
+            .join(HypothesisRecord, event.hypothesis_id == HypothesisRecord.id)
+            .where(or_(event.occurred_at > occurred_at, and_(event.occurred_at == occurred_at, event.id > event_id)))
+            .order_by(event.occurred_at.asc(), event.id.asc())
+            .limit(limit)
+        )
+        if hyp_id is not None:
+            stmt = stmt.where(HypothesisRecord.hyp_id == hyp_id)
+        return self.session.execute(stmt).all()
+
+    def new_activity_events(self) -> List[HypothesisActivityEvent]:
+        """Activity events added in this unit of work; call before flushing."""
+        return [item for item in self.session.new if isinstance(item, HypothesisActivityEvent)]
+
+    def latest_active_record(self) -> Optional[HypothesisRecord]:
+        """Return the most recently updated active hypothesis."""
         stmt = (
             select(HypothesisRecord)
-            .options(
-                selectinload(HypothesisRecord.stage_history_entries),
-                selectinload(HypothesisRecord.checklist_items),
-                selectinload(HypothesisRecord.task_records),
-                selectinload(HypothesisRecord.attachment_records),
-                selectinload(HypothesisRecord.approval_records),
-                selectinload(HypothesisRecord.activity_events),
+            .where(HypothesisRecord.archived_at.is_(None))
+            .order_by(HypothesisRecord.updated_at.desc(), HypothesisRecord.id.asc())
+            .limit(1)
+        )
+        return self.session.scalar(stmt)
+
+    def _apply_list_filters(self, stmt, filters: schemas.HypothesisListFilters):
+        if filters.stage:
+            stmt = stmt.where(HypothesisRecord.stage == filters.stage)
+        if filters.lab_id:
+            stmt = stmt.where(HypothesisRecord.lab_id == filters.lab_id)
+        if filters.priority:
+            stmt = stmt.where(HypothesisRecord.priority == filters.priority)
+        if filters.risk_class:
+            stmt = stmt.where(HypothesisRecord.risk_class == filters.risk_class)
+        if filters.tag:
+            stmt = stmt.where(self._json_array_contains(HypothesisRecord.tags, filters.tag))
+        if filters.owner:
+            stmt = stmt.where(self._actor_matches(HypothesisRecord.owners, filters.owner))
+        if filters.ready_for_next_gate is not None:
+            stmt = stmt.where(READY_FOR_NEXT_GATE if filters.ready_for_next_gate else ~READY_FOR_NEXT_GATE)
+        return stmt
+
+    def _is_postgres(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    def _json_array_contains(self, column, value: str):
+        if self._is_postgres():
+            return cast(column, JSONB).contains([value])
+        elements = func.json_each(column).table_valued("value").alias()
+        return exists(select(literal(1)).select_from(elements).where(elements.c.value == value))
+
+    def _actor_matches(self, column, name_or_email: str):
+        if self._is_postgres():
+            as_jsonb = cast(column, JSONB)
+            return or_(
+                as_jsonb.contains([{"name": name_or_email}]),
+                as_jsonb.contains([{"email": name_or_email}]),
+            )
+        elements = func.json_each(column).table_valued("value").alias()
+        return exists(
+            select(literal(1))
+            .select_from(elements)
+            .where(
+                or_(
+                    func.json_extract(elements.c.value, "$.name") == name_or_email,
+                    func.json_extract(elements.c.value, "$.email") == name_or_email,
+                )
             )
+        )
+
+    def stream_active(
+        self, filters: schemas.HypothesisListFilters, *, batch_size: int
+    ) -> Iterator[List[HypothesisRecord]]:
+        """Yield active hypotheses in insertion order, ``batch_size`` records at a time.
+
+        Rows are fetched through a server-side cursor where the driver supports one,
+        and each batch is expunged once the caller moves on, so memory is bounded by
+        the batch rather than by the size of the export.
+        """
+        stmt = (
+            select(HypothesisRecord)
+            .where(HypothesisRecord.archived_at.is_(None))
+            .order_by(HypothesisRecord.id)
+            .execution_options(yield_per=batch_size)
+        )
+        stmt = self._apply_list_filters(stmt, filters)
+        for batch in self.session.scalars(stmt).partitions():
+            yield batch
+            for record in batch:
+                self.session.expunge(record)
+
+    def list_all(self, profile: str = "record") -> List[HypothesisRecord]:
+        """Return all hypotheses including archived ones."""
+        stmt = (
+            select(HypothesisRecord)
+            .options(*LOAD_PROFILES[profile])
             .order_by(HypothesisRecord.created_at.desc())
         )
         return list(self.session.scalars(stmt))
 
-    def get_by_hyp_id(self, hyp_id: str) -> Optional[HypothesisRecord]:
+    def get_by_hyp_id(self, hyp_id: str, profile: str = "record") -> Optional[HypothesisRecord]:
         stmt = (
             select(HypothesisRecord)
             .where(HypothesisRecord.hyp_id == hyp_id)
-            .options(
-                selectinload(HypothesisRecord.stage_history_entries),
-                selectinload(HypothesisRecord.checklist_items),
-                selectinload(HypothesisRecord.task_records),
-                selectinload(HypothesisRecord.attachment_records),
-                selectinload(HypothesisRecord.approval_records),
-                selectinload(HypothesisRecord.activity_events),
-                selectinload(HypothesisRecord.comment_threads).selectinload(
-                    HypothesisComment.replies
-                ),
-            )
+            .options(*LOAD_PROFILES[profile])
         )
         return self.session.scalar(stmt)
 
+    def get_active_version(self, hyp_id: str) -> Optional[int]:
+        """Return the version of an active hypothesis without loading the row."""
+        return self.session.scalar(
+            select(HypothesisRecord.version).where(
+                HypothesisRecord.hyp_id == hyp_id, HypothesisRecord.archived_at.is_(None)
+            )
+        )
+
+    def get_many_by_hyp_ids(
+        self, hyp_ids: Iterable[str], profile: str = "record"
+    ) -> dict[str, HypothesisRecord]:
+        """Load several hypotheses with one ``IN`` query, keyed by ``hyp_id``."""
+        wanted = set(hyp_ids)
+        if not wanted:
+            return {}
+        stmt = (
+            select(HypothesisRecord)
+            .where(HypothesisRecord.hyp_id.in_(wanted))
+            .options(*LOAD_PROFILES[profile])
+        )
+        return {record.hyp_id: record for record in self.session.scalars(stmt)}
+
+    def transition_gate_rows(self, hyp_ids: Iterable[str]) -> dict[str, Row]:
+        """Load what a stage transition needs for many active hypotheses with one query.
+
+        Gates are checked against the stored readiness columns, so no child collection
+        is loaded. Keyed by ``hyp_id``.
+        """
+        wanted = set(hyp_ids)
+        if not wanted:
+            return {}
+        stmt = select(
+            HypothesisRecord.id,
+            HypothesisRecord.hyp_id,
+            HypothesisRecord.title,
+            HypothesisRecord.lab_id,
+            HypothesisRecord.stage,
+            HypothesisRecord.version,
+            HypothesisRecord.read_model_version,
+            HypothesisRecord.stage_history,
+            HypothesisRecord.activity_digest,
+            HypothesisRecord.incomplete_checklist_count,
+            HypothesisRecord.pending_approval_count,
+        ).where(HypothesisRecord.hyp_id.in_(wanted), HypothesisRecord.archived_at.is_(None))
+        return {row.hyp_id: row for row in self.session.execute(stmt)}
+
+    def gate_blockers(self, record_ids: Iterable[int]) -> dict[int, tuple[List[str], List[str]]]:
+        """Name the incomplete checklist items and pending required approvers of many hypotheses.
+
+        Only called for moves the readiness columns already rejected, so the names cost
+        one query per rejected batch. Keyed by record id as ``(checklist, approvers)``.
+        """
+        wanted = set(record_ids)
+        if not wanted:
+            return {}
+        checklist = select(
+            HypothesisChecklistItem.hypothesis_id,
+            literal("checklist").label("kind"),
+            HypothesisChecklistItem.label.label("name"),
+            HypothesisChecklistItem.created_at,
+        ).where(
+            HypothesisChecklistItem.hypothesis_id.in_(wanted),
+            HypothesisChecklistItem.status.not_in(COMPLETE_CHECKLIST_STATUSES),
+        )
+        approvals = select(
+            HypothesisApproval.hypothesis_id,
+            literal("approval").label("kind"),
+            HypothesisApproval.approver_name.label("name"),
+            HypothesisApproval.created_at,
+        ).where(
+            HypothesisApproval.hypothesis_id.in_(wanted),
+            HypothesisApproval.required.is_(True),
+            HypothesisApproval.status != "approved",
+        )
+        blockers = union_all(checklist, approvals).subquery()
+        stmt = select(blockers.c.hypothesis_id, blockers.c.kind, blockers.c.name).order_by(
+            blockers.c.hypothesis_id, blockers.c.created_at
+        )
+        result: dict[int, tuple[List[str], List[str]]] = {record_id: ([], []) for record_id in wanted}
+        for row in self.session.execute(stmt):
+            result[row.hypothesis_id][0 if row.kind == "checklist" else 1].append(row.name)
+        return result
+
     def save(self, record: HypothesisRecord) -> HypothesisRecord:
+        """Commit the record; loaded attributes stay valid for rendering the response."""
         self.session.add(record)
         self.session.commit()
-        self.session.refresh(record)
         return record
 
+    def flush(self, *records: HypothesisRecord) -> None:
+        """Flush pending changes so generated identifiers are available before commit."""
+        self.session.add_all(records)
+        self.session.flush()
+
+    def commit(self) -> None:
+        self.session.commit()
+
+    def get_dashboard_snapshot(self, *, for_update: bool = False) -> Optional[HypothesisDashboardSnapshot]:
+        stmt = select(HypothesisDashboardSnapshot).where(
+            HypothesisDashboardSnapshot.key == DASHBOARD_SNAPSHOT_KEY
+        )
+        if for_update:
+            stmt = stmt.with_for_update()
+        return self.session.scalar(stmt)
+
+    def save_dashboard_snapshot(
+        self,
+        *,
+        focus_hyp_id: str | None,
+        focus_detail: dict | None,
+        snapshot: HypothesisDashboardSnapshot | None = None,
+    ) -> HypothesisDashboardSnapshot:
+        """Create or update the dashboard row, bumping its version, within the current transaction.
+
+        Pass an already locked ``snapshot`` to avoid selecting it a second time.
+        """
+        if snapshot is None:
+            snapshot = self.get_dashboard_snapshot(for_update=True)
+        if snapshot is None:
+            snapshot = HypothesisDashboardSnapshot(key=DASHBOARD_SNAPSHOT_KEY, version=0)
+            self.session.add(snapshot)
+        snapshot.version = (snapshot.version or 0) + 1
+        snapshot.focus_hyp_id = focus_hyp_id
+        snapshot.focus_detail = focus_detail
+        return snapshot
+
     def remove(self, record: HypothesisRecord) -> None:
         self.session.delete(record)
         self.session.commit()
@@ -128,7 +816,8 @@ class HypothesisRepository:
             changed_by=changed_by,
             notes=notes,
         )
-        record.stage_history_entries.append(entry)
+        # The backref queues the entry on an unloaded collection without fetching it.
+        self.session.add(entry)
         return entry
 
     def log_activity_event(
@@ -158,10 +847,11 @@ class HypothesisRepository:
             extra_metadata=extra_metadata or {},
             occurred_at=aware_occurred_at,
         )
-        record.activity_events.append(event)
+        self.session.add(event)
         return event
 
     def _comment_to_dict(self, comment: HypothesisComment) -> dict:
+        self._prime_defaults(comment)
         return {
             "id": comment.id,
             "author": comment.author_name,
@@ -174,150 +864,256 @@ class HypothesisRepository:
         }
 
     def record_to_detail(self, record: HypothesisRecord) -> schemas.HypothesisDetail:
+        """Serve the detail view from the JSON read model stored on the record.
+
+        Rows still on an older read-model layout are rendered from the child tables.
+        """
         payload = record.as_dict()
+        if record.read_model_version != READ_MODEL_VERSION:
+            for section in READ_MODEL_SECTIONS:
+                payload[section] = self._render_section(record, section, incremental=False)
+        return schemas.HypothesisDetail.model_validate(payload)
 
-        existing_history: List[dict] = [
-            {
-                "stage": item.get("stage"),
-                "changed_at": self._ensure_aware(item.get("changed_at")),
-                "changed_by": item.get("changed_by"),
-                "notes": item.get("notes"),
-            }
-            for item in payload.get("stage_history", [])
-        ]
+    def refresh_read_model(self, record: HypothesisRecord) -> List[str]:
+        """Re-render the read-model sections invalidated by the pending changes.
+
+        Call before flushing so the sections go out in the record's own UPDATE. The
+        search document and promoted columns are brought up to date as well. Returns
+        the names of the sections that were rewritten.
+        """
+        if record.read_model_version != READ_MODEL_VERSION:
+            sections = list(READ_MODEL_SECTIONS)
+        else:
+            sections = self._dirty_sections(record)
+        with self.session.no_autoflush:
+            for section in sections:
+                setattr(record, section, self._render_section(record, section))
+        if record.read_model_version != READ_MODEL_VERSION:
+            record.read_model_version = READ_MODEL_VERSION
+        derived = {
+            "search_document": render_search_document(record),
+            **promoted_columns(record),
+            **gate_columns(record),
+        }
+        for column, value in derived.items():
+            if getattr(record, column) != value:
+                setattr(record, column, value)
+        return sections
+
+    def _dirty_sections(self, record: HypothesisRecord) -> List[str]:
+        state = inspect(record)
+        dirty = {
+            section
+            for section, (relationship, _) in READ_MODEL_SECTIONS.items()
+            if state.attrs[relationship].history.has_changes()
+        }
+        for obj in chain(self.session.new, self.session.dirty, self.session.deleted):
+            section = _SECTION_BY_MODEL.get(type(obj))
+            if section is not None and section not in dirty and self._belongs_to(obj, record):
+                dirty.add(section)
+        return [section for section in READ_MODEL_SECTIONS if section in dirty]
+
+    @staticmethod
+    def _belongs_to(child: Any, record: HypothesisRecord) -> bool:
+        if child.hypothesis_id is not None:
+            return child.hypothesis_id == record.id
+        return child.hypothesis is record
+
+    @staticmethod
+    def _prime_defaults(obj: Any) -> None:
+        """Apply Python-side column defaults to a not-yet-flushed row.
 
-        combined_history: List[dict] = []
-        seen: set[tuple[str | None, datetime | None]] = set()
-        for entry in existing_history:
-            key = (entry["stage"], entry["changed_at"])
-            seen.add(key)
-            combined_history.append(entry)
-
-        for entry in record.stage_history_entries:
-            normalized_changed_at = self._ensure_aware(entry.changed_at)
-            key = (entry.to_stage, normalized_changed_at)
-            if key in seen:
+        The read model is rendered before the flush, so new children need their
+        generated ids and timestamps up front rather than at INSERT time.
+        """
+        state = inspect(obj)
+        if state.persistent:
+            return
+        for prop in state.mapper.column_attrs:
+            default = prop.columns[0].default
+            if default is None or getattr(obj, prop.key) is not None:
                 continue
-            combined_history.append(
-                {
-                    "stage": entry.to_stage,
-                    "changed_at": normalized_changed_at,
-                    "changed_by": entry.changed_by,
-                    "notes": entry.notes,
-                }
-            )
+            if default.is_callable:
+                setattr(obj, prop.key, default.arg(None))
+            elif default.is_scalar:
+                setattr(obj, prop.key, default.arg)
 
-        if combined_history:
-            combined_history.sort(
-                key=lambda item: item["changed_at"]
-                or datetime.min.replace(tzinfo=timezone.utc)
-            )
-            payload["stage_history"] = combined_history
-
-        checklist = []
-        for item in record.checklist_items:
-            checklist.append(
-                {
-                    "id": item.id,
-                    "label": item.label,
-                    "status": item.status,
-                    "owner": item.owner_name or item.owner_email or "",
-                    "owner_email": item.owner_email,
-                    "due_at": item.due_at,
-                }
-            )
-        if checklist:
-            payload["gating_checklist"] = checklist
+    def _render_section(self, record: HypothesisRecord, section: str, *, incremental: bool = True) -> List[dict]:
+        relationship, model = READ_MODEL_SECTIONS[section]
+        render = getattr(self, f"_render_{section}")
+        loaded = relationship in inspect(record).dict
+        stored = getattr(record, section) or []
+        if (
+            incremental
+            and section in _APPEND_ONLY_SECTIONS
+            and not loaded
+            and record.read_model_version == READ_MODEL_VERSION
+        ):
+            sources = self._pending_children(record, model)
+        elif section == "activity_digest" and not loaded:
+            # Only the newest events reach the digest, so never load the full history.
+            stored = []
+            sources = self.recent_activity_events(record) + self._pending_children(record, model)
+        else:
+            # Children built with ``hypothesis=record`` and then appended show up twice
+            # in an unflushed collection.
+            sources = list(dict.fromkeys(getattr(record, relationship)))
+            if section == "activity_digest":
+                stored = []
+        for obj in sources:
+            self._prime_defaults(obj)
 
-        attachments = [
-            {
-                "id": attachment.id,
-                "name": attachment.file_name,
-                "url": attachment.url,
-                "version": attachment.version,
-                "uploaded_at": attachment.uploaded_at,
-                "uploaded_by": attachment.uploaded_by,
-                "uploaded_by_email": attachment.uploaded_by_email,
-            }
-            for attachment in record.attachment_records
-        ]
-        if attachments:
-            payload["attachments"] = attachments
+        if section == "stage_history":
+            # Legacy rows may carry history entries with no backing table row; keep them.
+            merged = {(item.get("stage"), _timestamp_key(item.get("changed_at"))): item for item in stored}
+            for obj in sources:
+                item = render(record, obj)
+                merged.setdefault((item["stage"], _timestamp_key(item["changed_at"])), item)
+            return sorted(merged.values(), key=lambda item: _timestamp_key(item.get("changed_at")))
+        if section == "activity_digest":
+            items = [render(record, obj) for obj in sources] + list(stored)
+            items.sort(key=lambda item: _timestamp_key(item["occurred_at"]), reverse=True)
+            return items[:ACTIVITY_DIGEST_LIMIT]
+        if section == "comments":
+            sources = [comment for comment in sources if comment.parent_id is None and comment.parent is None]
+        return [render(record, obj) for obj in sources]
 
-        approvals = [
-            {
-                "id": approval.id,
-                "approver_name": approval.approver_name,
-                "approver_email": approval.approver_email,
-                "approver_role": approval.approver_role,
-                "status": approval.status,
-                "required": approval.required,
-                "decided_at": self._ensure_aware(approval.decided_at),
-                "notes": approval.notes,
-            }
-            for approval in record.approval_records
-        ]
-        if approvals:
-            payload["approvals"] = approvals
+    def _pending_children(self, record: HypothesisRecord, model: type) -> List[Any]:
+        return [obj for obj in self.session.new if isinstance(obj, model) and obj.hypothesis is record]
 
-        comments = [
-            self._comment_to_dict(comment)
-            for comment in record.comment_threads
-            if comment.parent_id is None
-        ]
-        if comments:
-            payload["comments"] = comments
-
-        tasks = []
-        for task in record.task_records:
-            due_dt = self._ensure_aware(task.due) or record.updated_at or record.created_at
-            tasks.append(
-                {
-                    "id": task.id,
-                    "label": task.label,
-                    "owner": task.owner_name or task.owner_email or "Unassigned",
-                    "due": due_dt,
-                    "type": task.task_type if task.task_type in {"data", "governance", "approval"} else "governance",
-                    "status": task.status if task.status in {"at-risk", "due-soon", "blocked"} else "due-soon",
-                    "severity": task.severity if task.severity in {"critical", "high", "medium"} else "medium",
-                    "related_stage": task.related_stage or record.stage,
-                }
+    def recent_activity_events(
+        self,
+        record: HypothesisRecord,
+        *,
+        after: tuple[datetime, str] | None = None,
+        limit: int = ACTIVITY_DIGEST_LIMIT,
+    ) -> List[HypothesisActivityEvent]:
+        """Return persisted activity newest first, optionally after a keyset position.
+
+        Walks ``ix_hypothesis_activity_events_hypothesis_occurred``; ties on
+        ``occurred_at`` are broken by id so pages never overlap.
+        """
+        if record.id is None:
+            return []
+        stmt = select(HypothesisActivityEvent).where(HypothesisActivityEvent.hypothesis_id == record.id)
+        if after is not None:
+            occurred_at, event_id = after
+            stmt = stmt.where(
+                or_(
+                    HypothesisActivityEvent.occurred_at < occurred_at,
+                    and_(
+                        HypothesisActivityEvent.occurred_at == occurred_at,
+                        HypothesisActivityEvent.id > event_id,
+                    ),
+                )
             )
-        if tasks:
-            payload["tasks"] = tasks
-
-        sorted_events = sorted(
-            record.activity_events,
-            key=lambda e: self._ensure_aware(e.occurred_at)
-            or datetime.min.replace(tzinfo=timezone.utc),
-            reverse=True,
+        stmt = stmt.order_by(HypothesisActivityEvent.occurred_at.desc(), HypothesisActivityEvent.id.asc())
+        return list(self.session.scalars(stmt.limit(limit)))
+
+    def _render_stage_history(self, record: HypothesisRecord, entry: HypothesisStageHistoryEntry) -> dict:
+        return schemas.HypothesisStageEvent(
+            stage=entry.to_stage,
+            changed_at=self._ensure_aware(entry.changed_at),
+            changed_by=entry.changed_by,
+            notes=entry.notes,
+        ).model_dump(mode="json")
+
+    def _render_gating_checklist(self, record: HypothesisRecord, item: HypothesisChecklistItem) -> dict:
+        return schemas.HypothesisChecklistItem(
+            id=item.id,
+            label=item.label,
+            status=item.status,
+            owner=item.owner_name or item.owner_email or "",
+            owner_email=item.owner_email,
+            due_at=self._ensure_aware(item.due_at),
+        ).model_dump(mode="json")
+
+    def _render_attachments(self, record: HypothesisRecord, attachment: HypothesisAttachment) -> dict:
+        return schemas.HypothesisAttachment(
+            id=attachment.id,
+            name=attachment.file_name,
+            url=attachment.url,
+            version=attachment.version,
+            uploaded_at=self._ensure_aware(attachment.uploaded_at),
+            uploaded_by=attachment.uploaded_by,
+            uploaded_by_email=attachment.uploaded_by_email,
+        ).model_dump(mode="json")
+
+    def _render_approvals(self, record: HypothesisRecord, approval: HypothesisApproval) -> dict:
+        return schemas.HypothesisApproval(
+            id=approval.id,
+            approver_name=approval.approver_name,
+            approver_email=approval.approver_email,
+            approver_role=approval.approver_role,
+            status=approval.status,
+            required=approval.required,
+            decided_at=self._ensure_aware(approval.decided_at),
+            notes=approval.notes,
+        ).model_dump(mode="json")
+
+    def _render_comments(self, record: HypothesisRecord, comment: HypothesisComment) -> dict:
+        return schemas.HypothesisComment.model_validate(self._comment_to_dict(comment)).model_dump(mode="json")
+
+    def _render_tasks(self, record: HypothesisRecord, task: HypothesisTask) -> dict:
+        return schemas.HypothesisTask(
+            id=task.id,
+            label=task.label,
+            owner=task.owner_name or task.owner_email or "Unassigned",
+            due=self._ensure_aware(task.due or record.updated_at or record.created_at),
+            type=task.task_type if task.task_type in {"data", "governance", "approval"} else "governance",
+            status=task.status if task.status in {"at-risk", "due-soon", "blocked"} else "due-soon",
+            severity=task.severity if task.severity in {"critical", "high", "medium"} else "medium",
+            related_stage=task.related_stage or record.stage,
+        ).model_dump(mode="json")
+
+    def _render_activity_digest(self, record: HypothesisRecord, event: HypothesisActivityEvent) -> dict:
+        return self.event_to_activity(record, event).model_dump(mode="json")
+
+    def event_to_activity(self, record: HypothesisRecord, event: HypothesisActivityEvent) -> schemas.HypothesisActivity:
+        return schemas.HypothesisActivity(
+            id=event.id,
+            type=event.event_type if event.event_type in _ACTIVITY_TYPES else "UPDATED",
+            title=event.title,
+            actor=event.actor_name,
+            detail=event.detail,
+            occurred_at=self._ensure_aware(event.occurred_at),
+            stage=event.stage or record.stage,
+            impact=event.impact if event.impact in {"positive", "neutral", "negative"} else "neutral",
         )
 
-        activity_digest = [
-            {
-                "id": event.id,
-                "type": event.event_type,
-                "title": event.title,
-                "actor": event.actor_name,
-                "detail": event.detail,
-                "occurred_at": self._ensure_aware(event.occurred_at),
-                "stage": event.stage or record.stage,
-                "impact": event.impact or "neutral",
-            }
-            for event in sorted_events
-        ]
-        if activity_digest:
-            payload["activity_digest"] = activity_digest
+    def row_to_activity(self, row: Row) -> schemas.HypothesisActivity:
+        """Build an activity item from a :meth:`dashboard_activity_rows` row."""
+        return schemas.HypothesisActivity(
+            id=row.id,
+            type=row.event_type if row.event_type in _ACTIVITY_TYPES else "UPDATED",
+            title=row.title,
+            actor=row.actor_name,
+            detail=row.detail,
+            occurred_at=self._ensure_aware(row.occurred_at),
+            stage=row.stage,
+            impact=row.impact if row.impact in {"positive", "neutral", "negative"} else "neutral",
+        )
 
-        return schemas.HypothesisDetail.model_validate(payload)
+    def event_to_change(self, event: HypothesisActivityEvent) -> schemas.HypothesisChange:
+        activity = self.event_to_activity(event.hypothesis, event)
+        return schemas.HypothesisChange(**activity.model_dump(), hyp_id=event.hypothesis.hyp_id)
+
+    def row_to_change(self, row: Row) -> schemas.HypothesisChange:
+        """Build a change feed item from a :meth:`change_rows_after` row."""
+        return schemas.HypothesisChange(**self.row_to_activity(row).model_dump(), hyp_id=row.hyp_id)
+
+    def row_to_task(self, row: Row) -> schemas.HypothesisTask:
+        """Build a dashboard task from a :meth:`dashboard_task_rows` row."""
+        return schemas.HypothesisTask.model_validate({**row._mapping, "due": self._ensure_aware(row.due)})
 
     def record_to_summary(self, record: HypothesisRecord) -> schemas.HypothesisSummaryItem:
         tags = record.tags or []
         owner_name = record.owners[0]["name"] if record.owners else "Unassigned"
-        latest_transition = max(
-            [entry.changed_at for entry in record.stage_history_entries],
-            default=None,
-        )
+        if record.read_model_version == READ_MODEL_VERSION:
+            transitions = [_timestamp_key(item["changed_at"]) for item in record.stage_history]
+        else:
+            transitions = [entry.changed_at for entry in record.stage_history_entries]
+        latest_transition = max(transitions, default=None)
         last_updated = latest_transition or record.updated_at or record.created_at
         summary_payload = {
             "id": record.hyp_id,
@@ -344,17 +1140,368 @@ class HypothesisRepository:
         }
         return schemas.Hypothesis.model_validate(payload)
 
+    def row_to_summary(self, row: Row) -> schemas.HypothesisSummaryItem:
+        """Build a dashboard card from a :meth:`dashboard_summary_rows` row."""
+        owners = row.owners or []
+        return schemas.HypothesisSummaryItem.model_validate(
+            {
+                "id": row.hyp_id,
+                "title": row.title,
+                "owner": owners[0]["name"] if owners else "Unassigned",
+                "stage": row.stage,
+                "impact": row.impact_score,
+                "feasibility": row.feasibility_score,
+                "confidence": row.confidence_score,
+                "last_updated": self._ensure_aware(row.updated_at or row.created_at),
+                "tags": row.tags or [],
+                "priority": row.priority,
+                "next_gate": row.next_gate,
+                "ready_for_next_gate": row.ready_for_next_gate,
+            }
+        )
+
+    def row_to_light(self, row: Row) -> schemas.Hypothesis:
+        owners = row.owners or []
+        payload = {
+            "hyp_id": row.hyp_id,
+            "title": row.title,
+            "stage": row.stage,
+            "owner": owners[0]["name"] if owners else "Unassigned",
+            "next_gate": row.next_gate,
+            "ready_for_next_gate": row.ready_for_next_gate,
+        }
+        return schemas.Hypothesis.model_validate(payload)
+
     def upsert_many(self, records: Iterable[HypothesisRecord]) -> None:
-        for record in records:
-            self.session.merge(record)
-        self.session.commit()
+        """Insert or update many detached records in bulk within the current transaction.
+
+        Existing rows are matched by ``hyp_id`` with a single query. New records and
+        their child rows go through :meth:`insert_bulk`, one INSERT per table; existing
+        rows receive one bulk UPDATE of their scalar columns, guarded by the stored
+        version. Child rows of existing hypotheses are left untouched, and the caller
+        commits. The records themselves stay transient.
+        """
+        records = list(records)
+        if not records:
+            return
+        existing = {
+            row.hyp_id: row
+            for row in self.session.execute(
+                select(
+                    HypothesisRecord.hyp_id,
+                    HypothesisRecord.id,
+                    HypothesisRecord.version,
+                    HypothesisRecord.comments,
+                ).where(HypothesisRecord.hyp_id.in_([record.hyp_id for record in records]))
+            )
+        }
+
+        inserts = [self._bulk_rows(record) for record in records if record.hyp_id not in existing]
+        if inserts:
+            self.insert_bulk(inserts)
+
+        updates = [
+            {
+                **{column: getattr(record, column) for column in _UPSERT_COLUMNS},
+                "id": existing[record.hyp_id].id,
+                "version": existing[record.hyp_id].version,
+                # Comments stay as stored, so the document keeps their bodies.
+                "search_document": render_search_document(record, existing[record.hyp_id].comments or []),
+                **promoted_columns(record),
+                "next_gate": NEXT_STAGE_GATE.get(record.stage),
+            }
+            for record in records
+            if record.hyp_id in existing
+        ]
+        if updates:
+            self.session.execute(update(HypothesisRecord), updates)
+        self.session.flush()
+
+    def insert_bulk(self, built: Sequence[tuple[dict, Dict[type, List[dict]]]]) -> List[int]:
+        """Insert new hypotheses and their child rows with Core bulk inserts.
+
+        ``built`` pairs each ``hypotheses`` row with its child rows keyed by model,
+        without foreign keys. Read-model sections, the search document and the promoted
+        columns are rendered from the child rows first, so bulk-loaded rows are served
+        exactly like rows written through the ORM. Returns the new primary keys in order.
+        """
+        for row, children in built:
+            for model, rows in children.items():
+                for child in rows:
+                    self._fill_column_defaults(model, child)
+            self._render_bulk_read_model(row, children)
+
+        # A plain executemany batches on every driver, unlike RETURNING in parameter
+        # order; the allocated identifiers are unique, so keys are read back by hyp_id.
+        connection = self.session.connection()
+        connection.execute(insert(HypothesisRecord.__table__), [row for row, _ in built])
+        keys = dict(
+            connection.execute(
+                select(HypothesisRecord.hyp_id, HypothesisRecord.id).where(
+                    HypothesisRecord.hyp_id.in_([row["hyp_id"] for row, _ in built])
+                )
+            ).all()
+        )
+        record_ids = [keys[row["hyp_id"]] for row, _ in built]
+        for model, columns in _CHILD_COLUMN_KEYS.items():
+            rows = [
+                {columns[key]: value for key, value in child.items()} | {"hypothesis_id": record_id}
+                for record_id, (_, children) in zip(record_ids, built)
+                for child in children.get(model, ())
+            ]
+            if rows:
+                connection.execute(insert(model.__table__), rows)
+        return record_ids
+
+    @classmethod
+    def _bulk_rows(cls, record: HypothesisRecord) -> tuple[dict, Dict[type, List[dict]]]:
+        """Split a transient record and its child objects into :meth:`insert_bulk` rows."""
+        row = cls._assigned_columns(record, HypothesisRecord)
+        row.pop("id", None)
+        cls._fill_column_defaults(HypothesisRecord, row)
+        children: Dict[type, List[dict]] = {}
+        for relationship, model in READ_MODEL_SECTIONS.values():
+            rows = children[model] = []
+            # ``dict.fromkeys`` drops objects appended twice, which the unit of work tolerates.
+            for child in dict.fromkeys(getattr(record, relationship)):
+                values = cls._assigned_columns(child, model)
+                values.pop("hypothesis_id", None)
+                if isinstance(child, HypothesisComment) and child.parent is not None:
+                    values["parent_id"] = child.parent.id
+                rows.append(values)
+        return row, children
+
+    @staticmethod
+    def _assigned_columns(instance: Any, model: type) -> Dict[str, Any]:
+        # Only what the caller set: unset attributes take their column defaults.
+        return {
+            attribute.key: instance.__dict__[attribute.key]
+            for attribute in model.__mapper__.column_attrs
+            if attribute.key in instance.__dict__
+        }
+
+    @staticmethod
+    def _fill_column_defaults(model: type, values: dict) -> None:
+        # Bulk rows skip the unit of work, so Python-side defaults are applied here and
+        # the renderers can read every column.
+        for key, default in _BULK_DEFAULTS[model]:
+            if key in values:
+                continue
+            if default is None:
+                values[key] = None
+            elif default.is_callable:
+                values[key] = default.arg(None)
+            else:
+                values[key] = default.arg
+
+    def _render_bulk_read_model(self, row: dict, children: Dict[type, List[dict]]) -> None:
+        # The renderers only read attributes, so plain namespaces stand in for ORM
+        # instances and no unit of work is involved.
+        record = SimpleNamespace(**row)
+        for section, (_, model) in READ_MODEL_SECTIONS.items():
+            rows = children.get(model, [])
+            if section == "comments":
+                row[section] = self._render_comment_threads(rows)
+                continue
+            if section == "activity_digest":
+                rows = sorted(rows, key=lambda event: event["occurred_at"], reverse=True)[:ACTIVITY_DIGEST_LIMIT]
+            render = getattr(self, f"_render_{section}")
+            row[section] = [render(record, SimpleNamespace(**child)) for child in rows]
+        row["read_model_version"] = READ_MODEL_VERSION
+        row["search_document"] = render_search_document(record, row["comments"])
+        row.update(promoted_columns(record))
+        row.update(gate_columns(SimpleNamespace(**row)))
+
+    @staticmethod
+    def _render_comment_threads(rows: List[dict]) -> List[dict]:
+        nodes = {
+            comment["id"]: {
+                "id": comment["id"],
+                "author": comment["author_name"],
+                "author_email": comment["author_email"],
+                "body": comment["body"],
+                "is_resolved": comment["is_resolved"],
+                "created_at": comment["created_at"],
+                "updated_at": comment["updated_at"],
+                "replies": [],
+            }
+            for comment in rows
+        }
+        threads = []
+        for comment in rows:
+            parent = nodes.get(comment["parent_id"])
+            (parent["replies"] if parent else threads).append(nodes[comment["id"]])
+        return [schemas.HypothesisComment.model_validate(thread).model_dump(mode="json") for thread in threads]
+
+    def apply_stage_transitions(
+        self, transitions: Sequence[tuple[Row, dict, dict]], *, updated_at: datetime
+    ) -> List[schemas.HypothesisChange]:
+        """Move many hypotheses to new stages with one statement per table.
+
+        Each transition pairs a :meth:`transition_gate_rows` row with the attribute
+        values of its stage history entry and activity event. Rows are updated only at
+        the version they were read at; otherwise ``StaleDataError`` is raised and the
+        caller rolls back. The stored ``stage_history`` and ``activity_digest`` sections
+        are extended in place; rows with an outdated read model keep falling back to
+        the child tables until their next ORM write. Returns the new activity events as
+        change feed items.
+        """
+        if not transitions:
+            return []
+        hypotheses = HypothesisRecord.__table__
+        updates, history_rows, event_rows, changes = [], [], [], []
+        for row, entry, event in transitions:
+            self._fill_column_defaults(HypothesisStageHistoryEntry, entry)
+            self._fill_column_defaults(HypothesisActivityEvent, event)
+            record = SimpleNamespace(**row._mapping)
+            record.stage = entry["to_stage"]
+            values = {
+                "_id": row.id,
+                "_version": row.version,
+                "stage": record.stage,
+                "next_gate": NEXT_STAGE_GATE.get(record.stage),
+                "updated_at": updated_at,
+            }
+            if row.read_model_version == READ_MODEL_VERSION:
+                history = [*(row.stage_history or []), self._render_stage_history(record, SimpleNamespace(**entry))]
+                history.sort(key=lambda item: _timestamp_key(item.get("changed_at")))
+                digest = [self._render_activity_digest(record, SimpleNamespace(**event)), *(row.activity_digest or [])]
+                digest.sort(key=lambda item: _timestamp_key(item["occurred_at"]), reverse=True)
+                values.update(stage_history=history, activity_digest=digest[:ACTIVITY_DIGEST_LIMIT])
+            else:
+                values.update(stage_history=row.stage_history, activity_digest=row.activity_digest)
+            updates.append(values)
+            history_rows.append(self._child_row(HypothesisStageHistoryEntry, entry, row.id))
+            event_rows.append(self._child_row(HypothesisActivityEvent, event, row.id))
+            changes.append(
+                schemas.HypothesisChange(
+                    **self.event_to_activity(record, SimpleNamespace(**event)).model_dump(), hyp_id=row.hyp_id
+                )
+            )
+
+        connection = self.session.connection()
+        result = connection.execute(
+            hypotheses.update()
+            .where(hypotheses.c.id == bindparam("_id"), hypotheses.c.version == bindparam("_version"))
+            .values(
+                version=hypotheses.c.version + 1,
+                stage=bindparam("stage"),
+                next_gate=bindparam("next_gate"),
+                updated_at=bindparam("updated_at"),
+                stage_history=bindparam("stage_history"),
+                activity_digest=bindparam("activity_digest"),
+            ),
+            updates,
+        )
+        if connection.dialect.supports_sane_multi_rowcount and result.rowcount != len(updates):
+            raise StaleDataError(
+                f"UPDATE statement on table 'hypotheses' expected to update {len(updates)} row(s); "
+                f"{result.rowcount} were matched."
+            )
+        connection.execute(insert(HypothesisStageHistoryEntry.__table__), history_rows)
+        connection.execute(insert(HypothesisActivityEvent.__table__), event_rows)
+        return changes
+
+    @staticmethod
+    def _child_row(model: type, values: dict, record_id: int) -> dict:
+        columns = _CHILD_COLUMN_KEYS[model]
+        return {columns[key]: value for key, value in values.items()} | {"hypothesis_id": record_id}
+
+    def add_outbox_event(self, hyp_id: str, event_type: str, occurred_at: datetime, payload: dict) -> None:
+        """Stage a domain event; it commits or rolls back with the change it describes."""
+        self.session.add(
+            HypothesisOutboxEvent(event_type=event_type, hyp_id=hyp_id, occurred_at=occurred_at, payload=payload)
+        )
+
+    def insert_outbox_events(self, rows: Sequence[dict]) -> None:
+        """Bulk counterpart of :meth:`add_outbox_event` for rows written with Core inserts."""
+        if rows:
+            self.session.flush()  # pending ORM events take their ids first, keeping ``id`` order
+            self.session.connection().execute(insert(HypothesisOutboxEvent.__table__), list(rows))
+
+    def lock_outbox(self) -> bool:
+        """Try to become the only relay publishing until this transaction ends.
+
+        One publisher at a time keeps delivery in ``id`` order, which is what orders
+        each hypothesis' events. SQLite serializes writers and needs no lock.
+        """
+        if not self._is_postgres():
+            return True
+        return bool(self.session.scalar(select(func.pg_try_advisory_xact_lock(OUTBOX_LOCK_KEY))))
+
+    def pending_outbox_events(self, limit: int) -> List[HypothesisOutboxEvent]:
+        """Return the oldest pending events, holding back every hypothesis that has a dead event."""
+        dead_hyp_ids = select(HypothesisOutboxEvent.hyp_id).where(HypothesisOutboxEvent.status == "dead")
+        stmt = (
+            select(HypothesisOutboxEvent)
+            .where(HypothesisOutboxEvent.status == "pending", HypothesisOutboxEvent.hyp_id.not_in(dead_hyp_ids))
+            .order_by(HypothesisOutboxEvent.id)
+            .limit(limit)
+        )
+        return list(self.session.scalars(stmt))
+
+    def delete_outbox_events(self, ids: Sequence[int]) -> None:
+        self.session.execute(delete(HypothesisOutboxEvent).where(HypothesisOutboxEvent.id.in_(ids)))
+
+    def record_outbox_attempt(self, event_id: int, *, dead: bool = False) -> None:
+        """Count a publish the broker rejected while accepting others; dead-letter it when ``dead``."""
+        values: Dict[str, Any] = {"attempts": HypothesisOutboxEvent.attempts + 1}
+        if dead:
+            values["status"] = "dead"
+        self.session.execute(
+            update(HypothesisOutboxEvent).where(HypothesisOutboxEvent.id == event_id).values(**values)
+        )
+
+    def outbox_backlog(self) -> Row:
+        """Return ``(pending, oldest_created_at, dead)``: the unpublished and dead-lettered events.
+
+        ``pending`` includes the events held behind a dead event of the same hypothesis.
+        """
+        pending = HypothesisOutboxEvent.status == "pending"
+        return self.session.execute(
+            select(
+                func.count(HypothesisOutboxEvent.id).filter(pending),
+                func.min(HypothesisOutboxEvent.created_at).filter(pending),
+                func.count(HypothesisOutboxEvent.id).filter(HypothesisOutboxEvent.status == "dead"),
+            )
+        ).one()
 
     def next_hyp_id(self) -> str:
         """Generate the next sequential hypothesis identifier."""
-        stmt = select(HypothesisRecord.hyp_id)
+        return self.allocate_hyp_ids(1)[0]
+
+    def allocate_hyp_ids(self, count: int) -> List[str]:
+        """Reserve ``count`` consecutive hypothesis identifiers.
+
+        The counter row is bumped with a single ``UPDATE ... RETURNING``, which holds a
+        row lock until the surrounding transaction commits, so concurrent writers
+        never receive the same number and a rolled-back create releases its IDs.
+        """
+        stmt = (
+            update(HypothesisIdSequence)
+            .where(HypothesisIdSequence.name == HYP_ID_SEQUENCE)
+            .values(last_value=HypothesisIdSequence.last_value + count)
+            .returning(HypothesisIdSequence.last_value)
+        )
+        last_value = self.session.execute(stmt).scalar_one_or_none()
+        if last_value is None:
+            self._initialize_hyp_id_sequence()
+            last_value = self.session.execute(stmt).scalar_one()
+        return [f"HYP-{number:03d}" for number in range(last_value - count + 1, last_value + 1)]
+
+    def _initialize_hyp_id_sequence(self) -> None:
+        """Create the counter row from the highest identifier already in use.
+
+        This scans existing identifiers once per database; a concurrent initializer
+        losing the insert race simply reuses the winner's row.
+        """
         max_number = 0
-        for hyp_id in self.session.scalars(stmt):
+        for hyp_id in self.session.scalars(select(HypothesisRecord.hyp_id)):
             match = HYP_ID_PATTERN.match(hyp_id)
             if match:
                 max_number = max(max_number, int(match.group(1)))
-        return f"HYP-{max_number + 1:03d}"
+        try:
+            with self.session.begin_nested():
+                self.session.add(HypothesisIdSequence(name=HYP_ID_SEQUENCE, last_value=max_number))
+        except IntegrityError:
+            pass
@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Literal, Optional
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from pydantic import AfterValidator, BaseModel, Field, ConfigDict, WithJsonSchema
+from pydantic.networks import validate_email
 
 
 StageLiteral = Literal[
@@ -26,6 +28,17 @@ TaskStatusLiteral = Literal["at-risk", "due-soon", "blocked"]
 TaskSeverityLiteral = Literal["critical", "high", "medium"]
 TaskTypeLiteral = Literal["data", "governance", "approval"]
 ActorRoleLiteral = Literal["OWNER", "TECH_LEAD", "REVIEWER", "OBSERVER", "SPONSOR", "STAKEHOLDER"]
+HypothesisSortLiteral = Literal[
+    "createdAt",
+    "updatedAt",
+    "title",
+    "hypId",
+    "impactScore",
+    "feasibilityScore",
+    "confidenceScore",
+]
+SortOrderLiteral = Literal["asc", "desc"]
+ExportFormatLiteral = Literal["ndjson", "csv"]
 ActivityTypeLiteral = Literal[
     "CREATED",
     "UPDATED",
@@ -42,6 +55,16 @@ def to_camel(string: str) -> str:
     return parts[0] + "".join(word.capitalize() for word in parts[1:])
 
 
+@lru_cache(maxsize=4096)
+def _normalize_email(value: str) -> str:
+    return validate_email(value)[1]
+
+
+# ``EmailStr`` with memoized checks: the same few addresses recur across every actor
+# list in the read model, and each uncached check costs a full IDNA pass.
+EmailAddress = Annotated[str, AfterValidator(_normalize_email), WithJsonSchema({"type": "string", "format": "email"})]
+
+
 class CamelModel(BaseModel):
     """Base model that serialises using camelCase for JSON responses."""
 
@@ -56,11 +79,33 @@ class Hypothesis(CamelModel):
     title: str
     stage: StageLiteral
     owner: str
+    next_gate: Optional[str] = None
+    ready_for_next_gate: bool = False
+
+
+class HypothesisListFilters(CamelModel):
+    stage: Optional[StageLiteral] = None
+    lab_id: Optional[str] = None
+    priority: Optional[PriorityLiteral] = None
+    risk_class: Optional[RiskClassLiteral] = None
+    tag: Optional[str] = None
+    owner: Optional[str] = None
+    ready_for_next_gate: Optional[bool] = None
+
+
+class HypothesisSearchHit(Hypothesis):
+    lab_id: str
+    score: float
+
+
+class HypothesisPage(CamelModel):
+    items: List[Hypothesis]
+    next_cursor: Optional[str] = None
 
 
 class HypothesisActor(CamelModel):
     name: str = Field(..., min_length=1)
-    email: EmailStr
+    email: EmailAddress
     role: ActorRoleLiteral = "OWNER"
     department: Optional[str] = None
 
@@ -147,6 +192,17 @@ class HypothesisActivity(CamelModel):
     impact: ImpactSentimentLiteral = "neutral"
 
 
+class HypothesisChange(HypothesisActivity):
+    """An activity event as pushed on the change feed."""
+
+    hyp_id: str
+
+
+class HypothesisActivityPage(CamelModel):
+    items: List[HypothesisActivity]
+    next_cursor: Optional[str] = None
+
+
 class HypothesisComment(CamelModel):
     id: str
     author: str
@@ -217,6 +273,7 @@ class HypothesisSummaryItem(CamelModel):
     feasibility: float
     confidence: float
     next_gate: Optional[str] = None
+    ready_for_next_gate: bool = False
     last_updated: datetime
     tags: List[str]
     priority: PriorityLiteral = "MEDIUM"
@@ -231,6 +288,8 @@ class HypothesisStageSummary(CamelModel):
     stage_health: StageHealthLiteral = "on-track"
     conversion_rate: float
     average_days_in_stage: int
+    # Active hypotheses in the stage; ``items`` holds only the newest of them.
+    total: int = 0
     items: List[HypothesisSummaryItem] = Field(default_factory=list)
 
 
@@ -259,6 +318,14 @@ class HypothesisDetail(HypothesisBase):
     tasks: List[HypothesisTask] = Field(default_factory=list)
 
 
+class HypothesisVersion(CamelModel):
+    """Minimal write acknowledgement returned for ``Prefer: return=minimal``."""
+
+    hyp_id: str
+    version: int
+    updated_at: datetime
+
+
 class HypothesisTask(CamelModel):
     id: str
     label: str
@@ -271,6 +338,7 @@ class HypothesisTask(CamelModel):
 
 
 class HypothesisDashboard(CamelModel):
+    version: int
     stages: List[HypothesisStageSummary]
     highlights: HypothesisHighlights
     focus_hypothesis: HypothesisDetail
@@ -340,6 +408,66 @@ class HypothesisUpdatePayload(CamelModel):
     updated_by: Optional[str] = None
 
 
+class HypothesisBatchUpdateItem(HypothesisUpdatePayload):
+    hyp_id: str
+
+
+class HypothesisBatchPayload(CamelModel):
+    """Batch request body; items are validated one by one so failures stay per item."""
+
+    items: List[Dict[str, Any]] = Field(min_length=1, max_length=500)
+
+
+class HypothesisBatchItemResult(CamelModel):
+    index: int
+    hyp_id: Optional[str] = None
+    status: int
+    version: Optional[int] = None
+    error: Optional[str] = None
+
+
+class HypothesisBatchResult(CamelModel):
+    items: List[HypothesisBatchItemResult]
+    succeeded: int
+    failed: int
+
+
+class HypothesisTransitionPayload(CamelModel):
+    stage: StageLiteral
+    changed_by: str = "System"
+    notes: Optional[str] = None
+
+
+class HypothesisBatchTransitionItem(HypothesisTransitionPayload):
+    hyp_id: str
+
+
+class HypothesisTransitionResult(HypothesisBatchItemResult):
+    """Outcome of one stage transition; the stages are set once the hypothesis is found."""
+
+    from_stage: Optional[StageLiteral] = None
+    to_stage: Optional[StageLiteral] = None
+
+
+class HypothesisTransitionBatchResult(HypothesisBatchResult):
+    items: List[HypothesisTransitionResult]
+
+
+class HypothesisImportError(CamelModel):
+    row: int
+    error: str
+
+
+class HypothesisImportProgress(CamelModel):
+    """Running totals after each imported chunk, with that chunk's rejected rows."""
+
+    processed: int
+    imported: int
+    failed: int
+    errors: List[HypothesisImportError] = Field(default_factory=list)
+    done: bool = False
+
+
 class CommentCreatePayload(CamelModel):
     author: HypothesisActor
     body: str
@@ -387,3 +515,51 @@ class ApprovalUpdatePayload(CamelModel):
 
 
 HypothesisComment.model_rebuild()
+
+
+class PoolStats(CamelModel):
+    pool_class: str
+    pool_size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts_total: int
+    checkout_wait_seconds_total: float
+    checkout_wait_seconds_max: float
+    checkout_timeouts_total: int
+    connections_opened_total: int
+    connections_closed_total: int
+    connections_invalidated_total: int
+
+
+class DetailCacheStats(CamelModel):
+    backend: str
+    entries: int
+    size_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    errors: int
+
+
+class HypothesisDomainEvent(CamelModel):
+    """Envelope published by the outbox relay; ``id`` orders and deduplicates deliveries."""
+
+    id: int
+    type: str
+    hyp_id: str
+    occurred_at: datetime
+    data: Dict[str, Any] = Field(default_factory=dict)
+
+
+class OutboxStats(CamelModel):
+    publisher: str
+    pending: int
+    dead: int = 0
+    oldest_pending_seconds: float
+    published_total: int
+    batches_total: int
+    failures_total: int
+    last_publish_lag_seconds: float
@@ -21,12 +21,11 @@ from .repositories import HypothesisRepository
 def seed_demo_data(session: Session) -> None:
     """Populate the database with curated demo data for local development."""
     repository = HypothesisRepository(session)
-    if repository.list():
+    if repository.has_any():
         return
 
-    records = _build_seed_records()
-    session.add_all(records)
-    session.commit()
+    repository.upsert_many(_build_seed_records())
+    repository.commit()
 
 
 
@@ -126,6 +125,8 @@ def _build_seed_records() -> List[HypothesisRecord]:
             }
         ],
         activity_digest=[],
+        created_at=now,
+        updated_at=now,
     )
 
     stage_history_entries_001 = [
@@ -388,6 +389,8 @@ def _build_seed_records() -> List[HypothesisRecord]:
             }
         ],
         activity_digest=[],
+        created_at=now,
+        updated_at=now,
     )
 
     stage_history_entries_004 = [
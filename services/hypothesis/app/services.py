@@ -1,18 +1,41 @@
 from __future__ import annotations
 
+import csv
+import hashlib
+import io
+import json
+import re
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Sequence, cast
+from itertools import islice
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence
 
 from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy.engine import Row
+from sqlalchemy.orm.exc import StaleDataError
 
 from . import schemas
+from .cache import DetailCache, RenderedDetail, get_detail_cache
+from .feed import change_feed
 from .models import (
+    HypothesisActivityEvent,
     HypothesisAttachment,
     HypothesisChecklistItem,
     HypothesisComment,
+    HypothesisDashboardSnapshot,
     HypothesisRecord,
+    HypothesisStageHistoryEntry,
 )
-from .repositories import HypothesisRepository
+from .repositories import (
+    HYP_ID_PATTERN,
+    HypothesisRepository,
+    decode_list_cursor,
+    encode_list_cursor,
+)
+
+if TYPE_CHECKING:
+    from .importer import ImportRow
 
 STAGE_ORDER: Sequence[schemas.StageLiteral] = (
     "IDEATION",
@@ -83,38 +106,539 @@ STAGE_BASELINE: Dict[schemas.StageLiteral, Dict[str, object]] = {
     },
 }
 
-NEXT_STAGE_GATE = {
-    "IDEATION": "SCOPING_KICKOFF",
-    "SCOPING": "PRIORITIZATION_REVIEW",
-    "PRIORITIZATION": "EXPERIMENT_KICKOFF",
-    "EXPERIMENTATION": "EVALUATION_GATE",
-    "EVALUATION": "SCALING_KICKOFF",
-    "SCALING": "PRODUCTION_ROLLOUT",
-    "PRODUCTION": None,
+DASHBOARD_TASK_LIMIT = 20
+DASHBOARD_STAGE_ITEM_LIMIT = 50
+DASHBOARD_ACTIVITY_LIMIT = 25
+
+# ``key:value`` operators accepted by search, mapped to list filter fields. ``type:``
+# and ``id:`` are handled separately; unknown keys are searched as plain text.
+SEARCH_FILTER_OPERATORS = {
+    "stage": "stage",
+    "lab": "lab_id",
+    "priority": "priority",
+    "risk": "risk_class",
+    "tag": "tag",
+    "owner": "owner",
 }
+SEARCH_TYPES = {"hyp", "hypothesis"}
+_UPPERCASE_FILTERS = {"stage", "priority", "risk_class"}
+_SEARCH_TOKEN = re.compile(r"(\w+):(\S+)|(\S+)")
+
+# Records fetched, rendered and flushed to the client per chunk of an export.
+EXPORT_BATCH_SIZE = 100
+# Rows validated, inserted and committed together by a bulk import.
+IMPORT_CHUNK_SIZE = 1000
+# Activity events read per query when a change feed client resumes from the table.
+CHANGE_REPLAY_BATCH_SIZE = 200
+# Outbox event published when an approval is decided; other approval edits are updates.
+APPROVAL_EVENT_TYPES = {"approved": "HypothesisApproved", "rejected": "HypothesisRejected"}
+# Exportable columns: camelCase detail field -> ``HypothesisDetail`` attribute.
+EXPORT_FIELDS = {field.alias or name: name for name, field in schemas.HypothesisDetail.model_fields.items()}
+# Nested sections are JSON-encoded in CSV cells, so by default CSV keeps to scalars.
+EXPORT_CSV_DEFAULT_COLUMNS = (
+    "hypId",
+    "labId",
+    "title",
+    "stage",
+    "stageHealth",
+    "priority",
+    "riskClass",
+    "impactScore",
+    "feasibilityScore",
+    "confidenceScore",
+    "governanceState",
+    "createdAt",
+    "updatedAt",
+)
+
+
+def _parse_timestamp(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def record_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def dashboard_etag(version: int, tasks: Sequence[schemas.HypothesisTask]) -> str:
+    """Strong ETag for the dashboard: the snapshot version plus its time-derived task statuses.
+
+    Checklist-derived task statuses change as due dates approach without any write, so
+    they are folded into the tag to keep ``304`` responses honest.
+    """
+    statuses = hashlib.sha1("|".join(f"{task.id}:{task.status}" for task in tasks).encode()).hexdigest()
+    return f'"{version}-{statuses[:12]}"'
+
+
+def etag_matches(header: Optional[str], etag: str, *, weak: bool = True) -> bool:
+    """Compare ``etag`` against an ``If-Match``/``If-None-Match`` header value.
+
+    ``If-None-Match`` uses weak comparison (RFC 9110 §13.1.2); pass ``weak=False`` for
+    the strong comparison ``If-Match`` requires, under which ``W/`` tags never match.
+    """
+    if not header:
+        return False
+    for candidate in (token.strip() for token in header.split(",")):
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            if not weak:
+                continue
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'body'}: {error['msg']}" for error in exc.errors()
+    )
+
+
+def parse_search_query(query: str) -> Optional[tuple[List[str], Optional[str], schemas.HypothesisListFilters]]:
+    """Split a search string into words, an ``id:`` prefix and list filters.
+
+    Returns ``None`` when a ``type:`` operator names another kind of object. Raises
+    ``HTTPException`` (400) when an operator value is invalid.
+    """
+    terms: List[str] = []
+    hyp_id_prefix: Optional[str] = None
+    filters: Dict[str, str] = {}
+    for match in _SEARCH_TOKEN.finditer(query):
+        key, value, word = match.groups()
+        key = (key or "").lower()
+        if key == "type":
+            if value.lower() not in SEARCH_TYPES:
+                return None
+        elif key == "id":
+            hyp_id_prefix = value.upper()
+        elif key in SEARCH_FILTER_OPERATORS:
+            field = SEARCH_FILTER_OPERATORS[key]
+            filters[field] = value.upper() if field in _UPPERCASE_FILTERS else value
+        elif word and HYP_ID_PATTERN.match(word.upper()):
+            hyp_id_prefix = word.upper()
+        else:
+            terms.extend(re.findall(r"\w+", match.group(0).lower()))
+    try:
+        parsed_filters = schemas.HypothesisListFilters(**filters)
+    except ValidationError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=_validation_message(exc)) from None
+    return terms, hyp_id_prefix, parsed_filters
+
+
+def resolve_export_columns(export_format: schemas.ExportFormatLiteral, columns: Optional[str]) -> List[str]:
+    """Map a comma-separated ``columns`` parameter to ``HypothesisDetail`` attribute names.
+
+    Without ``columns`` NDJSON exports every field and CSV the scalar ones. Raises
+    ``HTTPException`` (400) for unknown column names.
+    """
+    if not columns:
+        defaults = EXPORT_FIELDS if export_format == "ndjson" else EXPORT_CSV_DEFAULT_COLUMNS
+        return [EXPORT_FIELDS[column] for column in defaults]
+    requested = list(dict.fromkeys(column.strip() for column in columns.split(",") if column.strip()))
+    unknown = [column for column in requested if column not in EXPORT_FIELDS]
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown export columns: {', '.join(unknown) or columns}."
+        )
+    return [EXPORT_FIELDS[column] for column in requested]
+
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"))
+    return value
+
+
+def _batch_failure(
+    index: int, status_code: int, error: str, hyp_id: Optional[str] = None
+) -> schemas.HypothesisBatchItemResult:
+    return schemas.HypothesisBatchItemResult(index=index, hyp_id=hyp_id, status=status_code, error=error)
+
+
+def _batch_result(
+    results: List[schemas.HypothesisBatchItemResult], result_type: type = schemas.HypothesisBatchResult
+) -> schemas.HypothesisBatchResult:
+    failed = sum(1 for result in results if result.error is not None)
+    return result_type(items=results, succeeded=len(results) - failed, failed=failed)
+
+
+def _transition_blocker(
+    row: Row | HypothesisRecord,
+    target: schemas.StageLiteral,
+    blockers: Optional[tuple[List[str], List[str]]] = None,
+) -> Optional[str]:
+    """Return why ``row`` may not move to ``target``, from its gate readiness columns.
+
+    ``blockers`` are the checklist labels and approver names from
+    ``HypothesisRepository.gate_blockers``; without them only the counts are reported.
+    """
+    if target == "ARCHIVED":
+        return "Archive hypotheses with DELETE /hypotheses/{hypId}."
+    if row.stage not in STAGE_ORDER or STAGE_ORDER.index(target) <= STAGE_ORDER.index(row.stage):
+        return None  # gates only guard forward moves
+    checklist, approvers = blockers or ([], [])
+    if row.incomplete_checklist_count:
+        if checklist:
+            return f"Checklist items must be completed before moving to {target}: {', '.join(checklist)}"
+        return f"{row.incomplete_checklist_count} checklist item(s) must be completed before moving to {target}."
+    if row.pending_approval_count:
+        if approvers:
+            return f"Required approvals pending: {', '.join(approvers)}"
+        return f"{row.pending_approval_count} required approval(s) pending."
+    return None
 
 
 class HypothesisService:
     """Business logic and aggregations for the hypothesis domain."""
 
-    def __init__(self, repository: HypothesisRepository):
+    def __init__(self, repository: HypothesisRepository, detail_cache: Optional[DetailCache] = None):
         self.repository = repository
+        self.detail_cache = detail_cache if detail_cache is not None else get_detail_cache()
 
-    def list_hypotheses(self) -> List[schemas.Hypothesis]:
-        records = self.repository.list()
-        return [self.repository.record_to_light(record) for record in records]
+    def list_hypotheses(
+        self,
+        filters: schemas.HypothesisListFilters,
+        *,
+        sort: schemas.HypothesisSortLiteral = "createdAt",
+        order: schemas.SortOrderLiteral = "desc",
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> schemas.HypothesisPage:
+        after = None
+        if cursor:
+            try:
+                after = decode_list_cursor(cursor, sort)
+            except ValueError as exc:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from None
+
+        rows = self.repository.list_page(
+            filters, sort=sort, descending=order == "desc", after=after, limit=limit + 1
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_list_cursor(sort, rows[-1].sort_value, rows[-1].id)
+        return schemas.HypothesisPage(
+            items=[self.repository.row_to_light(row) for row in rows],
+            next_cursor=next_cursor,
+        )
 
-    def get(self, hyp_id: str) -> schemas.HypothesisDetail:
+    def search(self, query: str, *, limit: int = 20) -> List[schemas.HypothesisSearchHit]:
+        """Rank active hypotheses against a free-text query with ``key:value`` operators."""
+        parsed = parse_search_query(query)
+        if parsed is None:
+            return []
+        terms, hyp_id_prefix, filters = parsed
+        rows = self.repository.search(terms, filters, hyp_id_prefix=hyp_id_prefix, limit=limit)
+        return [
+            schemas.HypothesisSearchHit(
+                **self.repository.row_to_light(row).model_dump(), lab_id=row.lab_id, score=round(row.score, 6)
+            )
+            for row in rows
+        ]
+
+    def export(
+        self,
+        filters: schemas.HypothesisListFilters,
+        *,
+        export_format: schemas.ExportFormatLiteral,
+        columns: List[str],
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> Iterator[str]:
+        """Render active hypotheses as NDJSON lines or CSV rows, one chunk per batch.
+
+        ``columns`` are attribute names from :func:`resolve_export_columns`. Nothing is
+        kept between chunks, so the caller can stream an export of any size.
+        """
+        include = set(columns)
+        writer = None
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow([schemas.HypothesisDetail.model_fields[name].alias for name in columns])
+
+        for batch in self.repository.stream_active(filters, batch_size=batch_size):
+            details = (self.repository.record_to_detail(record) for record in batch)
+            if writer is None:
+                yield "".join(detail.model_dump_json(by_alias=True, include=include) + "\n" for detail in details)
+                continue
+            for detail in details:
+                values = detail.model_dump(mode="json", include=include)
+                writer.writerow([_csv_cell(values[name]) for name in columns])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if writer is not None and buffer.tell():
+            yield buffer.getvalue()  # header only: nothing matched the filters
+
+    def list_activity(
+        self, hyp_id: str, *, cursor: Optional[str] = None, limit: int = 50
+    ) -> schemas.HypothesisActivityPage:
+        """Page through a hypothesis' full activity history, newest first."""
+        record = self._get_active_record(hyp_id)
+        after = None
+        if cursor:
+            try:
+                after = decode_list_cursor(cursor, "occurredAt")
+            except ValueError as exc:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from None
+
+        events = self.repository.recent_activity_events(record, after=after, limit=limit + 1)
+        next_cursor = None
+        if len(events) > limit:
+            events = events[:limit]
+            next_cursor = encode_list_cursor("occurredAt", events[-1].occurred_at, events[-1].id)
+        return schemas.HypothesisActivityPage(
+            items=[self.repository.event_to_activity(record, event) for event in events],
+            next_cursor=next_cursor,
+        )
+
+    def get(self, hyp_id: str, *, if_none_match: Optional[str] = None) -> schemas.HypothesisDetail:
+        """Return the detail view, or raise ``304`` when ``if_none_match`` names the current version.
+
+        The conditional check reads only the version column, so a revalidation never
+        fetches or renders the read model.
+        """
+        if if_none_match:
+            version = self.repository.get_active_version(hyp_id)
+            if version is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Hypothesis '{hyp_id}' not found.")
+            etag = record_etag(version)
+            if etag_matches(if_none_match, etag):
+                raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
         record = self._get_active_record(hyp_id)
         return self.repository.record_to_detail(record)
 
-    def create(self, payload: schemas.HypothesisCreatePayload) -> schemas.HypothesisDetail:
+    def get_rendered(self, hyp_id: str, *, if_none_match: Optional[str] = None) -> RenderedDetail:
+        """Return the serialized detail view through the detail cache.
+
+        The version column is read first: it answers ``if_none_match`` and keys the
+        cache lookup, so a hit costs that one statement and no rendering. Misses load
+        the record and cache the body under the version it was rendered from.
+        """
+        version = self.repository.get_active_version(hyp_id)
+        if version is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Hypothesis '{hyp_id}' not found.")
+        etag = record_etag(version)
+        if if_none_match and etag_matches(if_none_match, etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        body = self.detail_cache.get(hyp_id, version)
+        if body is not None:
+            return RenderedDetail(version, body)
+
+        record = self._get_active_record(hyp_id)
+        body = self.repository.record_to_detail(record).model_dump_json(by_alias=True).encode()
+        self.detail_cache.set(hyp_id, record.version, body)
+        return RenderedDetail(record.version, body)
+
+    def replay_changes(
+        self,
+        hyp_id: Optional[str] = None,
+        *,
+        after_event_id: Optional[str] = None,
+        batch_size: int = CHANGE_REPLAY_BATCH_SIZE,
+    ) -> Iterator[List[schemas.HypothesisChange]]:
+        """Yield the persisted changes after ``after_event_id``, oldest first, in batches.
+
+        Backs change feed resumption once the event has left the in-process buffer.
+        The first batch is yielded, possibly empty, right after ``hyp_id`` is checked,
+        so a missing hypothesis fails before the stream starts. An unknown event id
+        replays nothing.
+        """
+        if hyp_id is not None and self.repository.get_active_version(hyp_id) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Hypothesis '{hyp_id}' not found.")
+        position = self.repository.activity_position(after_event_id) if after_event_id else None
+        if position is None:
+            yield []
+            return
+        after = (position.occurred_at, position.id)
+        while True:
+            rows = self.repository.change_rows_after(after, hyp_id=hyp_id, limit=batch_size)
+            yield [self.repository.row_to_change(row) for row in rows]
+            if len(rows) < batch_size:
+                return
+            after = (rows[-1].occurred_at, rows[-1].id)
+
+    def create(
+        self, payload: schemas.HypothesisCreatePayload, *, minimal: bool = False
+    ) -> schemas.HypothesisDetail | schemas.HypothesisVersion:
         if not payload.owners:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="At least one owner is required.")
 
-        now = datetime.now(timezone.utc)
+        record = self._new_record(self.repository.next_hyp_id(), payload, datetime.now(timezone.utc))
+        self._persist(record)
+        return self._write_result(record, minimal)
+
+    def create_many(self, items: List[dict]) -> schemas.HypothesisBatchResult:
+        """Create every valid item in one transaction and report per-item outcomes.
+
+        Items are validated independently; identifiers for the accepted ones are
+        reserved with a single counter bump and all rows are written with one Core
+        INSERT per table, however many items the batch holds.
+        """
+        results: List[Optional[schemas.HypothesisBatchItemResult]] = [None] * len(items)
+        accepted: List[tuple[int, schemas.HypothesisCreatePayload]] = []
+        for index, raw in enumerate(items):
+            try:
+                payload = schemas.HypothesisCreatePayload.model_validate(raw)
+            except ValidationError as exc:
+                results[index] = _batch_failure(index, status.HTTP_422_UNPROCESSABLE_ENTITY, _validation_message(exc))
+                continue
+            if not payload.owners:
+                results[index] = _batch_failure(
+                    index, status.HTTP_400_BAD_REQUEST, "At least one owner is required."
+                )
+                continue
+            accepted.append((index, payload))
+
+        if accepted:
+            new_rows = self._insert_new([payload for _, payload in accepted], datetime.now(timezone.utc))
+            self.repository.commit()
+            self._publish_created(new_rows)
+            for (index, _), (values, _) in zip(accepted, new_rows):
+                results[index] = schemas.HypothesisBatchItemResult(
+                    index=index, hyp_id=values["hyp_id"], status=status.HTTP_201_CREATED, version=values["version"]
+                )
+        return _batch_result(results)
+
+    def import_rows(
+        self, rows: Iterable[ImportRow], *, chunk_size: int = IMPORT_CHUNK_SIZE
+    ) -> Iterator[schemas.HypothesisImportProgress]:
+        """Validate parsed import rows and bulk-insert the valid ones, one transaction per chunk.
+
+        Yields running totals after every chunk with that chunk's rejected rows, then a
+        final total with ``done`` set. Chunks already committed stay imported when a
+        later one fails.
+        """
+        rows = iter(rows)
+        processed = imported = 0
+        while chunk := list(islice(rows, chunk_size)):
+            accepted: List[schemas.HypothesisCreatePayload] = []
+            errors: List[schemas.HypothesisImportError] = []
+            for item in chunk:
+                error = item.error
+                if error is None:
+                    try:
+                        payload = schemas.HypothesisCreatePayload.model_validate(item.values)
+                    except ValidationError as exc:
+                        error = _validation_message(exc)
+                    else:
+                        if payload.owners:
+                            accepted.append(payload)
+                        else:
+                            error = "At least one owner is required."
+                if error is not None:
+                    errors.append(schemas.HypothesisImportError(row=item.row, error=error))
+
+            if accepted:
+                new_rows = self._insert_new(accepted, datetime.now(timezone.utc))
+                self.repository.commit()
+                self._publish_created(new_rows)
+            processed += len(chunk)
+            imported += len(accepted)
+            yield schemas.HypothesisImportProgress(
+                processed=processed, imported=imported, failed=processed - imported, errors=errors
+            )
+        yield schemas.HypothesisImportProgress(
+            processed=processed, imported=imported, failed=processed - imported, done=True
+        )
+
+    def _insert_new(
+        self, payloads: List[schemas.HypothesisCreatePayload], now: datetime
+    ) -> List[tuple[dict, Dict[type, List[dict]]]]:
+        """Bulk-insert new hypotheses with their outbox events and refocus the dashboard.
+
+        Shared by batch creates and imports; the caller commits. Returns the inserted
+        rows as built by :meth:`_new_row`.
+        """
+        hyp_ids = self.repository.allocate_hyp_ids(len(payloads))
+        new_rows = [self._new_row(hyp_id, payload, now) for hyp_id, payload in zip(hyp_ids, payloads)]
+        self.repository.insert_bulk(new_rows)
+        self.repository.insert_outbox_events(
+            [
+                {
+                    "event_type": "HypothesisCreated",
+                    "hyp_id": values["hyp_id"],
+                    "occurred_at": now,
+                    "payload": {
+                        "stage": values["stage"],
+                        "title": values["title"],
+                        "labId": values["lab_id"],
+                        "actor": payload.owners[0].name,
+                    },
+                }
+                for (values, _), payload in zip(new_rows, payloads)
+            ]
+        )
+        self._refocus_dashboard_snapshot()
+        return new_rows
+
+    def _publish_created(self, new_rows: List[tuple[dict, Dict[type, List[dict]]]]) -> None:
+        """Push the activity events of committed :meth:`_insert_new` rows to the change feed."""
+        if change_feed.running:
+            changes = [
+                self.repository.row_to_change(SimpleNamespace(**event, hyp_id=values["hyp_id"]))
+                for values, children in new_rows
+                for event in children[HypothesisActivityEvent]
+            ]
+            changes.sort(key=lambda change: (change.occurred_at, change.id))
+            change_feed.publish(changes)
+
+    def _new_row(
+        self, hyp_id: str, payload: schemas.HypothesisCreatePayload, now: datetime
+    ) -> tuple[dict, Dict[type, List[dict]]]:
+        """Bulk-insert counterpart of :meth:`_new_record`: the row and its child rows as dicts."""
+        stage = payload.initial_stage or "IDEATION"
+        owner_name = payload.owners[0].name
+        row = {**self._create_values(hyp_id, stage, payload), "created_at": now, "updated_at": now}
+        children: Dict[type, List[dict]] = {
+            HypothesisStageHistoryEntry: [
+                {
+                    "from_stage": None,
+                    "to_stage": stage,
+                    "changed_at": now,
+                    "changed_by": owner_name,
+                    "notes": "Initial submission",
+                }
+            ],
+            HypothesisChecklistItem: [
+                {
+                    "label": item.label,
+                    "owner_name": item.owner,
+                    "status": item.status,
+                    "due_at": item.due_at.replace(tzinfo=timezone.utc)
+                    if item.due_at and item.due_at.tzinfo is None
+                    else item.due_at,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for item in payload.gating_checklist
+            ],
+            HypothesisActivityEvent: [
+                {
+                    "event_type": "CREATED",
+                    "title": "Hypothesis created",
+                    "actor_name": owner_name,
+                    "occurred_at": now,
+                    "stage": stage,
+                    "impact": "positive",
+                    "extra_metadata": {},
+                }
+            ],
+        }
+        return row, children
+
+    def _new_record(
+        self, hyp_id: str, payload: schemas.HypothesisCreatePayload, now: datetime
+    ) -> HypothesisRecord:
         stage = payload.initial_stage or "IDEATION"
-        hyp_id = self.repository.next_hyp_id()
         owner_name = payload.owners[0].name
 
         record = self._build_record_from_create_payload(hyp_id, stage, owner_name, now, payload)
@@ -149,19 +673,216 @@ class HypothesisService:
             stage=stage,
             impact="positive",
         )
-        self._refresh_denormalized_fields(record)
-        self.repository.save(record)
-        refreshed = self.repository.get_by_hyp_id(record.hyp_id)
-        target = refreshed or record
-        return self.repository.record_to_detail(target)
+        self._emit(record, "HypothesisCreated", now, title=record.title, labId=record.lab_id, actor=owner_name)
+        return record
 
-    def update(self, hyp_id: str, payload: schemas.HypothesisUpdatePayload) -> schemas.HypothesisDetail:
+    def update(
+        self,
+        hyp_id: str,
+        payload: schemas.HypothesisUpdatePayload,
+        *,
+        minimal: bool = False,
+        if_match: Optional[str] = None,
+    ) -> schemas.HypothesisDetail | schemas.HypothesisVersion:
         record = self._get_active_record(hyp_id)
+        if if_match and not etag_matches(if_match, record_etag(record.version), weak=False):
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail=f"Hypothesis '{hyp_id}' is at version {record.version}; reload and retry.",
+                headers={"ETag": record_etag(record.version)},
+            )
         update_data = payload.model_dump(exclude_none=True, by_alias=False)
         if not update_data:
-            return self.repository.record_to_detail(record)
+            return self._write_result(record, minimal)
+
+        self._apply_update(record, update_data, datetime.now(timezone.utc))
+        self._persist(record)
+        return self._write_result(record, minimal)
+
+    def update_many(self, items: List[dict]) -> schemas.HypothesisBatchResult:
+        """Apply partial updates to many hypotheses and commit them together.
+
+        Targets are loaded in one query. Items that fail validation, reference an
+        unknown hypothesis, repeat an earlier item's hypothesis or hit a stage gate
+        are reported without blocking the rest.
+        """
+        results: List[Optional[schemas.HypothesisBatchItemResult]] = [None] * len(items)
+        parsed: List[tuple[int, schemas.HypothesisBatchUpdateItem]] = []
+        for index, raw in enumerate(items):
+            try:
+                parsed.append((index, schemas.HypothesisBatchUpdateItem.model_validate(raw)))
+            except ValidationError as exc:
+                results[index] = _batch_failure(index, status.HTTP_422_UNPROCESSABLE_ENTITY, _validation_message(exc))
+
+        records = self.repository.get_many_by_hyp_ids([item.hyp_id for _, item in parsed])
+        now = datetime.now(timezone.utc)
+        applied: List[tuple[int, HypothesisRecord]] = []
+        seen = set()
+        for index, item in parsed:
+            record = records.get(item.hyp_id)
+            if record is None or record.archived_at is not None:
+                results[index] = _batch_failure(
+                    index, status.HTTP_404_NOT_FOUND, f"Hypothesis '{item.hyp_id}' not found.", item.hyp_id
+                )
+                continue
+            if item.hyp_id in seen:
+                # Gates read the stored readiness columns, which an earlier item may have made stale.
+                results[index] = _batch_failure(
+                    index, status.HTTP_409_CONFLICT, f"Hypothesis '{item.hyp_id}' is listed twice.", item.hyp_id
+                )
+                continue
+            seen.add(item.hyp_id)
+            update_data = item.model_dump(exclude_none=True, by_alias=False, exclude={"hyp_id"})
+            if update_data:
+                try:
+                    self._apply_update(record, update_data, now)
+                except HTTPException as exc:
+                    results[index] = _batch_failure(index, exc.status_code, str(exc.detail), item.hyp_id)
+                    continue
+            applied.append((index, record))
+
+        touched = list({id(record): record for _, record in applied}.values())
+        if touched:
+            self._persist(*touched)
+        for index, record in applied:
+            results[index] = schemas.HypothesisBatchItemResult(
+                index=index, hyp_id=record.hyp_id, status=status.HTTP_200_OK, version=record.version
+            )
+        return _batch_result(results)
+
+    def transition(
+        self, hyp_id: str, payload: schemas.HypothesisTransitionPayload
+    ) -> schemas.HypothesisTransitionResult:
+        """Move one hypothesis to ``payload.stage``; a blocked gate raises like ``PATCH`` does."""
+        result = self._transition([(0, hyp_id, payload)])[0]
+        if result.error is not None:
+            raise HTTPException(status_code=result.status, detail=result.error)
+        return result
+
+    def transition_many(self, items: List[dict]) -> schemas.HypothesisTransitionBatchResult:
+        """Move many hypotheses between stages in one transaction with per-item results.
+
+        Gates are checked for the whole batch with one query and the transitions that
+        pass are written with one statement per table. Blocked or unknown items are
+        reported without holding back the rest.
+        """
+        results: Dict[int, schemas.HypothesisTransitionResult] = {}
+        parsed: List[tuple[int, str, schemas.HypothesisTransitionPayload]] = []
+        for index, raw in enumerate(items):
+            try:
+                item = schemas.HypothesisBatchTransitionItem.model_validate(raw)
+            except ValidationError as exc:
+                results[index] = schemas.HypothesisTransitionResult(
+                    index=index, status=status.HTTP_422_UNPROCESSABLE_ENTITY, error=_validation_message(exc)
+                )
+                continue
+            parsed.append((index, item.hyp_id, item))
+        for result in self._transition(parsed):
+            results[result.index] = result
+        return _batch_result(
+            [results[index] for index in range(len(items))], schemas.HypothesisTransitionBatchResult
+        )
 
+    def _transition(
+        self, items: Sequence[tuple[int, str, schemas.HypothesisTransitionPayload]]
+    ) -> List[schemas.HypothesisTransitionResult]:
+        gates = self.repository.transition_gate_rows(hyp_id for _, hyp_id, _ in items)
         now = datetime.now(timezone.utc)
+        results: List[schemas.HypothesisTransitionResult] = []
+        transitions: List[tuple[Row, dict, dict]] = []
+        outbox: List[dict] = []
+        seen = set()
+        gated: List[tuple[schemas.HypothesisTransitionResult, Row]] = []
+        for index, hyp_id, payload in items:
+            row = gates.get(hyp_id)
+            if row is None:
+                results.append(
+                    schemas.HypothesisTransitionResult(
+                        index=index,
+                        hyp_id=hyp_id,
+                        status=status.HTTP_404_NOT_FOUND,
+                        error=f"Hypothesis '{hyp_id}' not found.",
+                    )
+                )
+                continue
+            result = schemas.HypothesisTransitionResult(
+                index=index,
+                hyp_id=hyp_id,
+                status=status.HTTP_200_OK,
+                version=row.version,
+                from_stage=row.stage,
+                to_stage=payload.stage,
+            )
+            results.append(result)
+            blocker = _transition_blocker(row, payload.stage)
+            if hyp_id in seen:
+                result.status, result.error = status.HTTP_409_CONFLICT, f"Hypothesis '{hyp_id}' is listed twice."
+            elif blocker is not None:
+                result.status, result.error = status.HTTP_400_BAD_REQUEST, blocker
+                if payload.stage != "ARCHIVED":
+                    gated.append((result, row))
+            seen.add(hyp_id)
+            if result.error is not None or row.stage == payload.stage:
+                continue
+            result.version = row.version + 1
+            transitions.append(
+                (
+                    row,
+                    {
+                        "from_stage": row.stage,
+                        "to_stage": payload.stage,
+                        "changed_at": now,
+                        "changed_by": payload.changed_by,
+                        "notes": payload.notes or "Stage transition via API",
+                    },
+                    {
+                        "event_type": "STAGE_CHANGED",
+                        "title": f"Hypothesis moved to {payload.stage.title()}",
+                        "actor_name": payload.changed_by,
+                        "detail": payload.notes,
+                        "stage": payload.stage,
+                        "impact": "positive",
+                        "occurred_at": now,
+                    },
+                )
+            )
+            outbox.append(
+                {
+                    "event_type": "HypothesisStageChanged",
+                    "hyp_id": hyp_id,
+                    "occurred_at": now,
+                    "payload": {
+                        "stage": payload.stage,
+                        "fromStage": row.stage,
+                        "toStage": payload.stage,
+                        "actor": payload.changed_by,
+                    },
+                }
+            )
+
+        if gated:
+            blockers = self.repository.gate_blockers(row.id for _, row in gated)
+            for result, row in gated:
+                result.error = _transition_blocker(row, result.to_stage, blockers[row.id])
+        if transitions:
+            try:
+                changes = self.repository.apply_stage_transitions(transitions, updated_at=now)
+            except StaleDataError:
+                self.repository.session.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Hypotheses were modified concurrently; reload and retry.",
+                ) from None
+            self.repository.insert_outbox_events(outbox)
+            self._refocus_dashboard_snapshot()
+            self.repository.commit()
+            self.detail_cache.invalidate(row.hyp_id for row, _, _ in transitions)
+            if change_feed.running:
+                change_feed.publish(sorted(changes, key=lambda change: (change.occurred_at, change.id)))
+        return results
+
+    def _apply_update(self, record: HypothesisRecord, update_data: Dict[str, object], now: datetime) -> None:
+        """Mutate ``record`` in place; stage gates are checked before anything changes."""
         actor = update_data.pop("updated_by", "System")
 
         stage_changed = False
@@ -179,7 +900,11 @@ class HypothesisService:
                 notes="Stage updated via API",
             )
             record.stage = new_stage
+            self._emit(record, "HypothesisStageChanged", now, fromStage=current_stage, toStage=new_stage, actor=actor)
 
+        changed_fields = [schemas.to_camel(field) for field in update_data if field != "stage"]
+        if changed_fields:
+            self._emit(record, "HypothesisUpdated", now, fields=changed_fields, actor=actor)
         self._apply_updates(record, update_data)
 
         record.updated_at = now
@@ -194,12 +919,6 @@ class HypothesisService:
             stage=record.stage,
             impact="positive" if stage_changed else "neutral",
         )
-        self._refresh_denormalized_fields(record)
-
-        self.repository.save(record)
-        refreshed = self.repository.get_by_hyp_id(record.hyp_id)
-        target = refreshed or record
-        return self.repository.record_to_detail(target)
 
     def archive(self, hyp_id: str, actor: str = "System") -> None:
         record = self._get_active_record(hyp_id)
@@ -215,6 +934,7 @@ class HypothesisService:
             changed_by=actor,
             notes="Archived via API",
         )
+        self._emit(record, "HypothesisDeleted", now, fromStage=previous_stage, actor=actor)
         self.repository.log_activity_event(
             record,
             event_type="UPDATED",
@@ -225,49 +945,123 @@ class HypothesisService:
             impact="neutral",
         )
         record.updated_at = now
-        self._refresh_denormalized_fields(record)
-        self.repository.save(record)
-
-    def build_dashboard(self) -> schemas.HypothesisDashboard:
-        records = self.repository.list()
-        if not records:
+        self._persist(record)
+
+    def build_dashboard(self, *, if_none_match: Optional[str] = None) -> schemas.HypothesisDashboard:
+        """Render the portfolio dashboard.
+
+        The snapshot row carries the portfolio version and the focus hypothesis; every
+        other section is an ordered, limited or aggregate query over the live tables.
+        Stage cards hold the :data:`DASHBOARD_STAGE_ITEM_LIMIT` newest hypotheses of
+        each stage and ``total`` counts them all.
+        Raises ``304`` when ``if_none_match`` names the current :func:`dashboard_etag`,
+        before the stage cards, highlights or activity are read.
+        """
+        snapshot = self.repository.get_dashboard_snapshot()
+        if snapshot is None:
+            snapshot = self._rebuild_dashboard_snapshot()
+        if snapshot.focus_detail is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No hypotheses available.")
 
-        stage_sections: Dict[str, schemas.HypothesisStageSummary] = {}
-        for stage in STAGE_ORDER:
-            meta = STAGE_BASELINE.get(stage, {})
-            stage_sections[stage] = schemas.HypothesisStageSummary(
-                key=stage,
-                title=str(meta.get("title", stage.title())),
-                description=str(meta.get("description", "")),
-                sla_hours=int(meta.get("sla_hours", 72)),
-                stage_owner=str(meta.get("stage_owner", "Unassigned")),
-                stage_health="on-track",
-                conversion_rate=float(meta.get("conversion_rate", 0.0)),
-                average_days_in_stage=int(meta.get("average_days_in_stage", 0)),
-                items=[],
-            )
+        now = datetime.now(timezone.utc)
+        tasks = [
+            self.repository.row_to_task(row)
+            for row in self.repository.dashboard_task_rows(now, DASHBOARD_TASK_LIMIT)
+        ]
+        etag = dashboard_etag(snapshot.version, tasks)
+        if etag_matches(if_none_match, etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        items: Dict[str, List[schemas.HypothesisSummaryItem]] = {stage: [] for stage in STAGE_ORDER}
+        for row in self.repository.dashboard_summary_rows(STAGE_ORDER, DASHBOARD_STAGE_ITEM_LIMIT):
+            items[row.stage].append(self.repository.row_to_summary(row))
+        counts = self.repository.dashboard_stage_counts()
+        return schemas.HypothesisDashboard(
+            version=snapshot.version,
+            stages=[self._stage_section(stage, items[stage], counts.get(stage, 0)) for stage in STAGE_ORDER],
+            highlights=self._build_highlights(self.repository.dashboard_highlight_totals()),
+            focus_hypothesis=schemas.HypothesisDetail.model_validate(snapshot.focus_detail),
+            tasks=tasks,
+            activity=[
+                self.repository.row_to_activity(row)
+                for row in self.repository.dashboard_activity_rows(DASHBOARD_ACTIVITY_LIMIT)
+            ],
+        )
 
-        for record in records:
-            target_stage = record.stage if record.stage in stage_sections else "IDEATION"
-            summary = self.repository.record_to_summary(record)
-            summary.next_gate = NEXT_STAGE_GATE.get(record.stage)
-            summary.last_updated = record.updated_at or record.created_at
-            stage_sections[target_stage].items.append(summary)
+    def _stage_section(
+        self, stage: schemas.StageLiteral, items: List[schemas.HypothesisSummaryItem], total: int
+    ) -> schemas.HypothesisStageSummary:
+        meta = STAGE_BASELINE.get(stage, {})
+        return schemas.HypothesisStageSummary(
+            key=stage,
+            title=str(meta.get("title", stage.title())),
+            description=str(meta.get("description", "")),
+            sla_hours=int(meta.get("sla_hours", 72)),
+            stage_owner=str(meta.get("stage_owner", "Unassigned")),
+            stage_health="on-track",
+            conversion_rate=float(meta.get("conversion_rate", 0.0)),
+            average_days_in_stage=int(meta.get("average_days_in_stage", 0)),
+            total=total,
+            items=items,
+        )
 
-        focus_record = max(records, key=lambda r: r.updated_at or r.created_at)
-        focus_detail = self.repository.record_to_detail(focus_record)
+    def _focus_detail(self, record: Optional[HypothesisRecord]) -> Optional[dict]:
+        return self.repository.record_to_detail(record).model_dump(mode="json") if record else None
 
-        highlights = self._build_highlights(records)
-        tasks = self._build_tasks(records)
-        activity = self._aggregate_activity(records)
+    def _rebuild_dashboard_snapshot(self) -> HypothesisDashboardSnapshot:
+        """Create the snapshot row from the most recently updated hypothesis."""
+        focus_record = self.repository.latest_active_record()
+        snapshot = self.repository.save_dashboard_snapshot(
+            focus_hyp_id=focus_record.hyp_id if focus_record else None,
+            focus_detail=self._focus_detail(focus_record),
+        )
+        self.repository.commit()
+        return snapshot
 
-        return schemas.HypothesisDashboard(
-            stages=list(stage_sections.values()),
-            highlights=highlights,
-            focus_hypothesis=focus_detail,
-            tasks=tasks,
-            activity=activity,
+    def _refocus_dashboard_snapshot(self) -> None:
+        """Bump the snapshot version and focus the most recently updated hypothesis.
+
+        Used by bulk writes, whose rows never exist as ORM instances in the session.
+        """
+        snapshot = self.repository.get_dashboard_snapshot(for_update=True)
+        if snapshot is None:
+            return
+        focus_record = self.repository.latest_active_record()
+        self.repository.save_dashboard_snapshot(
+            focus_hyp_id=focus_record.hyp_id if focus_record else None,
+            focus_detail=self._focus_detail(focus_record),
+            snapshot=snapshot,
+        )
+
+    def _sync_dashboard_snapshot(self, *records: HypothesisRecord) -> None:
+        """Bump the portfolio version and move the focus to the newest of ``records``.
+
+        Runs inside the mutation's transaction so the snapshot commits atomically with
+        the change. When no snapshot exists yet the next read creates it.
+        """
+        snapshot = self.repository.get_dashboard_snapshot(for_update=True)
+        if snapshot is None:
+            return
+
+        focus_hyp_id, focus_detail = snapshot.focus_hyp_id, snapshot.focus_detail
+        active = [record for record in records if record.archived_at is None]
+        newest = max(active, key=lambda record: self.repository._ensure_aware(record.updated_at), default=None)
+        if newest is not None and (
+            focus_detail is None
+            or newest.hyp_id == focus_hyp_id
+            or self.repository._ensure_aware(newest.updated_at) >= _parse_timestamp(focus_detail["updated_at"])
+        ):
+            focus_hyp_id, focus_detail = newest.hyp_id, self._focus_detail(newest)
+        elif any(record.hyp_id == focus_hyp_id for record in records):
+            # The focus hypothesis was archived; fall back to the next most recent one.
+            focus_record = self.repository.latest_active_record()
+            focus_hyp_id = focus_record.hyp_id if focus_record else None
+            focus_detail = self._focus_detail(focus_record)
+
+        self.repository.save_dashboard_snapshot(
+            focus_hyp_id=focus_hyp_id,
+            focus_detail=focus_detail,
+            snapshot=snapshot,
         )
 
     def _get_active_record(self, hyp_id: str) -> HypothesisRecord:
@@ -284,11 +1078,20 @@ class HypothesisService:
         now: datetime,
         payload: schemas.HypothesisCreatePayload,
     ) -> HypothesisRecord:
+        record = HypothesisRecord(**self._create_values(hyp_id, stage, payload))
+        record.created_at = now
+        record.updated_at = now
+        return record
+
+    def _create_values(
+        self, hyp_id: str, stage: schemas.StageLiteral, payload: schemas.HypothesisCreatePayload
+    ) -> dict:
+        """Column values of a new ``hypotheses`` row, shared by the ORM and bulk paths."""
         governance_state = "NOT_REQUIRED"
         if stage in {"PRIORITIZATION", "EXPERIMENTATION", "EVALUATION"}:
             governance_state = "PENDING"
 
-        record = HypothesisRecord(
+        return dict(
             hyp_id=hyp_id,
             lab_id=payload.lab_id,
             version=1,
@@ -324,9 +1127,6 @@ class HypothesisService:
             observers=[actor.model_dump(mode="json") for actor in payload.observers],
             activity_digest=[],
         )
-        record.created_at = now
-        record.updated_at = now
-        return record
 
     def _apply_updates(self, record: HypothesisRecord, update_data: Dict[str, object]) -> None:
         simple_fields = [
@@ -365,7 +1165,6 @@ class HypothesisService:
             record.success_metrics = list(update_data["success_metrics"])
         if "gating_checklist" in update_data:
             incoming_items = list(update_data["gating_checklist"] or [])
-            record.gating_checklist = []
             record.checklist_items.clear()
             for item in incoming_items:
                 item_payload = item.model_dump(mode="python") if hasattr(item, "model_dump") else dict(item)
@@ -385,8 +1184,6 @@ class HypothesisService:
                         due_at=due_at,
                     )
                 )
-        if "attachments" in update_data:
-            record.attachments = list(update_data["attachments"])
         if "data_requirements" in update_data:
             record.data_requirements = dict(update_data["data_requirements"])
         if "roi_estimate" in update_data:
@@ -416,226 +1213,70 @@ class HypothesisService:
         if target_index <= current_index:
             return
 
-        incomplete_items = [
-            item.label
-            for item in record.checklist_items
-            if item.status not in {"complete", "done"}
-        ]
-        pending_approvals = [
-            approval.approver_name
-            for approval in record.approval_records
-            if approval.required and approval.status != "approved"
-        ]
-
-        if incomplete_items:
+        if _transition_blocker(record, new_stage) is not None:
+            blockers = self.repository.gate_blockers([record.id])[record.id]
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Checklist items must be completed before moving to {new_stage}: {', '.join(incomplete_items)}",
+                status_code=status.HTTP_400_BAD_REQUEST, detail=_transition_blocker(record, new_stage, blockers)
             )
 
-        if pending_approvals:
+    def _persist(self, *records: HypothesisRecord) -> None:
+        """Commit mutated records together with their derived read models."""
+        events = self.repository.new_activity_events()
+        for record in records:
+            self.repository.refresh_read_model(record)
+        try:
+            self.repository.flush(*records)
+        except StaleDataError:
+            self.repository.session.rollback()
+            hyp_ids = ", ".join(f"'{record.hyp_id}'" for record in records)
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Required approvals pending: {', '.join(pending_approvals)}",
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Hypothesis {hyp_ids} was modified concurrently; reload and retry.",
+            ) from None
+        self._sync_dashboard_snapshot(*records)
+        self.repository.commit()
+        self.detail_cache.invalidate(record.hyp_id for record in records)
+        self._publish_changes(events)
+
+    def _publish_changes(self, events: List[HypothesisActivityEvent]) -> None:
+        """Push committed activity events to the change feed in replay order."""
+        if change_feed.running and events:
+            events.sort(key=lambda event: (event.occurred_at, event.id))
+            change_feed.publish([self.repository.event_to_change(event) for event in events])
+
+    def _emit(self, record: HypothesisRecord, event_type: str, occurred_at: datetime, **data: Any) -> None:
+        """Stage a domain event in the outbox, inside the transaction that commits ``record``."""
+        self.repository.add_outbox_event(record.hyp_id, event_type, occurred_at, {"stage": record.stage, **data})
+
+    def _write_result(
+        self, record: HypothesisRecord, minimal: bool
+    ) -> schemas.HypothesisDetail | schemas.HypothesisVersion:
+        """Render a write response from the in-session object graph without reloading."""
+        if minimal:
+            return schemas.HypothesisVersion(
+                hyp_id=record.hyp_id,
+                version=record.version,
+                updated_at=record.updated_at,
             )
+        return self.repository.record_to_detail(record)
 
-    def _refresh_denormalized_fields(self, record: HypothesisRecord) -> None:
-        record.gating_checklist = [
-            {
-                "id": item.id,
-                "label": item.label,
-                "status": item.status,
-                "owner": item.owner_name or item.owner_email or "",
-                "owner_email": item.owner_email,
-                "due_at": item.due_at.isoformat() if item.due_at else None,
-            }
-            for item in record.checklist_items
-        ]
-
-        record.attachments = [
-            {
-                "id": attachment.id,
-                "name": attachment.file_name,
-                "url": attachment.url,
-                "version": attachment.version,
-                "uploaded_at": attachment.uploaded_at.isoformat() if attachment.uploaded_at else None,
-                "uploaded_by": attachment.uploaded_by,
-                "uploaded_by_email": attachment.uploaded_by_email,
-            }
-            for attachment in record.attachment_records
-        ]
-
-        sorted_events = sorted(
-            record.activity_events,
-            key=lambda event: self.repository._ensure_aware(event.occurred_at)
-            or datetime.min.replace(tzinfo=timezone.utc),
-            reverse=True,
-        )
-        record.activity_digest = [
-            {
-                "id": event.id,
-                "type": event.event_type,
-                "title": event.title,
-                "actor": event.actor_name,
-                "detail": event.detail,
-                "occurred_at": (
-                    self.repository._ensure_aware(event.occurred_at).isoformat()
-                    if event.occurred_at
-                    else None
-                ),
-                "stage": event.stage or record.stage,
-                "impact": event.impact or "neutral",
-            }
-            for event in sorted_events
-        ]
-
-    def _build_highlights(self, records: List[HypothesisRecord]) -> schemas.HypothesisHighlights:
-        total_value = 0.0
-        experiments = 0
-        governance_pending = 0
-        total_weeks = 0
-        weeks_count = 0
-
-        for record in records:
-            roi = record.roi_estimate or {}
-            total_value += float(roi.get("one_time_cost") or 0)
-            experiments += len(record.linked_experiments or [])
-            if record.governance_state == "PENDING":
-                governance_pending += 1
-            time_estimate = record.time_estimate or {}
-            production_weeks = time_estimate.get("production_weeks")
-            if production_weeks is not None:
-                total_weeks += int(production_weeks)
-                weeks_count += 1
-
+    def _build_highlights(self, totals: Row) -> schemas.HypothesisHighlights:
+        """Format the figures from :meth:`HypothesisRepository.dashboard_highlight_totals`."""
+        total_value = float(totals.portfolio_value or 0)
         portfolio_value = (
-            f"${total_value / 1_000_000:.1f}M potential" if total_value else f"{len(records)} active hypotheses"
+            f"${total_value / 1_000_000:.1f}M potential" if total_value else f"{totals.hypotheses} active hypotheses"
+        )
+        avg_time_to_value = (
+            f"{int(totals.production_weeks) // totals.estimated} weeks" if totals.estimated else "n/a"
         )
-        avg_time_to_value = f"{total_weeks // weeks_count} weeks" if weeks_count else "n/a"
 
         return schemas.HypothesisHighlights(
             portfolio_value=portfolio_value,
-            experiments_in_flight=experiments,
+            experiments_in_flight=int(totals.experiments or 0),
             avg_time_to_value=avg_time_to_value,
-            governance_pending=governance_pending,
+            governance_pending=int(totals.governance_pending or 0),
         )
 
-    def _build_tasks(self, records: List[HypothesisRecord]) -> List[schemas.HypothesisTask]:
-        tasks: List[schemas.HypothesisTask] = []
-        now = datetime.now(timezone.utc)
-
-        for record in records:
-            for item in record.checklist_items:
-                status = item.status or "pending"
-                if status == "complete":
-                    continue
-                due_dt = item.due_at or (record.updated_at or now)
-                if due_dt.tzinfo is None:
-                    due_dt = due_dt.replace(tzinfo=timezone.utc)
-                label = item.label or "Checklist item"
-                owner = item.owner_name or item.owner_email or (record.owners[0]["name"] if record.owners else "Unassigned")
-                lower_label = label.lower()
-                if due_dt < now:
-                    task_status = "at-risk"
-                elif (due_dt - now).days <= 2:
-                    task_status = "due-soon"
-                else:
-                    task_status = "blocked" if "approval" in lower_label else "due-soon"
-
-                if "data" in lower_label:
-                    task_type = "data"
-                elif "approval" in lower_label or "approve" in lower_label:
-                    task_type = "approval"
-                else:
-                    task_type = "governance"
-
-                if task_status == "at-risk":
-                    severity = "critical"
-                elif task_status == "blocked":
-                    severity = "high"
-                else:
-                    severity = "medium"
-
-                tasks.append(
-                    schemas.HypothesisTask(
-                        id=f"{record.hyp_id}-{item.id}",
-                        label=label,
-                        owner=owner,
-                        due=due_dt,
-                        type=cast(schemas.TaskTypeLiteral, task_type),
-                        status=task_status,
-                        severity=severity,
-                        related_stage=record.stage,
-                    )
-                )
-
-            for task in record.task_records:
-                due_dt = task.due or (record.updated_at or now)
-                if due_dt.tzinfo is None:
-                    due_dt = due_dt.replace(tzinfo=timezone.utc)
-                task_type = task.task_type if task.task_type in {"data", "governance", "approval"} else "governance"
-                task_status = (
-                    task.status if task.status in {"at-risk", "due-soon", "blocked"} else "due-soon"
-                )
-                task_severity = (
-                    task.severity if task.severity in {"critical", "high", "medium"} else "medium"
-                )
-                tasks.append(
-                    schemas.HypothesisTask(
-                        id=task.id,
-                        label=task.label,
-                        owner=task.owner_name or task.owner_email or "Unassigned",
-                        due=due_dt,
-                        type=cast(schemas.TaskTypeLiteral, task_type),
-                        status=cast(schemas.TaskStatusLiteral, task_status),
-                        severity=cast(schemas.TaskSeverityLiteral, task_severity),
-                        related_stage=task.related_stage or record.stage,
-                    )
-                )
-
-        tasks.sort(key=lambda task: task.due)
-        return tasks[:20]
-
-    def _aggregate_activity(self, records: List[HypothesisRecord]) -> List[schemas.HypothesisActivity]:
-        events: List[schemas.HypothesisActivity] = []
-        for record in records:
-            for event in record.activity_events:
-                occurred_at = event.occurred_at
-                if occurred_at.tzinfo is None:
-                    occurred_at = occurred_at.replace(tzinfo=timezone.utc)
-                event_type = (
-                    event.event_type
-                    if event.event_type
-                    in {
-                        "CREATED",
-                        "UPDATED",
-                        "STAGE_CHANGED",
-                        "COMMENTED",
-                        "APPROVED",
-                        "REJECTED",
-                        "ATTACHMENT_ADDED",
-                    }
-                    else "UPDATED"
-                )
-                impact = (
-                    event.impact if event.impact in {"positive", "neutral", "negative"} else "neutral"
-                )
-                events.append(
-                    schemas.HypothesisActivity(
-                        id=event.id,
-                        type=cast(schemas.ActivityTypeLiteral, event_type),
-                        title=event.title,
-                        actor=event.actor_name,
-                        detail=event.detail,
-                        occurred_at=occurred_at,
-                        stage=event.stage or record.stage,
-                        impact=cast(schemas.ImpactSentimentLiteral, impact),
-                    )
-                )
-
-        events.sort(key=lambda activity: activity.occurred_at, reverse=True)
-        return events[:25]
-
     def add_comment(self, hyp_id: str, payload: schemas.CommentCreatePayload) -> schemas.HypothesisComment:
         record = self._get_active_record(hyp_id)
         parent: HypothesisComment | None = None
@@ -667,13 +1308,17 @@ class HypothesisService:
             stage=record.stage,
             occurred_at=now,
         )
+        self._emit(
+            record,
+            "HypothesisCommented",
+            now,
+            author=payload.author.name,
+            excerpt=payload.body[:160],
+            reply=parent is not None,
+        )
         record.updated_at = now
-        self._refresh_denormalized_fields(record)
-        self.repository.save(record)
-        refreshed = self.repository.get_by_hyp_id(record.hyp_id)
-        target_record = refreshed or record
-        created = self._find_comment(target_record, comment.id)
-        return schemas.HypothesisComment.model_validate(self.repository._comment_to_dict(created))
+        self._persist(record)
+        return schemas.HypothesisComment.model_validate(self.repository._comment_to_dict(comment))
 
     def update_comment(
         self,
@@ -702,19 +1347,17 @@ class HypothesisService:
             stage=record.stage,
             detail=comment.body[:160],
         )
-        self._refresh_denormalized_fields(record)
-        self.repository.save(record)
-        refreshed = self.repository.get_by_hyp_id(record.hyp_id)
-        target_record = refreshed or record
-        updated = self._find_comment(target_record, comment_id)
-        return schemas.HypothesisComment.model_validate(self.repository._comment_to_dict(updated))
+        self._emit(record, "HypothesisUpdated", now, fields=["comments"], actor=comment.author_name)
+        self._persist(record)
+        return schemas.HypothesisComment.model_validate(self.repository._comment_to_dict(comment))
 
     def delete_comment(self, hyp_id: str, comment_id: str) -> None:
         record = self._get_active_record(hyp_id)
         comment = self._find_comment(record, comment_id)
         if comment is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found.")
-        self.repository.session.delete(comment)
+        siblings = comment.parent.replies if comment.parent is not None else record.comment_threads
+        siblings.remove(comment)
         now = datetime.now(timezone.utc)
         record.updated_at = now
         self.repository.log_activity_event(
@@ -725,8 +1368,8 @@ class HypothesisService:
             occurred_at=now,
             stage=record.stage,
         )
-        self._refresh_denormalized_fields(record)
-        self.repository.save(record)
+        self._emit(record, "HypothesisUpdated", now, fields=["comments"], actor="System")
+        self._persist(record)
 
     def add_attachment(self, hyp_id: str, payload: schemas.AttachmentCreatePayload) -> schemas.HypothesisAttachment:
         record = self._get_active_record(hyp_id)
@@ -750,23 +1393,17 @@ class HypothesisService:
             occurred_at=now,
             stage=record.stage,
         )
-        self._refresh_denormalized_fields(record)
-        self.repository.save(record)
-        refreshed = self.repository.get_by_hyp_id(record.hyp_id)
-        target_record = refreshed or record
-        created = next(
-            (item for item in target_record.attachment_records if item.id == attachment.id),
-            attachment,
-        )
+        self._emit(record, "HypothesisUpdated", now, fields=["attachments"], actor=payload.uploaded_by or "System")
+        self._persist(record)
         return schemas.HypothesisAttachment.model_validate(
             {
-                "id": created.id,
-                "name": created.file_name,
-                "url": created.url,
-                "version": created.version,
-                "uploaded_at": created.uploaded_at,
-                "uploaded_by": created.uploaded_by,
-                "uploaded_by_email": created.uploaded_by_email,
+                "id": attachment.id,
+                "name": attachment.file_name,
+                "url": attachment.url,
+                "version": attachment.version,
+                "uploaded_at": attachment.uploaded_at,
+                "uploaded_by": attachment.uploaded_by,
+                "uploaded_by_email": attachment.uploaded_by_email,
             }
         )
 
@@ -775,7 +1412,9 @@ class HypothesisService:
         hyp_id: str,
         item_id: str,
         payload: schemas.ChecklistItemUpdatePayload,
-    ) -> schemas.HypothesisDetail:
+        *,
+        minimal: bool = False,
+    ) -> schemas.HypothesisDetail | schemas.HypothesisVersion:
         record = self._get_active_record(hyp_id)
         item = next((entry for entry in record.checklist_items if entry.id == item_id), None)
         if item is None:
@@ -797,16 +1436,17 @@ class HypothesisService:
 
         now = datetime.now(timezone.utc)
         record.updated_at = now
-        self._refresh_denormalized_fields(record)
-        self.repository.save(record)
-        refreshed = self.repository.get_by_hyp_id(record.hyp_id)
-        return self.repository.record_to_detail(refreshed or record)
+        self._emit(record, "HypothesisUpdated", now, fields=["gatingChecklist"])
+        self._persist(record)
+        return self._write_result(record, minimal)
 
     def add_checklist_item(
         self,
         hyp_id: str,
         payload: schemas.ChecklistItemCreatePayload,
-    ) -> schemas.HypothesisDetail:
+        *,
+        minimal: bool = False,
+    ) -> schemas.HypothesisDetail | schemas.HypothesisVersion:
         record = self._get_active_record(hyp_id)
         due_at = payload.due_at
         if due_at and due_at.tzinfo is None:
@@ -821,29 +1461,31 @@ class HypothesisService:
             )
         )
         record.updated_at = datetime.now(timezone.utc)
-        self._refresh_denormalized_fields(record)
-        self.repository.save(record)
-        refreshed = self.repository.get_by_hyp_id(record.hyp_id)
-        return self.repository.record_to_detail(refreshed or record)
+        self._emit(record, "HypothesisUpdated", record.updated_at, fields=["gatingChecklist"])
+        self._persist(record)
+        return self._write_result(record, minimal)
 
-    def remove_checklist_item(self, hyp_id: str, item_id: str) -> schemas.HypothesisDetail:
+    def remove_checklist_item(
+        self, hyp_id: str, item_id: str, *, minimal: bool = False
+    ) -> schemas.HypothesisDetail | schemas.HypothesisVersion:
         record = self._get_active_record(hyp_id)
         item = next((entry for entry in record.checklist_items if entry.id == item_id), None)
         if item is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Checklist item not found.")
-        self.repository.session.delete(item)
+        record.checklist_items.remove(item)
         record.updated_at = datetime.now(timezone.utc)
-        self._refresh_denormalized_fields(record)
-        self.repository.save(record)
-        refreshed = self.repository.get_by_hyp_id(record.hyp_id)
-        return self.repository.record_to_detail(refreshed or record)
+        self._emit(record, "HypothesisUpdated", record.updated_at, fields=["gatingChecklist"])
+        self._persist(record)
+        return self._write_result(record, minimal)
 
     def update_task(
         self,
         hyp_id: str,
         task_id: str,
         payload: schemas.TaskUpdatePayload,
-    ) -> schemas.HypothesisDetail:
+        *,
+        minimal: bool = False,
+    ) -> schemas.HypothesisDetail | schemas.HypothesisVersion:
         record = self._get_active_record(hyp_id)
         task = next((entry for entry in record.task_records if entry.id == task_id), None)
         if task is None:
@@ -862,22 +1504,24 @@ class HypothesisService:
             task.owner_name = payload.owner
 
         record.updated_at = datetime.now(timezone.utc)
-        self._refresh_denormalized_fields(record)
-        self.repository.save(record)
-        refreshed = self.repository.get_by_hyp_id(record.hyp_id)
-        return self.repository.record_to_detail(refreshed or record)
+        self._emit(record, "HypothesisUpdated", record.updated_at, fields=["tasks"])
+        self._persist(record)
+        return self._write_result(record, minimal)
 
     def update_approval(
         self,
         hyp_id: str,
         approval_id: str,
         payload: schemas.ApprovalUpdatePayload,
-    ) -> schemas.HypothesisDetail:
+        *,
+        minimal: bool = False,
+    ) -> schemas.HypothesisDetail | schemas.HypothesisVersion:
         record = self._get_active_record(hyp_id)
         approval = next((entry for entry in record.approval_records if entry.id == approval_id), None)
         if approval is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Approval not found.")
 
+        decided = payload.status is not None and payload.status != approval.status
         if payload.status is not None:
             approval.status = payload.status
             approval.decided_at = datetime.now(timezone.utc) if payload.status != "pending" else None
@@ -885,10 +1529,20 @@ class HypothesisService:
             approval.notes = payload.notes
 
         record.updated_at = datetime.now(timezone.utc)
-        self._refresh_denormalized_fields(record)
-        self.repository.save(record)
-        refreshed = self.repository.get_by_hyp_id(record.hyp_id)
-        return self.repository.record_to_detail(refreshed or record)
+        if decided and approval.status in APPROVAL_EVENT_TYPES:
+            self._emit(
+                record,
+                APPROVAL_EVENT_TYPES[approval.status],
+                record.updated_at,
+                approvalId=approval.id,
+                approver=approval.approver_name,
+                role=approval.approver_role,
+                notes=approval.notes,
+            )
+        else:
+            self._emit(record, "HypothesisUpdated", record.updated_at, fields=["approvals"])
+        self._persist(record)
+        return self._write_result(record, minimal)
 
     def _find_comment(self, record: HypothesisRecord, comment_id: str) -> HypothesisComment | None:
         stack: List[HypothesisComment] = list(record.comment_threads)
@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from . import schemas
+
+logger = logging.getLogger("hypothesis.requests")
+
+
+class PoolTelemetry:
+    """Process-wide connection pool counters fed by SQLAlchemy pool events."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+            self.timeouts = 0
+            self.opened = 0
+            self.closed = 0
+            self.invalidated = 0
+
+    def instrument(self, engine: Engine) -> None:
+        """Attach pool event listeners to ``engine`` (use ``sync_engine`` for async engines)."""
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "close", self._on_close)
+        event.listen(engine, "close_detached", self._on_close_detached)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.opened += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        with self._lock:
+            self.checkouts += 1
+
+    def _on_close(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.closed += 1
+
+    def _on_close_detached(self, dbapi_connection) -> None:
+        with self._lock:
+            self.closed += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidated += 1
+
+    def snapshot(self, pool: Optional[Pool]) -> schemas.PoolStats:
+        is_queue = isinstance(pool, QueuePool)
+        with self._lock:
+            return schemas.PoolStats(
+                pool_class=type(pool).__name__ if pool is not None else "none",
+                pool_size=pool.size() if is_queue else 0,
+                checked_out=pool.checkedout() if is_queue else 0,
+                checked_in=pool.checkedin() if is_queue else 0,
+                overflow=max(pool.overflow(), 0) if is_queue else 0,
+                checkouts_total=self.checkouts,
+                checkout_wait_seconds_total=round(self.wait_seconds_total, 6),
+                checkout_wait_seconds_max=round(self.wait_seconds_max, 6),
+                checkout_timeouts_total=self.timeouts,
+                connections_opened_total=self.opened,
+                connections_closed_total=self.closed,
+                connections_invalidated_total=self.invalidated,
+            )
+
+
+pool_telemetry = PoolTelemetry()
+
+
+class _TimedCheckoutMixin:
+    """Measures how long callers wait for a pooled connection, including queueing."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            pool_telemetry.record_timeout()
+            raise
+        finally:
+            pool_telemetry.record_wait(time.perf_counter() - started)
+
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+class RequestQueryStats:
+    """SQL issued on behalf of one HTTP request."""
+
+    __slots__ = ("statements", "seconds", "slowest_seconds", "slowest_statement", "rows")
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.rows = 0
+
+    def record(self, statement: str, seconds: float, rowcount: int) -> None:
+        self.statements += 1
+        self.seconds += seconds
+        # Negative counts mean the driver does not know; they are skipped.
+        self.rows += max(rowcount, 0)
+        if seconds >= self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+
+
+# Set by the middleware for the duration of a request. Worker threads and
+# ``run_sync`` greenlets inherit the context, so cursor events see the same object.
+_request_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("hypothesis_request_stats", default=None)
+
+
+class _Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.total = 0.0
+        self.observations = 0
+
+    def observe(self, value: float) -> None:
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+        self.total += value
+        self.observations += 1
+
+    def render(self, name: str, labels: str) -> List[str]:
+        lines = [
+            f'{name}_bucket{{{labels},le="{bound:g}"}} {count}' for bound, count in zip(self.buckets, self.counts)
+        ]
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.observations}')
+        lines.append(f"{name}_sum{{{labels}}} {self.total:.6f}")
+        lines.append(f"{name}_count{{{labels}}} {self.observations}")
+        return lines
+
+
+class QueryTelemetry:
+    """Per-request SQL statistics fed by engine cursor events, aggregated per route."""
+
+    DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    STATEMENT_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 50, 100)
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests: Dict[Tuple[str, str, int], int] = {}
+            self.durations: Dict[Tuple[str, str], _Histogram] = {}
+            self.statement_counts: Dict[Tuple[str, str], _Histogram] = {}
+            self.db_seconds: Dict[Tuple[str, str], float] = {}
+            self.db_rows: Dict[Tuple[str, str], int] = {}
+
+    def instrument(self, engine: Engine) -> None:
+        """Attach cursor listeners to ``engine`` (use ``sync_engine`` for async engines)."""
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        # The start time lives on the statement's own execution context, so a statement
+        # that fails and never reaches ``after_cursor_execute`` leaves nothing behind.
+        if _request_stats.get() is not None and context is not None:
+            context._hyp_started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        stats = _request_stats.get()
+        started = getattr(context, "_hyp_started", None)
+        if stats is None or started is None:
+            return
+        # Drivers only report reliable counts for writes; SELECTs give -1 on SQLite and psycopg.
+        written = context.isinsert or context.isupdate or context.isdelete
+        stats.record(statement, time.perf_counter() - started, cursor.rowcount if written else 0)
+
+    def observe(self, method: str, route: str, status: int, seconds: float, stats: RequestQueryStats) -> None:
+        key = (method, route)
+        with self._lock:
+            self.requests[(method, route, status)] = self.requests.get((method, route, status), 0) + 1
+            self.durations.setdefault(key, _Histogram(self.DURATION_BUCKETS)).observe(seconds)
+            self.statement_counts.setdefault(key, _Histogram(self.STATEMENT_BUCKETS)).observe(stats.statements)
+            self.db_seconds[key] = self.db_seconds.get(key, 0.0) + stats.seconds
+            self.db_rows[key] = self.db_rows.get(key, 0) + stats.rows
+
+    def render_prometheus(
+        self,
+        pool: schemas.PoolStats,
+        cache: Optional[schemas.DetailCacheStats] = None,
+        outbox: Optional[schemas.OutboxStats] = None,
+    ) -> str:
+        """Render request, SQL, pool, detail cache and outbox metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP hypothesis_http_requests_total HTTP requests served.",
+            "# TYPE hypothesis_http_requests_total counter",
+        ]
+        with self._lock:
+            for (method, route, status), count in sorted(self.requests.items()):
+                lines.append(
+                    f'hypothesis_http_requests_total{{method="{method}",route="{route}",status="{status}"}} {count}'
+                )
+            sections = [
+                ("hypothesis_http_request_duration_seconds", "Request latency.", self.durations),
+                ("hypothesis_db_statements_per_request", "SQL statements issued per request.", self.statement_counts),
+            ]
+            for name, help_text, histograms in sections:
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+                for (method, route), histogram in sorted(histograms.items()):
+                    lines += histogram.render(name, f'method="{method}",route="{route}"')
+            counters = [
+                ("hypothesis_db_seconds_total", "Time spent executing SQL.", self.db_seconds),
+                ("hypothesis_db_rows_total", "Rows inserted, updated or deleted.", self.db_rows),
+            ]
+            for name, help_text, values in counters:
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+                for (method, route), value in sorted(values.items()):
+                    lines.append(f'{name}{{method="{method}",route="{route}"}} {value:g}')
+
+        gauges = {
+            "hypothesis_db_pool_size": pool.pool_size,
+            "hypothesis_db_pool_checked_out": pool.checked_out,
+            "hypothesis_db_pool_overflow": pool.overflow,
+        }
+        for name, value in gauges.items():
+            lines += [f"# TYPE {name} gauge", f"{name} {value}"]
+        pool_counters = {
+            "hypothesis_db_pool_checkouts_total": pool.checkouts_total,
+            "hypothesis_db_pool_checkout_wait_seconds_total": pool.checkout_wait_seconds_total,
+            "hypothesis_db_pool_checkout_timeouts_total": pool.checkout_timeouts_total,
+            "hypothesis_db_pool_connections_opened_total": pool.connections_opened_total,
+            "hypothesis_db_pool_connections_closed_total": pool.connections_closed_total,
+            "hypothesis_db_pool_connections_invalidated_total": pool.connections_invalidated_total,
+        }
+        for name, value in pool_counters.items():
+            lines += [f"# TYPE {name} counter", f"{name} {value:g}"]
+        if cache is not None:
+            backend = f'backend="{cache.backend}"'
+            cache_metrics = [
+                ("hypothesis_detail_cache_entries", "gauge", cache.entries),
+                ("hypothesis_detail_cache_size_bytes", "gauge", cache.size_bytes),
+            ]
+            for counter in ("hits", "misses", "evictions", "expirations", "invalidations", "errors"):
+                cache_metrics.append((f"hypothesis_detail_cache_{counter}_total", "counter", getattr(cache, counter)))
+            for name, kind, value in cache_metrics:
+                lines += [f"# TYPE {name} {kind}", f"{name}{{{backend}}} {value}"]
+        if outbox is not None:
+            publisher = f'publisher="{outbox.publisher}"'
+            outbox_metrics = [
+                ("hypothesis_outbox_pending", "gauge", outbox.pending),
+                ("hypothesis_outbox_dead", "gauge", outbox.dead),
+                ("hypothesis_outbox_oldest_pending_seconds", "gauge", outbox.oldest_pending_seconds),
+                ("hypothesis_outbox_last_publish_lag_seconds", "gauge", outbox.last_publish_lag_seconds),
+                ("hypothesis_outbox_published_total", "counter", outbox.published_total),
+                ("hypothesis_outbox_batches_total", "counter", outbox.batches_total),
+                ("hypothesis_outbox_failures_total", "counter", outbox.failures_total),
+            ]
+            for name, kind, value in outbox_metrics:
+                lines += [f"# TYPE {name} {kind}", f"{name}{{{publisher}}} {value:g}"]
+        return "\n".join(lines) + "\n"
+
+
+query_telemetry = QueryTelemetry()
+
+
+class QueryTelemetryMiddleware:
+    """Collects per-request SQL statistics and reports them as metrics, logs and headers.
+
+    Every request is logged as one JSON line on the ``hypothesis.requests`` logger, at
+    WARNING when it took ``slow_request_ms`` or longer. With ``expose_headers`` the
+    response carries ``X-DB-Statements``, ``X-DB-Time-Ms``, ``X-DB-Slowest-Ms`` and
+    ``X-DB-Rows``, the rows inserted, updated or deleted; headers go out before a
+    streamed body finishes, so they cover the work done up to that point.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        expose_headers: bool = False,
+        slow_request_ms: Optional[float] = None,
+        telemetry: QueryTelemetry = query_telemetry,
+    ):
+        self.app = app
+        self.expose_headers = expose_headers
+        self.slow_request_ms = slow_request_ms
+        self.telemetry = telemetry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_stats(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.expose_headers:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("X-DB-Statements", str(stats.statements))
+                    headers.append("X-DB-Time-Ms", f"{stats.seconds * 1000:.2f}")
+                    headers.append("X-DB-Slowest-Ms", f"{stats.slowest_seconds * 1000:.2f}")
+                    headers.append("X-DB-Rows", str(stats.rows))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _request_stats.reset(token)
+            self._report(scope, status, time.perf_counter() - started, stats)
+
+    def _report(self, scope: Scope, status: int, seconds: float, stats: RequestQueryStats) -> None:
+        # Label by route template, never the raw path, to keep metric cardinality bounded.
+        route = getattr(scope.get("route"), "path", None) or "unmatched"
+        method = scope["method"]
+        self.telemetry.observe(method, route, status, seconds, stats)
+
+        slow = self.slow_request_ms is not None and seconds * 1000 >= self.slow_request_ms
+        logger.log(
+            logging.WARNING if slow else logging.INFO,
+            json.dumps(
+                {
+                    "event": "request",
+                    "method": method,
+                    "route": route,
+                    "path": scope["path"],
+                    "status": status,
+                    "duration_ms": round(seconds * 1000, 2),
+                    "db_statements": stats.statements,
+                    "db_time_ms": round(stats.seconds * 1000, 2),
+                    "db_slowest_ms": round(stats.slowest_seconds * 1000, 2),
+                    "db_slowest_statement": (stats.slowest_statement or "")[:500] or None,
+                    "db_rows": stats.rows,
+                    "slow": slow,
+                }
+            ),
+        )
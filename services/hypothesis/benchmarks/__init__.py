@@ -0,0 +1,4 @@
+"""Standalone performance benchmarks for the hypothesis service.
+
+Run from the ``services`` directory, e.g. ``python -m hypothesis.benchmarks.read_model``.
+"""
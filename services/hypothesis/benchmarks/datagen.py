@@ -0,0 +1,318 @@
+"""Synthetic hypothesis portfolios with realistic child-row fan-out.
+
+Rows are written with chunked Core bulk inserts rather than ORM unit-of-work flushes,
+which keeps portfolios of a million hypotheses within reach.
+
+    python -m hypothesis.benchmarks.datagen --database-url sqlite:///bench.db --hypotheses 100000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import Session, sessionmaker
+
+from hypothesis.app.models import (
+    Base,
+    HypothesisActivityEvent,
+    HypothesisApproval,
+    HypothesisAttachment,
+    HypothesisChecklistItem,
+    HypothesisComment,
+    HypothesisDashboardSnapshot,
+    HypothesisStageHistoryEntry,
+    HypothesisTask,
+    generate_uuid,
+)
+from hypothesis.app.repositories import READ_MODEL_SECTIONS, HypothesisRepository
+from hypothesis.app.services import STAGE_ORDER
+
+LABS = ("LAB-ALPHA", "LAB-BETA", "LAB-GAMMA", "LAB-DELTA", "LAB-OMEGA")
+AI_TYPES = ("LLM", "CLASSICAL_ML", "CV", "NLP", "RPA", "ANALYTICS", "OTHER")
+PRIORITIES = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+RISK_CLASSES = ("LOW", "MEDIUM", "HIGH")
+CATEGORIES = ("Operations", "Customer", "Finance", "Risk", "Supply Chain", "HR")
+TAGS = ("genai", "forecasting", "automation", "compliance", "vision", "nlp", "pricing", "churn")
+PEOPLE = tuple(
+    (f"{first} {last}", f"{first.lower()}.{last.lower()}@example.com")
+    for first in ("Ana", "Ben", "Chloe", "Dmitri", "Eve", "Farid", "Grace", "Hiro")
+    for last in ("Ruiz", "Ng", "Okafor", "Larsen", "Patel")
+)
+CHECKLIST_LABELS = (
+    "Data access approved",
+    "Privacy review",
+    "Baseline metrics captured",
+    "Experiment plan signed off",
+    "Model card drafted",
+    "Security approval",
+    "Stakeholder demo",
+    "Rollback plan",
+)
+EVENT_TITLES = {
+    "UPDATED": "Hypothesis updated",
+    "COMMENTED": "New comment",
+    "ATTACHMENT_ADDED": "Attachment uploaded",
+    "APPROVED": "Approval granted",
+}
+# Stage distribution of a typical portfolio: most ideas never leave the early stages.
+STAGE_WEIGHTS = (30, 20, 15, 15, 10, 6, 4)
+
+
+class PortfolioGenerator:
+    """Deterministic generator of hypothesis rows and their child rows.
+
+    ``events`` is the mean number of activity events per hypothesis; the other
+    collections use fixed ranges scaled by ``fanout``. Rows are written with
+    :meth:`HypothesisRepository.insert_bulk`, which renders their read model, so generated
+    rows are served exactly like rows written through the API.
+    """
+
+    def __init__(self, *, seed: int = 7, events: int = 40, fanout: float = 1.0):
+        self.random = random.Random(seed)
+        self.events = events
+        self.fanout = fanout
+        self.now = datetime.now(timezone.utc)
+
+    def _count(self, low: int, high: int) -> int:
+        return self.random.randint(round(low * self.fanout), round(high * self.fanout))
+
+    def _person(self) -> tuple[str, str]:
+        return self.random.choice(PEOPLE)
+
+    def _actor(self, role: str) -> dict:
+        name, email = self._person()
+        return {"name": name, "email": email, "role": role, "department": self.random.choice(CATEGORIES)}
+
+    def hypothesis(self, hyp_id: str) -> tuple[dict, Dict[type, List[dict]]]:
+        """Return one ``hypotheses`` row and its child rows keyed by model, without foreign keys."""
+        rng = self.random
+        stage_index = rng.choices(range(len(STAGE_ORDER)), weights=STAGE_WEIGHTS)[0]
+        stage = STAGE_ORDER[stage_index]
+        created_at = self.now - timedelta(days=rng.uniform(1, 720))
+        updated_at = created_at + (self.now - created_at) * rng.random()
+        span = updated_at - created_at
+        owner = self._actor("OWNER")
+        row = {
+            "hyp_id": hyp_id,
+            "lab_id": rng.choice(LABS),
+            "version": 1,
+            "title": f"{rng.choice(CATEGORIES)} {rng.choice(TAGS)} hypothesis {hyp_id}",
+            "statement": f"We believe {rng.choice(TAGS)} will move a key {rng.choice(CATEGORIES).lower()} metric.",
+            "description": "Synthetic benchmark record. " * rng.randint(1, 6),
+            "ai_type": rng.choice(AI_TYPES),
+            "ai_subtype": None,
+            "business_category": rng.choice(CATEGORIES),
+            "priority": rng.choice(PRIORITIES),
+            "stage": stage,
+            "stage_health": rng.choices(("on-track", "warning", "risk"), weights=(70, 20, 10))[0],
+            "impact_score": round(rng.uniform(1, 10), 1),
+            "feasibility_score": round(rng.uniform(1, 10), 1),
+            "confidence_score": round(rng.random(), 2),
+            "complexity_score": round(rng.uniform(1, 10), 1),
+            "risk_class": rng.choice(RISK_CLASSES),
+            "data_requirements": {
+                "sources": rng.sample(("CRM", "ERP", "Data Lake", "Ticketing"), 2),
+                "quality": rng.choice(("UNKNOWN", "LOW", "MEDIUM", "HIGH")),
+            },
+            "roi_estimate": {
+                "currency": "USD",
+                "one_time_cost": rng.randrange(50_000, 5_000_000, 10_000),
+                "expected_roi": round(rng.uniform(0.5, 6), 1),
+                "payback_period_weeks": rng.randint(8, 104),
+            },
+            "time_estimate": {"discovery_weeks": rng.randint(1, 6), "production_weeks": rng.randint(4, 52)},
+            "success_metrics": [{"label": "Cycle time", "target": round(rng.uniform(5, 40), 1), "direction": "DECREASE"}],
+            "dependencies": [],
+            "linked_experiments": [],
+            "tags": rng.sample(TAGS, rng.randint(1, 3)),
+            "links": [],
+            "governance_state": rng.choice(("NOT_REQUIRED", "PENDING", "APPROVED")),
+            "notes": None,
+            "owners": [owner],
+            "sponsors": [self._actor("SPONSOR")] if rng.random() < 0.6 else [],
+            "observers": [],
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "archived_at": updated_at if rng.random() < 0.03 else None,
+        }
+
+        children: Dict[type, List[dict]] = {model: [] for _, model in READ_MODEL_SECTIONS.values()}
+        for index in range(stage_index + 1):
+            children[HypothesisStageHistoryEntry].append(
+                {
+                    "from_stage": STAGE_ORDER[index - 1] if index else None,
+                    "to_stage": STAGE_ORDER[index],
+                    "changed_at": created_at + span * index / (stage_index + 1),
+                    "changed_by": owner["name"],
+                    "notes": "Initial submission" if index == 0 else "Stage updated via API",
+                }
+            )
+        for label in rng.sample(CHECKLIST_LABELS, min(len(CHECKLIST_LABELS), self._count(2, 8))):
+            name, email = self._person()
+            children[HypothesisChecklistItem].append(
+                {
+                    "id": generate_uuid(),
+                    "label": label,
+                    "owner_name": name,
+                    "owner_email": email,
+                    "status": rng.choice(("pending", "in-progress", "complete")),
+                    "due_at": self.now + timedelta(days=rng.randint(-20, 40)),
+                    "created_at": created_at,
+                    "updated_at": updated_at,
+                }
+            )
+        for _ in range(self._count(0, 3)):
+            name, email = self._person()
+            decided = rng.random() < 0.5
+            children[HypothesisApproval].append(
+                {
+                    "id": generate_uuid(),
+                    "approver_name": name,
+                    "approver_email": email,
+                    "approver_role": rng.choice(("Risk", "Legal", "Data Owner")),
+                    "status": "approved" if decided else "pending",
+                    "required": rng.random() < 0.7,
+                    "decided_at": updated_at if decided else None,
+                    "notes": None,
+                    "created_at": created_at,
+                    "updated_at": updated_at,
+                }
+            )
+        for index in range(self._count(0, 6)):
+            name, email = self._person()
+            children[HypothesisAttachment].append(
+                {
+                    "id": generate_uuid(),
+                    "file_name": f"evidence-{hyp_id}-{index}.pdf",
+                    "file_type": "application/pdf",
+                    "file_size_bytes": rng.randint(10_000, 5_000_000),
+                    "url": f"https://files.example.com/{hyp_id}/evidence-{index}.pdf",
+                    "version": 1,
+                    "uploaded_by": name,
+                    "uploaded_by_email": email,
+                    "extra_metadata": {},
+                    "uploaded_at": created_at + span * rng.random(),
+                }
+            )
+        children[HypothesisAttachment].sort(key=lambda attachment: attachment["uploaded_at"])
+        for _ in range(self._count(0, 12)):
+            name, email = self._person()
+            comments = children[HypothesisComment]
+            commented_at = created_at + span * rng.random()
+            comments.append(
+                {
+                    "id": generate_uuid(),
+                    "parent_id": rng.choice(comments)["id"] if comments and rng.random() < 0.3 else None,
+                    "author_name": name,
+                    "author_email": email,
+                    "body": "Can we confirm the baseline before the next gate? " * rng.randint(1, 4),
+                    "is_resolved": rng.random() < 0.3,
+                    "created_at": commented_at,
+                    "updated_at": commented_at,
+                }
+            )
+        for _ in range(self._count(0, 4)):
+            name, email = self._person()
+            children[HypothesisTask].append(
+                {
+                    "id": generate_uuid(),
+                    "label": rng.choice(CHECKLIST_LABELS),
+                    "owner_name": name,
+                    "owner_email": email,
+                    "due": self.now + timedelta(days=rng.randint(-10, 30)),
+                    "task_type": rng.choice(("data", "governance", "approval")),
+                    "status": rng.choice(("at-risk", "due-soon", "blocked")),
+                    "severity": rng.choice(("critical", "high", "medium")),
+                    "related_stage": stage,
+                    "notes": None,
+                    "created_at": created_at,
+                    "updated_at": updated_at,
+                }
+            )
+        children[HypothesisTask].sort(key=lambda task: task["due"])
+        total = max(1, round(rng.expovariate(1 / self.events))) if self.events else 1
+        for index in range(total):
+            event_type = rng.choice(tuple(EVENT_TITLES)) if index else "CREATED"
+            occurred_at = created_at + span * index / total
+            children[HypothesisActivityEvent].append(
+                {
+                    "id": generate_uuid(),
+                    "event_type": event_type,
+                    "title": EVENT_TITLES.get(event_type, "Hypothesis created"),
+                    "actor_name": owner["name"],
+                    "actor_email": owner["email"],
+                    "detail": "Synthetic activity",
+                    "stage": stage,
+                    "impact": "neutral",
+                    "extra_metadata": {},
+                    "occurred_at": occurred_at,
+                    "created_at": occurred_at,
+                }
+            )
+
+        return row, children
+
+
+def generate(
+    session_factory: Callable[[], Session],
+    hypotheses: int,
+    *,
+    seed: int = 7,
+    events: int = 40,
+    fanout: float = 1.0,
+    chunk_size: int = 1000,
+    progress: Optional[Callable[[int], None]] = None,
+) -> None:
+    """Append ``hypotheses`` synthetic records with Core bulk inserts.
+
+    Identifiers come from the regular ``HYP-NNN`` allocator. Any materialized dashboard
+    is dropped at the end so the next read rebuilds it over the enlarged portfolio.
+    """
+    with session_factory() as session:
+        repository = HypothesisRepository(session)
+        generator = PortfolioGenerator(seed=seed, events=events, fanout=fanout)
+        done = 0
+        while done < hypotheses:
+            hyp_ids = repository.allocate_hyp_ids(min(chunk_size, hypotheses - done))
+            built = [generator.hypothesis(hyp_id) for hyp_id in hyp_ids]
+            repository.insert_bulk(built)
+            repository.commit()
+            done += len(hyp_ids)
+            if progress:
+                progress(done)
+        session.execute(delete(HypothesisDashboardSnapshot))
+        repository.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--hypotheses", type=int, default=10_000)
+    parser.add_argument("--events", type=int, default=40, help="mean activity events per hypothesis")
+    parser.add_argument("--fanout", type=float, default=1.0, help="scale factor for other child rows")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(engine)
+    started = time.perf_counter()
+    generate(
+        sessionmaker(bind=engine, expire_on_commit=False),
+        args.hypotheses,
+        seed=args.seed,
+        events=args.events,
+        fanout=args.fanout,
+        chunk_size=args.chunk_size,
+        progress=lambda done: print(f"\r{done}/{args.hypotheses} hypotheses", end="", flush=True),
+    )
+    print(f"\ngenerated in {time.perf_counter() - started:.1f}s")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""Endpoint benchmark suite: latency, statement counts and memory per route.
+
+Generates (or tops up) a synthetic portfolio with :mod:`hypothesis.benchmarks.datagen`,
+then drives the real application in-process and reports p50/p95 latency, SQL
+statements per request and peak Python heap per request for every scenario. Point
+``--database-url`` at a local Postgres to benchmark it; the default is a throwaway
+SQLite file.
+
+    python -m hypothesis.benchmarks.endpoints --hypotheses 10000 --output current.json
+    python -m hypothesis.benchmarks.endpoints --hypotheses 10000 --baseline current.json
+
+With ``--baseline`` the run exits non-zero when any scenario's p95 grows by more than
+``--tolerance`` or it issues more statements than before.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, delete, event, func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
+
+from hypothesis.app.config import get_settings
+from hypothesis.app.database import current_engine, reset_engine
+from hypothesis.app.main import create_app
+from hypothesis.app.models import Base, HypothesisDashboardSnapshot, HypothesisRecord
+from hypothesis.benchmarks.datagen import generate
+from hypothesis.benchmarks.timing import percentile
+
+CREATE_BODY = {
+    "title": "Benchmark hypothesis",
+    "statement": "We believe the benchmark will finish.",
+    "labId": "LAB-BENCH",
+    "owners": [{"name": "Bench Owner", "email": "owner@example.com"}],
+    "gatingChecklist": [{"label": f"Checklist item {item}"} for item in range(5)],
+}
+
+
+class Scenario(NamedTuple):
+    name: str
+    method: str
+    path: Callable[[], str]
+    body: Optional[Callable[[], dict]] = None
+    headers: Optional[Callable[[], dict]] = None
+    setup: Optional[Callable[[], None]] = None
+    repeat: Optional[int] = None
+
+
+def _scenarios(client: TestClient, engine, hyp_ids: List[str]) -> List[Scenario]:
+    rng = random.Random(11)
+    pick = lambda: rng.choice(hyp_ids)  # noqa: E731
+    first_page = client.get("/hypotheses/", params={"limit": 50})
+    next_cursor = first_page.headers.get("X-Next-Cursor", "")
+    etags = {hyp_id: client.get(f"/hypotheses/{hyp_id}").headers["ETag"] for hyp_id in hyp_ids[:20]}
+    health = iter(["warning", "on-track"] * 100_000)
+
+    def drop_snapshot() -> None:
+        with engine.begin() as connection:
+            connection.execute(delete(HypothesisDashboardSnapshot))
+
+    return [
+        Scenario("list", "GET", lambda: "/hypotheses/?limit=50"),
+        Scenario("list next page", "GET", lambda: f"/hypotheses/?limit=50&cursor={next_cursor}"),
+        Scenario("list filtered", "GET", lambda: "/hypotheses/?stage=EXPERIMENTATION&labId=LAB-BETA&limit=50"),
+        Scenario("list sorted", "GET", lambda: "/hypotheses/?sort=impactScore&limit=50"),
+        Scenario("detail", "GET", lambda: f"/hypotheses/{pick()}"),
+        Scenario(
+            "detail 304",
+            "GET",
+            lambda: f"/hypotheses/{next(iter(etags))}",
+            headers=lambda: {"If-None-Match": next(iter(etags.values()))},
+        ),
+        Scenario("activity page", "GET", lambda: f"/hypotheses/{pick()}/activity?limit=50"),
+        Scenario("export ndjson", "GET", lambda: "/hypotheses/export", repeat=3),
+        Scenario("export csv", "GET", lambda: "/hypotheses/export?format=csv", repeat=3),
+        Scenario("dashboard cold", "GET", lambda: "/hypotheses/dashboard", setup=drop_snapshot, repeat=3),
+        Scenario("dashboard", "GET", lambda: "/hypotheses/dashboard"),
+        Scenario("create", "POST", lambda: "/hypotheses/", body=lambda: CREATE_BODY),
+        Scenario(
+            "patch",
+            "PATCH",
+            lambda: f"/hypotheses/{pick()}",
+            body=lambda: {"stageHealth": next(health), "updatedBy": "Bench Bot"},
+        ),
+        Scenario(
+            "comment",
+            "POST",
+            lambda: f"/hypotheses/{pick()}/comments",
+            body=lambda: {"author": {"name": "Bench Bot", "email": "bench@example.com"}, "body": "Benchmark"},
+        ),
+        Scenario(
+            "batch create x50", "POST", lambda: "/hypotheses/batch", body=lambda: {"items": [CREATE_BODY] * 50}
+        ),
+    ]
+
+
+def _measure(client: TestClient, scenario: Scenario, repeat: int) -> Dict[str, float]:
+    statements: List[int] = []
+    samples: List[float] = []
+    counter = [0]
+
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+        counter[0] += 1
+
+    def _request() -> int:
+        headers = scenario.headers() if scenario.headers else None
+        body = scenario.body() if scenario.body else None
+        return client.request(scenario.method, scenario.path(), json=body, headers=headers).status_code
+
+    if scenario.setup:
+        scenario.setup()
+    status_code = _request()  # warm caches and lazily built state outside the samples
+
+    engine = current_engine()
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        for _ in range(scenario.repeat or repeat):
+            if scenario.setup:
+                scenario.setup()
+            counter[0] = 0
+            started = time.perf_counter()
+            _request()
+            samples.append(time.perf_counter() - started)
+            statements.append(counter[0])
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    # Separate pass: tracemalloc slows allocation-heavy code and would skew latency.
+    if scenario.setup:
+        scenario.setup()
+    tracemalloc.start()
+    _request()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "status": status_code,
+        "p50_ms": statistics.median(samples) * 1000,
+        "p95_ms": percentile(samples, 0.95) * 1000,
+        "statements": statistics.median(statements),
+        "peak_kib": peak / 1024,
+    }
+
+
+def _compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {previous['p95_ms']:.2f}ms -> {current['p95_ms']:.2f}ms")
+        if current["statements"] > previous["statements"]:
+            regressions.append(f"{name}: statements {previous['statements']:g} -> {current['statements']:g}")
+    return regressions
+
+
+def run(args: argparse.Namespace) -> int:
+    workdir = tempfile.TemporaryDirectory()
+    database_url = args.database_url or f"sqlite:///{Path(workdir.name) / 'bench.db'}"
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    with session_factory() as session:
+        existing = session.scalar(select(func.count()).select_from(HypothesisRecord)) or 0
+    if existing < args.hypotheses:
+        started = time.perf_counter()
+        generate(session_factory, args.hypotheses - existing, events=args.events, fanout=args.fanout)
+        print(f"generated {args.hypotheses - existing} hypotheses in {time.perf_counter() - started:.1f}s")
+    with session_factory() as session:
+        hyp_ids = list(
+            session.scalars(
+                select(HypothesisRecord.hyp_id)
+                .where(HypothesisRecord.archived_at.is_(None))
+                .order_by(func.random())
+                .limit(200)
+            )
+        )
+
+    os.environ["HYPOTHESIS_DATABASE_URL"] = database_url
+    os.environ["HYPOTHESIS_SEED_DEMO_DATA"] = "0"
+    os.environ["HYPOTHESIS_DATABASE_ASYNC"] = "1" if args.use_async else "0"
+    get_settings.cache_clear()
+    reset_engine()
+
+    results: Dict[str, dict] = {}
+    with TestClient(create_app()) as client:
+        for scenario in _scenarios(client, engine, hyp_ids):
+            if args.only and scenario.name not in args.only:
+                continue
+            results[scenario.name] = _measure(client, scenario, args.repeat)
+    engine.dispose()
+    workdir.cleanup()
+
+    backend = make_url(database_url).get_backend_name()
+    print(f"{backend}{' (async)' if args.use_async else ''}, {max(existing, args.hypotheses)} hypotheses")
+    print(f"{'scenario':<20}{'status':>7}{'p50 ms':>10}{'p95 ms':>10}{'stmts':>7}{'peak KiB':>10}")
+    for name, result in results.items():
+        print(
+            f"{name:<20}{result['status']:>7}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}"
+            f"{result['statements']:>7g}{result['peak_kib']:>10.0f}"
+        )
+
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps(
+                {"backend": backend, "hypotheses": max(existing, args.hypotheses), "results": results}, indent=2
+            )
+        )
+    if args.baseline:
+        regressions = _compare(results, json.loads(Path(args.baseline).read_text())["results"], args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="defaults to a temporary SQLite database")
+    parser.add_argument("--hypotheses", type=int, default=10_000)
+    parser.add_argument("--events", type=int, default=40, help="mean activity events per hypothesis")
+    parser.add_argument("--fanout", type=float, default=1.0, help="scale factor for other child rows")
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--async", dest="use_async", action="store_true", help="use the asyncio database mode")
+    parser.add_argument("--only", nargs="*", help="run only the named scenarios")
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--baseline", help="compare against a previous --output file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative p95 growth")
+    sys.exit(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
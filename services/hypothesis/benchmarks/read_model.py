@@ -0,0 +1,143 @@
+"""Measure the write size and read latency of the JSON read model.
+
+Writes: bytes sent in the ``UPDATE hypotheses`` statement of a single-field PATCH,
+compared with the size of the sections the previous scheme rewrote on every write.
+Reads: detail latency served from the read model versus rendered from child tables.
+
+    python -m hypothesis.benchmarks.read_model --hypotheses 50 --events 500
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+
+from sqlalchemy import create_engine, event, insert, select, update
+from sqlalchemy.orm import sessionmaker
+
+from hypothesis.app import schemas
+from hypothesis.app.models import Base, HypothesisActivityEvent, HypothesisRecord, generate_uuid
+from hypothesis.app.repositories import HypothesisRepository
+from hypothesis.app.services import HypothesisService
+from hypothesis.benchmarks.timing import percentiles, time_calls
+
+LEGACY_REWRITTEN_SECTIONS = ("gating_checklist", "attachments", "activity_digest")
+
+
+def _create_payload(index: int) -> schemas.HypothesisCreatePayload:
+    return schemas.HypothesisCreatePayload(
+        title=f"Benchmark hypothesis {index}",
+        statement="We believe the benchmark will finish.",
+        lab_id="LAB-BENCH",
+        owners=[{"name": "Bench Owner", "email": "owner@example.com"}],
+        gating_checklist=[{"label": f"Checklist item {item}"} for item in range(5)],
+    )
+
+
+def _populate(session_factory: sessionmaker, hypotheses: int, events: int) -> List[str]:
+    hyp_ids: List[str] = []
+    with session_factory() as session:
+        service = HypothesisService(HypothesisRepository(session))
+        for index in range(hypotheses):
+            hyp_ids.append(service.create(_create_payload(index), minimal=True).hyp_id)
+
+        start = datetime.now(timezone.utc) - timedelta(days=30)
+        for record_id in session.scalars(select(HypothesisRecord.id)):
+            session.execute(
+                insert(HypothesisActivityEvent),
+                [
+                    {
+                        "id": generate_uuid(),
+                        "hypothesis_id": record_id,
+                        "event_type": "UPDATED",
+                        "title": f"Historic update {number}",
+                        "actor_name": "Bench Bot",
+                        "detail": "x" * 120,
+                        "stage": "IDEATION",
+                        "impact": "neutral",
+                        "extra_metadata": {},
+                        "occurred_at": start + timedelta(minutes=number),
+                    }
+                    for number in range(events)
+                ],
+            )
+        # Force a full re-render so the read model includes the bulk-inserted events.
+        session.execute(update(HypothesisRecord).values(read_model_version=0))
+        session.commit()
+
+    with session_factory() as session:
+        repository = HypothesisRepository(session)
+        for record in repository.list_all():
+            repository.refresh_read_model(record)
+        session.commit()
+    return hyp_ids
+
+
+def run(hypotheses: int, events: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_engine(f"sqlite:///{Path(workdir) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+        hyp_ids = _populate(session_factory, hypotheses, events)
+
+        written: List[int] = []
+
+        def _record_update(conn, cursor, statement, parameters, context, executemany) -> None:
+            if statement.startswith("UPDATE hypotheses "):
+                written.append(sum(len(str(value)) for value in parameters))
+
+        def _patch(hyp_id: str) -> None:
+            with session_factory() as session:
+                HypothesisService(HypothesisRepository(session)).update(
+                    hyp_id, schemas.HypothesisUpdatePayload(stage_health="warning"), minimal=True
+                )
+
+        event.listen(engine, "before_cursor_execute", _record_update)
+        writes = [time_calls(lambda: _patch(hyp_id), 1)[0] for hyp_id in hyp_ids]
+        event.remove(engine, "before_cursor_execute", _record_update)
+
+        with session_factory() as session:
+            repository = HypothesisRepository(session)
+            record = repository.get_by_hyp_id(hyp_ids[0])
+            # The previous scheme re-serialized every activity event, not just the digest.
+            full_digest = [repository._render_activity_digest(record, item) for item in record.activity_events]
+            legacy_bytes = len(json.dumps(full_digest)) + sum(
+                len(json.dumps(getattr(record, section)))
+                for section in LEGACY_REWRITTEN_SECTIONS
+                if section != "activity_digest"
+            )
+
+        print(f"{hypotheses} hypotheses x {events} activity events")
+        print(f"write: UPDATE hypotheses sends {statistics.mean(written):.0f} bytes per PATCH")
+        print(f"       full denormalized rewrite would send >= {legacy_bytes} bytes")
+        print(f"       PATCH latency {percentiles(writes)}")
+
+        def _read() -> None:
+            with session_factory() as session:
+                HypothesisService(HypothesisRepository(session)).get(hyp_ids[0])
+
+        served = time_calls(_read, repeat)
+        with session_factory() as session:
+            session.execute(update(HypothesisRecord).values(read_model_version=0))
+            session.commit()
+        rendered = time_calls(_read, repeat)
+        print(f"read:  read model   {percentiles(served)}")
+        print(f"       child tables {percentiles(rendered)}")
+        engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hypotheses", type=int, default=50)
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    run(args.hypotheses, args.events, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
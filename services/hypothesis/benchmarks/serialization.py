@@ -0,0 +1,127 @@
+"""Compare response serialization for large detail and dashboard payloads.
+
+``response_model``: the previous path, where FastAPI dumps the returned model back to a
+dict, validates it again and then encodes it. ``direct``: the model produced by the
+service is written once with ``model_dump_json``, as the routes now do.
+
+    python -m hypothesis.benchmarks.serialization --comments 300 --attachments 100
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import create_engine, insert, select, update
+from sqlalchemy.orm import sessionmaker
+
+from hypothesis.app import schemas
+from hypothesis.app.models import (
+    Base,
+    HypothesisAttachment,
+    HypothesisComment,
+    HypothesisRecord,
+    generate_uuid,
+)
+from hypothesis.app.repositories import HypothesisRepository
+from hypothesis.app.services import HypothesisService
+from hypothesis.benchmarks.read_model import _create_payload
+from hypothesis.benchmarks.timing import percentiles, time_calls
+
+
+def _populate(session_factory: sessionmaker, hypotheses: int, comments: int, attachments: int) -> str:
+    with session_factory() as session:
+        service = HypothesisService(HypothesisRepository(session))
+        hyp_ids = [service.create(_create_payload(index), minimal=True).hyp_id for index in range(hypotheses)]
+
+        for record_id in session.scalars(select(HypothesisRecord.id)):
+            session.execute(
+                insert(HypothesisComment),
+                [
+                    {
+                        "id": generate_uuid(),
+                        "hypothesis_id": record_id,
+                        "author_name": "Bench Reviewer",
+                        "author_email": f"reviewer{number}@example.com",
+                        "body": "Looks promising, but the data contract needs another pass. " * 3,
+                    }
+                    for number in range(comments)
+                ],
+            )
+            session.execute(
+                insert(HypothesisAttachment),
+                [
+                    {
+                        "id": generate_uuid(),
+                        "hypothesis_id": record_id,
+                        "file_name": f"evidence-{number}.pdf",
+                        "file_type": "application/pdf",
+                        "file_size_bytes": 1024 * number,
+                        "url": f"https://files.example.com/evidence-{number}.pdf",
+                        "uploaded_by": "Bench Bot",
+                        "uploaded_by_email": "bench.bot@example.com",
+                        "extra_metadata": {"source": "benchmark"},
+                    }
+                    for number in range(attachments)
+                ],
+            )
+        session.execute(update(HypothesisRecord).values(read_model_version=0))
+        session.commit()
+
+    with session_factory() as session:
+        repository = HypothesisRepository(session)
+        for record in repository.list_all():
+            repository.refresh_read_model(record)
+        session.commit()
+    return hyp_ids[-1]
+
+
+def _via_response_model(adapter: TypeAdapter, model: BaseModel) -> bytes:
+    # Mirrors FastAPI's handling of a returned model with ``response_model`` set.
+    return adapter.dump_json(adapter.validate_python(model.model_dump(by_alias=True)), by_alias=True)
+
+
+def run(hypotheses: int, comments: int, attachments: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_engine(f"sqlite:///{Path(workdir) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+        hyp_id = _populate(session_factory, hypotheses, comments, attachments)
+
+        with session_factory() as session:
+            repository = HypothesisRepository(session)
+            service = HypothesisService(repository)
+            record = repository.get_by_hyp_id(hyp_id)
+            detail = repository.record_to_detail(record)
+            dashboard = service.build_dashboard()
+
+            cases = [
+                ("detail", schemas.HypothesisDetail, lambda: repository.record_to_detail(record), detail),
+                ("dashboard", schemas.HypothesisDashboard, service.build_dashboard, dashboard),
+            ]
+            print(f"{comments} comments x {attachments} attachments per hypothesis, {hypotheses} hypotheses")
+            for name, model_type, render, rendered in cases:
+                adapter = TypeAdapter(model_type)
+                size = len(rendered.model_dump_json(by_alias=True))
+                assert _via_response_model(adapter, rendered).decode() == rendered.model_dump_json(by_alias=True)
+                legacy = time_calls(lambda: _via_response_model(adapter, render()), repeat)
+                direct = time_calls(lambda: render().model_dump_json(by_alias=True), repeat)
+                print(f"{name} ({size} bytes)")
+                print(f"  response_model {percentiles(legacy)}")
+                print(f"  direct         {percentiles(direct)}")
+        engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hypotheses", type=int, default=20)
+    parser.add_argument("--comments", type=int, default=300)
+    parser.add_argument("--attachments", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+    run(args.hypotheses, args.comments, args.attachments, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
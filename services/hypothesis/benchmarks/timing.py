@@ -0,0 +1,25 @@
+"""Timing helpers shared by the benchmark scripts."""
+from __future__ import annotations
+
+import statistics
+import time
+from typing import Callable, List
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile; stable for the small sample counts benchmarks use."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+def percentiles(samples: List[float]) -> str:
+    return f"p50={statistics.median(samples) * 1000:.2f}ms p95={percentile(samples, 0.95) * 1000:.2f}ms"
+
+
+def time_calls(call: Callable[[], object], repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - started)
+    return samples
@@ -0,0 +1,72 @@
+from typing import Dict, Optional
+
+from hypothesis.app.cache import LRUDetailCache, RedisDetailCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StandInRedis:
+    """The subset of the redis client the cache uses, backed by a dict."""
+
+    def __init__(self) -> None:
+        self.values: Dict[str, bytes] = {}
+        self.down = False
+
+    def get(self, key: str) -> Optional[bytes]:
+        if self.down:
+            raise ConnectionError("server unavailable")
+        return self.values.get(key)
+
+    def set(self, key: str, value: bytes, ex: int) -> None:
+        self.values[key] = value
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+
+def test_lru_cache_matches_versions_and_evicts_by_entries_bytes_and_ttl() -> None:
+    clock = FakeClock()
+    cache = LRUDetailCache(max_entries=2, max_bytes=10, ttl_seconds=60, clock=clock)
+    cache.set("HYP-001", 1, b"aaaa")
+    cache.set("HYP-002", 1, b"bbbb")
+    assert cache.get("HYP-001", 1) == b"aaaa"
+    assert cache.get("HYP-001", 2) is None  # a newer version was committed elsewhere
+
+    cache.set("HYP-003", 1, b"cccc")  # HYP-002 is least recently used
+    assert cache.get("HYP-002", 1) is None
+    cache.set("HYP-004", 1, b"dddddddd")  # over the byte budget: only HYP-004 fits
+    assert cache.get("HYP-001", 1) is None and cache.get("HYP-003", 1) is None
+
+    clock.now = 61
+    assert cache.get("HYP-004", 1) is None
+    cache.set("HYP-005", 3, b"eeee")
+    cache.invalidate(["HYP-005", "HYP-404"])
+    assert cache.get("HYP-005", 3) is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.evictions, stats.expirations, stats.invalidations) == (1, 3, 1, 2)
+    assert stats.misses == 6
+    assert (stats.entries, stats.size_bytes) == (0, 0)
+
+
+def test_redis_cache_uses_versioned_values_and_degrades_to_misses() -> None:
+    client = StandInRedis()
+    cache = RedisDetailCache(client, ttl_seconds=30)
+    cache.set("HYP-001", 7, b'{"hypId":"HYP-001"}')
+    assert client.values["hypothesis:detail:HYP-001"] == b'7:{"hypId":"HYP-001"}'
+    assert cache.get("HYP-001", 7) == b'{"hypId":"HYP-001"}'
+    assert cache.get("HYP-001", 8) is None
+
+    cache.invalidate(["HYP-001"])
+    assert client.values == {}
+    client.down = True
+    assert cache.get("HYP-001", 7) is None
+    stats = cache.stats()
+    assert (stats.backend, stats.hits, stats.misses, stats.errors) == ("redis", 1, 2, 1)
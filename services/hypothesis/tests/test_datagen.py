@@ -0,0 +1,27 @@
+from pathlib import Path
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from hypothesis.app.models import Base, HypothesisRecord
+from hypothesis.app.repositories import HypothesisRepository
+from hypothesis.benchmarks.datagen import generate
+
+
+def test_generated_read_model_matches_child_tables(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'bench.db'}")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    generate(session_factory, 30, chunk_size=12, events=30)
+
+    with session_factory() as session:
+        repository = HypothesisRepository(session)
+        records = list(session.scalars(select(HypothesisRecord).order_by(HypothesisRecord.id)))
+        assert [record.hyp_id for record in records] == [f"HYP-{number:03d}" for number in range(1, 31)]
+        for record in records:
+            served = repository.record_to_detail(record)
+            record.read_model_version = 0
+            assert repository.record_to_detail(record) == served
+        session.rollback()
+        assert repository.allocate_hyp_ids(1) == ["HYP-031"]
+    engine.dispose()
@@ -0,0 +1,46 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from hypothesis.app.feed import ChangeFeedBroker, ChangeFeedLagged
+from hypothesis.app.schemas import HypothesisChange
+
+
+def _change(event_id: str, hyp_id: str) -> HypothesisChange:
+    return HypothesisChange(
+        id=event_id,
+        hyp_id=hyp_id,
+        type="UPDATED",
+        title="Hypothesis updated",
+        actor="Feed Bot",
+        occurred_at=datetime.now(timezone.utc),
+        stage="IDEATION",
+    )
+
+
+def test_broker_wakes_matching_topics_only_and_reports_lagging_subscribers() -> None:
+    async def scenario() -> None:
+        broker = ChangeFeedBroker(buffer_size=2)
+        broker.start()
+        single = broker.subscribe("HYP-001", after=broker.position(), keepalive=0.05)
+        portfolio = broker.subscribe(None, after=broker.position(), keepalive=0.05)
+
+        await asyncio.to_thread(broker.publish, [_change("a", "HYP-002")])
+        assert [change.id for change in await portfolio.__anext__()] == ["a"]
+        assert await single.__anext__() == []  # keepalive: HYP-002 does not wake HYP-001 subscribers
+        assert broker.subscribers == 2
+
+        for event_id in "bcd":
+            broker.publish([_change(event_id, "HYP-001")])
+        await asyncio.sleep(0.01)
+        assert broker.locate("b") is None and broker.locate("d") == broker.position()
+        with pytest.raises(ChangeFeedLagged):
+            await portfolio.__anext__()
+        assert broker.subscribers == 1
+
+        broker.stop()
+        with pytest.raises(StopAsyncIteration):
+            await single.__anext__()
+
+    asyncio.run(scenario())
@@ -0,0 +1,137 @@
+from datetime import datetime, timezone
+from typing import Sequence
+
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import Session
+
+from hypothesis.app.models import Base, HypothesisOutboxEvent
+from hypothesis.app.outbox import InMemoryPublisher, OutboxRelay
+from hypothesis.app.repositories import HypothesisRepository
+from hypothesis.app.schemas import HypothesisDomainEvent
+
+
+class FlakyPublisher(InMemoryPublisher):
+    def __init__(self, failures: int) -> None:
+        super().__init__()
+        self.failures = failures
+
+    def publish(self, events: Sequence[HypothesisDomainEvent]) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("broker unavailable")
+        super().publish(events)
+
+    def probe(self) -> bool:
+        return not self.failures
+
+
+class PoisonedPublisher(InMemoryPublisher):
+    def __init__(self, hyp_id: str) -> None:
+        super().__init__()
+        self.hyp_id = hyp_id
+
+    def publish(self, events: Sequence[HypothesisDomainEvent]) -> None:
+        if any(event.hyp_id == self.hyp_id for event in events):
+            raise ValueError("broker rejected the event")
+        super().publish(events)
+
+
+def test_relay_keeps_failed_batches_and_redelivers_them_in_order() -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    now = datetime.now(timezone.utc)
+    with Session(engine) as session:
+        repository = HypothesisRepository(session)
+        for hyp_id, event_type in [("HYP-001", "HypothesisCreated"), ("HYP-002", "HypothesisCreated")]:
+            repository.add_outbox_event(hyp_id, event_type, now, {"stage": "IDEATION"})
+        repository.insert_outbox_events(
+            [{"event_type": "HypothesisUpdated", "hyp_id": "HYP-001", "occurred_at": now, "payload": {"fields": []}}]
+        )
+        session.commit()
+
+    publisher = FlakyPublisher(failures=1)
+    relay = OutboxRelay(publisher, batch_size=2)
+    with Session(engine) as session:
+        assert relay.relay_once(session) == 0
+        assert list(session.scalars(select(HypothesisOutboxEvent.attempts))) == [0, 0, 0]  # an outage, not a bad event
+        assert relay.relay_once(session) == 1  # the failed head goes alone
+        assert relay.relay_once(session) == 2
+        assert relay.relay_once(session) == 0
+        assert session.scalar(select(HypothesisOutboxEvent.id)) is None
+
+    assert [(event.id, event.hyp_id, event.type) for event in publisher.delivered] == [
+        (1, "HYP-001", "HypothesisCreated"),
+        (2, "HYP-002", "HypothesisCreated"),
+        (3, "HYP-001", "HypothesisUpdated"),
+    ]
+    stats = relay.stats()
+    assert (stats.pending, stats.published_total, stats.batches_total, stats.failures_total) == (0, 3, 2, 1)
+    assert stats.oldest_pending_seconds == 0 and stats.last_publish_lag_seconds >= 0
+    engine.dispose()
+
+
+def test_relay_rides_out_an_outage_longer_than_the_attempt_limit_in_order() -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    now = datetime.now(timezone.utc)
+    with Session(engine) as session:
+        repository = HypothesisRepository(session)
+        for event_type in ["HypothesisCreated", "HypothesisStageChanged"]:
+            repository.add_outbox_event("HYP-001", event_type, now, {"stage": "IDEATION"})
+        session.commit()
+
+    publisher = FlakyPublisher(failures=6)
+    relay = OutboxRelay(publisher, batch_size=10, max_attempts=3, max_backoff_seconds=4)
+    with Session(engine) as session:
+        delays = []
+        for _ in range(6):
+            assert relay.relay_once(session) == 0
+            delays.append(relay.retry_delay(1.0))
+        assert session.scalar(select(HypothesisOutboxEvent.id).where(HypothesisOutboxEvent.status == "dead")) is None
+        assert relay.relay_once(session) == 1
+        assert relay.retry_delay(1.0) == 1.0
+        assert relay.relay_once(session) == 1
+
+    assert delays == [2.0, 4.0, 4.0, 4.0, 4.0, 4.0]
+    assert [event.type for event in publisher.delivered] == ["HypothesisCreated", "HypothesisStageChanged"]
+    stats = relay.stats()
+    assert (stats.pending, stats.dead, stats.published_total, stats.failures_total) == (0, 0, 2, 6)
+    engine.dispose()
+
+
+def test_relay_dead_letters_an_event_the_broker_rejects_and_holds_its_hypothesis() -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    now = datetime.now(timezone.utc)
+    with Session(engine) as session:
+        repository = HypothesisRepository(session)
+        for hyp_id in ["HYP-001", "HYP-002", "HYP-003", "HYP-002", "HYP-004"]:
+            repository.add_outbox_event(hyp_id, "HypothesisUpdated", now, {"stage": "IDEATION"})
+        session.commit()
+
+    publisher = PoisonedPublisher("HYP-002")
+    relay = OutboxRelay(publisher, batch_size=10, max_attempts=3)
+    with Session(engine) as session:
+        for _ in range(8):
+            relay.relay_once(session)
+        held = session.execute(
+            select(HypothesisOutboxEvent.id, HypothesisOutboxEvent.status).order_by(HypothesisOutboxEvent.id)
+        ).all()
+
+        assert [(event.id, event.hyp_id) for event in publisher.delivered] == [
+            (1, "HYP-001"),
+            (3, "HYP-003"),
+            (5, "HYP-004"),
+        ]
+        assert held == [(2, "dead"), (4, "pending")]
+        stats = relay.stats()
+        assert (stats.pending, stats.dead, stats.published_total) == (1, 1, 3)
+
+        # Once an operator requeues the dead event, its hypothesis resumes in order.
+        publisher.hyp_id = None
+        session.execute(update(HypothesisOutboxEvent).values(status="pending"))
+        session.commit()
+        assert relay.relay_once(session) == 2
+
+    assert [event.id for event in publisher.delivered][3:] == [2, 4]
+    engine.dispose()
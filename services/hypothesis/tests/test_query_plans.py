@@ -0,0 +1,180 @@
+import os
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from hypothesis.app import schemas
+from hypothesis.app.models import Base
+from hypothesis.app.repositories import HypothesisRepository
+from hypothesis.app.services import STAGE_ORDER, HypothesisService, resolve_export_columns
+from hypothesis.benchmarks.datagen import generate
+
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory: pytest.TempPathFactory) -> Engine:
+    created = create_engine(f"sqlite:///{tmp_path_factory.mktemp('plans') / 'plans.db'}")
+    Base.metadata.create_all(created)
+    generate(sessionmaker(bind=created, expire_on_commit=False), 120, events=10)
+    # Without statistics SQLite ties between partial indexes that serve the same order.
+    with created.begin() as connection:
+        connection.execute(text("ANALYZE"))
+    yield created
+    created.dispose()
+
+
+def capture_selects(engine: Engine, run: Callable[[HypothesisRepository], object]) -> List[Tuple[str, Any]]:
+    """Run a repository call and return every SELECT it issued with its parameters."""
+    captured: List[Tuple[str, Any]] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        with sessionmaker(bind=engine)() as session:
+            run(HypothesisRepository(session))
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    return captured
+
+
+def explain(engine: Engine, run: Callable[[HypothesisRepository], object]) -> List[Tuple[str, str]]:
+    """Return ``(statement, SQLite query plan)`` for every SELECT issued by ``run``."""
+    with engine.connect() as connection:
+        return [
+            (
+                statement,
+                " | ".join(row[3] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)),
+            )
+            for statement, parameters in capture_selects(engine, run)
+        ]
+
+
+def page(**filters) -> Callable[[HypothesisRepository], object]:
+    sort = filters.pop("sort", "createdAt")
+    return lambda repository: repository.list_page(
+        schemas.HypothesisListFilters(**filters), sort=sort, descending=True, after=None, limit=51
+    )
+
+
+@pytest.mark.parametrize(
+    ("run", "index"),
+    [
+        (page(), "ix_hypotheses_active_created"),
+        (page(sort="updatedAt"), "ix_hypotheses_active_updated"),
+        (page(stage="EXPERIMENTATION"), "ix_hypotheses_active_stage_created"),
+        (page(lab_id="LAB-BETA"), "ix_hypotheses_active_lab_created"),
+        (page(ready_for_next_gate=True), "ix_hypotheses_active_ready_created"),
+    ],
+)
+def test_list_pages_read_partial_indexes_in_order(engine: Engine, run, index: str) -> None:
+    [(_, plan)] = explain(engine, run)
+    assert f"USING INDEX {index}" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_detail_collections_use_composite_indexes(engine: Engine) -> None:
+    plans = explain(engine, lambda repository: repository.get_by_hyp_id("HYP-007", profile="detail"))
+    expected = {
+        "hypothesis_stage_history": "ix_hypothesis_stage_history_hypothesis_changed",
+        "hypothesis_checklist_items": "ix_hypothesis_checklist_items_hypothesis_created",
+        "hypothesis_tasks": "ix_hypothesis_tasks_hypothesis_due",
+        "hypothesis_attachments": "ix_hypothesis_attachments_hypothesis_uploaded",
+        "hypothesis_approvals": "ix_hypothesis_approvals_hypothesis_created",
+        "hypothesis_activity_events": "ix_hypothesis_activity_events_hypothesis_occurred",
+    }
+    for table, index in expected.items():
+        [plan] = [plan for statement, plan in plans if f"FROM {table} " in statement]
+        assert f"USING INDEX {index}" in plan or f"USING COVERING INDEX {index}" in plan, plan
+    replies = [plan for statement, plan in plans if "hypothesis_comments.parent_id IN" in statement]
+    assert replies and all("ix_hypothesis_comments_parent_id" in plan for plan in replies)
+
+
+def test_dashboard_feeds_walk_due_and_occurred_indexes(engine: Engine) -> None:
+    now = datetime.now(timezone.utc)
+    [(_, tasks)] = explain(engine, lambda repository: repository.dashboard_task_rows(now, 20))
+    assert "USING INDEX ix_hypothesis_tasks_due (due>?)" in tasks
+    assert "USING INDEX ix_hypothesis_checklist_items_open_due (due_at>?)" in tasks
+    assert "SCAN hypothesis_tasks" not in tasks and "SCAN hypothesis_checklist_items" not in tasks
+    [(_, activity)] = explain(engine, lambda repository: repository.dashboard_activity_rows(25))
+    assert "USING INDEX ix_hypothesis_activity_events_occurred" in activity
+
+    with sessionmaker(bind=engine)() as session:
+        repository = HypothesisRepository(session)
+        feed = [repository.row_to_task(row) for row in repository.dashboard_task_rows(now, 20)]
+        events = [repository.row_to_activity(row) for row in repository.dashboard_activity_rows(25)]
+    assert len(feed) == 20 and [task.due for task in feed] == sorted(task.due for task in feed)
+    assert all(task.status == "at-risk" for task in feed if task.due < now and task.id.startswith("HYP-"))
+    assert len(events) == 25
+    assert [event.occurred_at for event in events] == sorted((event.occurred_at for event in events), reverse=True)
+
+
+def test_dashboard_stage_cards_search_the_stage_index_per_stage(engine: Engine) -> None:
+    [(_, cards)] = explain(engine, lambda repository: repository.dashboard_summary_rows(STAGE_ORDER, 5))
+    searches = [step for step in cards.split(" | ") if step.startswith("SEARCH hypotheses")]
+    assert searches == ["SEARCH hypotheses USING INDEX ix_hypotheses_active_stage_created (stage=?)"] * len(STAGE_ORDER)
+    assert "SCAN hypotheses" not in cards
+    [(_, counts)] = explain(engine, lambda repository: repository.dashboard_stage_counts())
+    assert "ix_hypotheses_active_stage_created" in counts and "TEMP B-TREE" not in counts
+
+
+def test_export_reads_in_key_order_with_memory_bounded_by_batch(engine: Engine) -> None:
+    [(_, plan)] = explain(engine, lambda repository: next(repository.stream_active(schemas.HypothesisListFilters(), batch_size=10)))
+    assert "TEMP B-TREE" not in plan
+
+    def peak_bytes(batch_size: int) -> int:
+        with sessionmaker(bind=engine)() as session:
+            service = HypothesisService(HypothesisRepository(session))
+            columns = resolve_export_columns("ndjson", None)
+            tracemalloc.start()
+            try:
+                for _ in service.export(
+                    schemas.HypothesisListFilters(), export_format="ndjson", columns=columns, batch_size=batch_size
+                ):
+                    pass
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+    peak_bytes(5)  # warm pydantic and SQLAlchemy caches outside the measurement
+    assert peak_bytes(5) * 4 < peak_bytes(120)
+
+
+@pytest.mark.skipif(
+    not os.environ.get("HYPOTHESIS_TEST_POSTGRES_URL"), reason="set HYPOTHESIS_TEST_POSTGRES_URL to run"
+)
+def test_postgres_filters_use_gin_and_partial_indexes() -> None:
+    postgres = create_engine(os.environ["HYPOTHESIS_TEST_POSTGRES_URL"])
+    Base.metadata.drop_all(postgres)
+    Base.metadata.create_all(postgres)
+    try:
+        generate(sessionmaker(bind=postgres, expire_on_commit=False), 300, events=5)
+        with postgres.connect() as connection:
+            connection.execute(text("ANALYZE"))
+        search = lambda repository: repository.search(  # noqa: E731
+            ["predict"], schemas.HypothesisListFilters(), limit=20
+        )
+        cases = [
+            (page(), "ix_hypotheses_active_created"),
+            (page(tag="GenAI"), "ix_hypotheses_tags_gin"),
+            (page(owner="owner@example.com"), "ix_hypotheses_owners_gin"),
+            (search, "ix_hypotheses_search_document"),
+        ]
+        for run, index in cases:
+            statement, parameters = capture_selects(postgres, run)[-1]
+            with postgres.connect() as connection:
+                # A few hundred rows fit in a page or two; without sequential scans the
+                # plan shows the index the planner picks on a real portfolio.
+                connection.exec_driver_sql("SET enable_seqscan = off")
+                plan = "\n".join(row[0] for row in connection.exec_driver_sql(f"EXPLAIN {statement}", parameters))
+            assert index in plan, plan
+    finally:
+        Base.metadata.drop_all(postgres)
+        postgres.dispose()